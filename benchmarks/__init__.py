@@ -0,0 +1,2 @@
+# Plik __init__.py w katalogu benchmarks
+# Oznacza katalog benchmarks jako pakiet Python
\ No newline at end of file
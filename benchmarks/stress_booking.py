@@ -0,0 +1,136 @@
+"""
+Test obciążeniowy równoległych rezerwacji.
+Wiele wątków jednocześnie rezerwuje losowe grupy miejsc na jednym "gorącym" seansie przez ReservationFacade.
+Po zakończeniu sprawdzane jest, czy żadne miejsce nie zostało zarezerwowane dwukrotnie, oraz wyświetlana jest przepustowość.
+
+Uruchomienie z katalogu głównego projektu:
+    python -m benchmarks.stress_booking --threads 16 --attempts 500
+"""
+import argparse  # Import modułu argparse do obsługi parametrów wiersza poleceń.
+import os  # Import modułu os do budowania ścieżek plików tymczasowych.
+import random  # Import modułu random do losowania rezerwowanych miejsc.
+import shutil  # Import modułu shutil do usunięcia katalogu tymczasowego po teście.
+import sys  # Import modułu sys do zwracania kodu wyjścia.
+import tempfile  # Import modułu tempfile - dziennik rezerwacji testu trafia do katalogu tymczasowego.
+import threading  # Import modułu threading do uruchamiania równoległych wątków rezerwujących.
+import time  # Import modułu time do pomiaru czasu trwania testu.
+from datetime import datetime, timedelta  # Import klas datetime i timedelta do ustalenia terminów seansów.
+from utils.database import Database  # Import bazy danych (Singleton).
+from models.movie import Movie  # Import klasy filmu.
+from models.cinema_hall import CinemaHall  # Import klasy sali kinowej.
+from builders.screening_builder import ScreeningBuilder  # Import budowniczego seansów.
+from facades.reservation_facade import ReservationFacade  # Import fasady rezerwacji - testowana ścieżka rezerwacji.
+from factories.ticket_factory import RegularTicketFactory  # Import fabryki biletów normalnych.
+
+def prepare_screenings(db, count, rows, seats_per_row):
+    """
+    Tworzy film, salę oraz podaną liczbę seansów używanych w teście.
+    """
+    movie = Movie("Test obciążeniowy", 120, 0)
+    hall = CinemaHall("Sala testowa", rows, seats_per_row)
+    db.add_movie(movie)
+    db.add_cinema_hall(hall)
+    builder = ScreeningBuilder()
+    start = datetime.now().replace(second=0, microsecond=0) + timedelta(days=365)  # Termin daleko w przyszłości, aby nie kolidował z danymi aplikacji.
+    screenings = []
+    for i in range(count):
+        screening = builder.set_movie(movie).set_cinema_hall(hall).set_date_time(start + timedelta(hours=3 * i)).set_base_price(20).build()
+        db.add_screening(screening)
+        screenings.append(screening)
+    return screenings
+
+def worker(facade, screenings, attempts, max_group, seed, results, index):
+    """
+    Funkcja wątku: podejmuje zadaną liczbę prób rezerwacji losowych grup sąsiednich miejsc.
+    """
+    rng = random.Random(seed)
+    factory = RegularTicketFactory()
+    successes = 0
+    conflicts = 0
+    for _ in range(attempts):
+        screening = rng.choice(screenings)
+        hall = screening.cinema_hall
+        group = rng.randint(1, max_group)
+        row = rng.randint(1, hall.rows)
+        first = rng.randint(1, max(1, hall.seats_per_row - group + 1))
+        seats = [screening.get_seat(row, number) for number in range(first, min(first + group, hall.seats_per_row + 1))]
+        tickets = facade.create_tickets(screening, seats, factory)
+        try:
+            facade.make_reservation(f"Klient {index}", screening, seats, tickets)
+            successes += 1
+        except ValueError:
+            conflicts += 1  # Miejsca zajęte przez inny wątek - oczekiwany wynik przy dużej konkurencji.
+    results[index] = (successes, conflicts)
+
+def verify(db, screenings):
+    """
+    Sprawdza, czy żadne miejsce nie występuje w dwóch rezerwacjach i czy liczniki seansów zgadzają się z rezerwacjami.
+    Zwraca liczbę wykrytych podwójnych rezerwacji.
+    """
+    seen = set()
+    double_bookings = 0
+    reserved_per_screening = {id(s): 0 for s in screenings}
+    for reservation in db.get_reservations():
+        if id(reservation.screening) not in reserved_per_screening:
+            continue
+        for seat in reservation.seats:
+            key = (id(reservation.screening), seat.row, seat.number)
+            if key in seen:
+                double_bookings += 1
+            seen.add(key)
+            reserved_per_screening[id(reservation.screening)] += 1
+    for screening in screenings:
+        if screening.reserved_count() != reserved_per_screening[id(screening)]:
+            print(f"Niezgodność liczników dla {screening}: {screening.reserved_count()} != {reserved_per_screening[id(screening)]}")
+            double_bookings += 1
+    return double_bookings
+
+def main():
+    """
+    Punkt wejścia testu obciążeniowego.
+    """
+    parser = argparse.ArgumentParser(description="Test obciążeniowy równoległych rezerwacji WSBCinema.")
+    parser.add_argument("--threads", type=int, default=8, help="liczba wątków rezerwujących")
+    parser.add_argument("--attempts", type=int, default=500, help="liczba prób rezerwacji na wątek")
+    parser.add_argument("--screenings", type=int, default=1, help="liczba seansów (1 = jeden gorący seans)")
+    parser.add_argument("--rows", type=int, default=20, help="liczba rzędów sali")
+    parser.add_argument("--seats-per-row", type=int, default=30, help="liczba miejsc w rzędzie")
+    parser.add_argument("--max-group", type=int, default=4, help="maksymalna liczba miejsc w jednej rezerwacji")
+    parser.add_argument("--seed", type=int, default=2024, help="ziarno generatora liczb losowych")
+    args = parser.parse_args()
+
+    db = Database()
+    temp_dir = tempfile.mkdtemp(prefix="wsbcinema_bench_")
+    db.load_reservations(os.path.join(temp_dir, "reservations.json"))  # Dziennik testu nie nadpisuje danych aplikacji.
+    screenings = prepare_screenings(db, args.screenings, args.rows, args.seats_per_row)
+    facade = ReservationFacade()
+    db.persistence.start()  # Zapis dziennika w tle, tak jak w aplikacji.
+
+    results = [None] * args.threads
+    threads = [
+        threading.Thread(target=worker, args=(facade, screenings, args.attempts, args.max_group, args.seed + i, results, i))
+        for i in range(args.threads)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    db.persistence.stop()  # Zapisanie rekordów oczekujących w kolejce przed usunięciem katalogu testu.
+    persistence = db.persistence.metrics()
+
+    successes = sum(r[0] for r in results)
+    conflicts = sum(r[1] for r in results)
+    attempts = successes + conflicts
+    double_bookings = verify(db, screenings)
+    print(f"Wątki: {args.threads}, seanse: {args.screenings}, sala: {args.rows}x{args.seats_per_row}")
+    print(f"Próby: {attempts}, udane rezerwacje: {successes}, konflikty: {conflicts}")
+    print(f"Czas: {elapsed:.3f} s, przepustowość: {attempts / elapsed:.0f} prób/s, {successes / elapsed:.0f} rezerwacji/s")
+    print(f"Zapis dziennika: {persistence['written']} rekordów w {persistence['batches']} grupach (średnio {persistence['avg_batch_size']:.1f})")
+    print(f"Zajęte miejsca: {sum(s.reserved_count() for s in screenings)}, podwójne rezerwacje: {double_bookings}")
+    shutil.rmtree(temp_dir, ignore_errors=True)  # Usunięcie dziennika i migawki testu.
+    return 1 if double_bookings else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
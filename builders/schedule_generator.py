@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta  # Zaimportowanie klas datetime i timedelta do wyznaczania terminów kolejnych seansów.
+from builders.screening_builder import ScreeningBuilder  # Zaimportowanie budowniczego seansów, którym tworzony jest każdy seans.
+from utils.database import Database  # Zaimportowanie bazy danych (Singleton), do której trafiają wygenerowane seanse.
+
+SKIP = "skip"  # Polityka kolizji: seans kolidujący z innym seansem w sali jest pomijany i zgłaszany w raporcie.
+RAISE = "raise"  # Polityka kolizji: pierwsza kolizja przerywa generowanie wyjątkiem ValueError.
+
+class RecurrenceRule:
+    """
+    Reguła powtarzania seansów.
+    Opisuje zakres dat, dni tygodnia oraz godziny rozpoczęcia, np. "codziennie od 1 do 30 czerwca o 10:00 i 18:00" lub "w weekendy o 12:00".
+    """
+
+    def __init__(self, start_date, end_date, times, weekdays=None, interval_days=1):
+        """
+        Inicjalizacja reguły.
+        Przyjmuje pierwszą i ostatnią datę (włącznie), listę godzin rozpoczęcia (obiekty time), opcjonalny zbiór dni tygodnia (0 - poniedziałek)
+        oraz odstęp w dniach pomiędzy kolejnymi dniami seansów.
+        """
+        if end_date < start_date:
+            raise ValueError("Data końcowa reguły nie może być wcześniejsza niż data początkowa.")
+        if interval_days < 1:
+            raise ValueError("Odstęp pomiędzy dniami seansów musi wynosić co najmniej 1 dzień.")
+        self.start_date = start_date  # Pierwszy dzień, w którym mogą odbywać się seanse.
+        self.end_date = end_date  # Ostatni dzień (włącznie), w którym mogą odbywać się seanse.
+        self.times = sorted(times)  # Godziny rozpoczęcia seansów w kolejności chronologicznej.
+        self.weekdays = frozenset(weekdays) if weekdays is not None else None  # Dozwolone dni tygodnia (None - wszystkie).
+        self.interval_days = interval_days  # Odstęp w dniach pomiędzy kolejnymi dniami seansów.
+
+    def occurrences(self):
+        """
+        Generator zwracający kolejne daty i godziny rozpoczęcia seansów zgodnie z regułą (chronologicznie).
+        """
+        day = self.start_date
+        step = timedelta(days=self.interval_days)
+        while day <= self.end_date:
+            if self.weekdays is None or day.weekday() in self.weekdays:
+                for start_time in self.times:
+                    yield datetime.combine(day, start_time)
+            day += step
+
+class ScheduleGenerator:
+    """
+    Generator repertuaru - tworzenie wielu seansów naraz na podstawie reguł powtarzania.
+    Każda reguła przypisuje film do sali; seanse są budowane przez ScreeningBuilder i dodawane do bazy danych,
+    której indeks zajętości sal wykrywa kolizje (z uwzględnieniem przerwy technicznej) w czasie O(log n) na seans.
+    """
+
+    def __init__(self, database=None):
+        """
+        Inicjalizacja generatora.
+        Przyjmuje bazę danych, do której trafią seanse (domyślnie instancja Singletonu Database).
+        """
+        self.database = database if database is not None else Database()  # Baza danych przyjmująca wygenerowane seanse.
+        self.builder = ScreeningBuilder()  # Budowniczy używany do tworzenia kolejnych seansów.
+        self.entries = []  # Lista wpisów (film, sala, reguła, cena bazowa) do wygenerowania.
+
+    def add(self, movie, cinema_hall, rule, base_price):
+        """
+        Dodaje wpis do planu: film wyświetlany w sali według reguły powtarzania, z podaną ceną bazową.
+        Zwraca self, aby umożliwić łańcuchowe wywoływanie metod.
+        """
+        self.entries.append((movie, cinema_hall, rule, base_price))
+        return self
+
+    def generate(self, on_conflict=SKIP):
+        """
+        Tworzy seanse dla wszystkich wpisów planu i dodaje je do bazy danych.
+        Zwraca krotkę (lista utworzonych seansów, lista kolizji jako pary (pominięty seans, lista kolidujących seansów)).
+        Przy polityce RAISE pierwsza kolizja przerywa generowanie wyjątkiem ValueError (seanse dodane wcześniej pozostają w bazie).
+        """
+        if on_conflict not in (SKIP, RAISE):
+            raise ValueError(f"Nieznana polityka kolizji: {on_conflict}")
+        created = []
+        conflicts = []
+        for movie, cinema_hall, rule, base_price in self.entries:
+            for date_time in rule.occurrences():
+                screening = (self.builder.set_movie(movie)
+                             .set_cinema_hall(cinema_hall)
+                             .set_date_time(date_time)
+                             .set_base_price(base_price)
+                             .build())
+                colliding = self.database.find_screening_conflicts(screening)
+                if colliding:
+                    if on_conflict == RAISE:
+                        raise ValueError(f"Seans {screening} koliduje z seansem {colliding[0]} w sali {cinema_hall.name}.")
+                    conflicts.append((screening, colliding))
+                    continue
+                self.database.add_screening(screening)
+                created.append(screening)
+        self.entries = []  # Plan został zrealizowany - generator jest gotowy na kolejny plan.
+        return created, conflicts
@@ -1,13 +1,17 @@
 from abc import ABC, abstractmethod  # Zaimportowanie klasy bazowej ABC i abstractmethod do tworzenia abstrakcyjnych klas i metod.
-from models.ticket import Ticket # Zaimportowanie klasy bazowej Ticket, która jest komponentem dla dekoratorów.
+from models.ticket import Ticket, FrozenTicket # Zaimportowanie klasy bazowej Ticket, która jest komponentem dla dekoratorów, oraz niezmiennego biletu spłaszczonego.
 
 class TicketDecorator(Ticket):
     """
     Abstrakcyjny dekorator biletu - wzorzec Decorator.
     Klasa TicketDecorator dziedziczy po Ticket i stanowi bazę dla wszystkich konkretnych dekoratorów biletów.
     Przekazuje wywołania metod do opakowanego obiektu biletu.
+    Atrybut klasy surcharge określa dopłatę dekoratora, dzięki czemu można ją odczytać bez tworzenia biletu (np. w tabeli cen).
     """
     
+    surcharge = 0  # Dopłata doliczana przez dekorator do ceny opakowanego biletu (w zł).
+    label_suffix = ""  # Tekst dopisywany przez dekorator na końcu opisu opakowanego biletu.
+    
     def __init__(self, ticket: Ticket):
         """
         Inicjalizacja obiektu dekoratora.
@@ -39,6 +43,21 @@ class TicketDecorator(Ticket):
         """
         return self._ticket.seat
     
+    def flatten(self):
+        """
+        Metoda spłaszczająca cały stos dekoratorów do jednego niezmiennego biletu FrozenTicket.
+        Cena i opis są obliczane jeden raz; kolejne odczyty z rekordu FrozenTicket nie przechodzą już przez dekoratory.
+        """
+        addons = []
+        ticket = self
+        while isinstance(ticket, TicketDecorator):  # Iteracyjne zejście do biletu bazowego (bez rekurencji).
+            addons.append(type(ticket))
+            ticket = ticket._ticket
+        addons.reverse()  # Kolejność zastosowania: od dekoratora najbliższego biletu bazowego.
+        base_addons = ticket.addons if isinstance(ticket, FrozenTicket) else ()
+        ticket_type = ticket.ticket_type if isinstance(ticket, FrozenTicket) else type(ticket).__name__
+        return FrozenTicket(self.screening, self.seat, self.price, str(self), ticket_type, base_addons + tuple(addons))
+    
     @abstractmethod
     def __str__(self):
         """
@@ -53,6 +72,9 @@ class ThreeDTicketDecorator(TicketDecorator):
     Ta klasa dziedziczy po TicketDecorator i dodaje informację o opcji 3D oraz zwiększa cenę biletu.
     """
     
+    surcharge = 5  # Dopłata za opcję 3D (w zł).
+    label_suffix = " [3D]"  # Oznaczenie opcji 3D w opisie biletu.
+    
     def __init__(self, ticket: Ticket):
         """
         Inicjalizacja dekoratora 3D.
@@ -66,7 +88,7 @@ class ThreeDTicketDecorator(TicketDecorator):
         Metoda zwracająca cenę biletu 3D.
         Nadpisuję metodę price(), aby dodać dodatkowy koszt za opcję 3D do ceny opakowanego biletu.
         """
-        return self._ticket.price + 5  # Zwraca cenę opakowanego biletu powiększoną o 5 zł (koszt 3D).
+        return self._ticket.price + self.surcharge  # Zwraca cenę opakowanego biletu powiększoną o 5 zł (koszt 3D).
     
     def __str__(self):
         """
@@ -74,7 +96,7 @@ class ThreeDTicketDecorator(TicketDecorator):
         Nadpisuję metodę __str__(), aby dodać informację "[3D]" do opisu opakowanego biletu.
         """
         # Zwraca tekstową reprezentację opakowanego biletu i dodaję na końcu "[3D]".
-        return f"{self._ticket.__str__()} [3D]"
+        return f"{self._ticket.__str__()}{self.label_suffix}"
 
 class SnackComboTicketDecorator(TicketDecorator):
     """
@@ -82,6 +104,9 @@ class SnackComboTicketDecorator(TicketDecorator):
     Ta klasa dziedziczy po TicketDecorator i dodaje informację o zestawie przekąsek oraz zwiększa cenę biletu.
     """
     
+    surcharge = 15  # Dopłata za zestaw przekąsek (w zł).
+    label_suffix = " [+ Zestaw Przekąsek]"  # Oznaczenie zestawu przekąsek w opisie biletu.
+    
     def __init__(self, ticket: Ticket):
         """
         Inicjalizacja dekoratora zestawu przekąsek.
@@ -95,7 +120,7 @@ class SnackComboTicketDecorator(TicketDecorator):
         Metoda zwracająca cenę biletu z zestawem przekąsek.
         Nadpisuję metodę price(), aby dodać dodatkowy koszt za zestaw przekąsek do ceny opakowanego biletu.
         """
-        return self._ticket.price + 15  # Zwraca cenę opakowanego biletu powiększoną o 15 zł (koszt zestawu przekąsek).
+        return self._ticket.price + self.surcharge  # Zwraca cenę opakowanego biletu powiększoną o 15 zł (koszt zestawu przekąsek).
     
     def __str__(self):
         """
@@ -103,4 +128,61 @@ class SnackComboTicketDecorator(TicketDecorator):
         Nadpisuję metodę __str__(), aby dodać informację "[+ Zestaw Przekąsek]" do opisu opakowanego biletu.
         """
         # Zwraca tekstową reprezentację opakowanego biletu i dodaję na końcu "[+ Zestaw Przekąsek]".
-        return f"{self._ticket.__str__()} [+ Zestaw Przekąsek]"
\ No newline at end of file
+        return f"{self._ticket.__str__()}{self.label_suffix}"
+
+class AddonCatalog:
+    """
+    Katalog dodatków do biletów (np. 3D, zestaw przekąsek).
+    Przechowuje klasy dekoratorów pod nazwami wyświetlanymi klientowi i pozwala zastosować ten sam zestaw dodatków do całej grupy biletów naraz:
+    dopłata i opis dodatków są obliczane raz dla całej grupy, a wynikiem są niezmienne bilety FrozenTicket.
+    """
+    
+    def __init__(self, addons=None):
+        """
+        Inicjalizacja katalogu.
+        Konstruktor przyjmuje opcjonalny słownik: nazwa dodatku -> klasa dekoratora; domyślnie katalog zawiera 3D i zestaw przekąsek.
+        """
+        if addons is None:
+            addons = {"3D": ThreeDTicketDecorator, "Zestaw przekąsek": SnackComboTicketDecorator}
+        self._addons = dict(addons)  # Słownik: nazwa dodatku -> klasa dekoratora.
+    
+    def register(self, name, decorator_class):
+        """
+        Dodaje do katalogu dodatek o podanej nazwie.
+        """
+        self._addons[name] = decorator_class
+    
+    def names(self):
+        """
+        Zwraca listę nazw dostępnych dodatków.
+        """
+        return list(self._addons)
+    
+    def get(self, name):
+        """
+        Zwraca klasę dekoratora dodatku o podanej nazwie. Zgłasza ValueError dla nieznanej nazwy.
+        """
+        try:
+            return self._addons[name]
+        except KeyError:
+            raise ValueError(f"Nieznany dodatek: {name}") from None
+    
+    def surcharge(self, names):
+        """
+        Zwraca łączną dopłatę za podane dodatki (dla jednego biletu).
+        """
+        return sum(self.get(name).surcharge for name in names)
+    
+    def apply(self, tickets, names):
+        """
+        Stosuje dodatki o podanych nazwach (w podanej kolejności) do wszystkich biletów z listy.
+        Zwraca listę biletów FrozenTicket; bilety wejściowe (także już udekorowane lub spłaszczone) nie są zmieniane.
+        """
+        addon_classes = tuple(self.get(name) for name in names)  # Klasy dodatków wyznaczane raz dla całej grupy.
+        surcharge = sum(addon.surcharge for addon in addon_classes)  # Dopłata obliczana raz dla całej grupy.
+        suffix = "".join(addon.label_suffix for addon in addon_classes)  # Opis dodatków tworzony raz dla całej grupy.
+        result = []
+        for ticket in tickets:
+            base = ticket.flatten()  # Spłaszczenie biletu wejściowego (dla FrozenTicket - bez kosztu).
+            result.append(FrozenTicket(base.screening, base.seat, base.price + surcharge, base.label + suffix, base.ticket_type, base.addons + addon_classes))
+        return result
\ No newline at end of file
@@ -1,7 +1,10 @@
 from utils.database import Database  # Importowanie klasy Database, która jest Singletonem przechowującym dane (fasada będzie z niej korzystać).
 from models.reservation import Reservation  # Importowanie klasy Reservation, ponieważ fasada będzie tworzyć obiekty tego typu.
 from models.seat import Seat  # Importowanie klasy Seat, ponieważ fasada będzie operować na miejscach.
-from factories.ticket_factory import TicketFactory, RegularTicketFactory, DiscountedTicketFactory, VIPTicketFactory # Importowanie konkretnych fabryk biletów.
+from models.seat_hold import SeatHold, DEFAULT_HOLD_TTL_SECONDS  # Importowanie klasy czasowej blokady miejsc i domyślnego czasu jej ważności.
+from factories.ticket_factory import TicketFactory # Importowanie abstrakcyjnej fabryki biletów (adnotacje typów).
+from factories.ticket_option_registry import TicketOptionRegistry  # Importowanie rejestru opcji biletów dla sal (konfiguracja zamiast nazw sal w kodzie).
+from utils.pricing_engine import BatchPricingEngine  # Importowanie silnika wsadowej wyceny biletów (ceny bez tworzenia obiektów biletów).
 
 class ReservationFacade:
     """
@@ -15,6 +18,8 @@ class ReservationFacade:
         Konstruktor pobiera instancję bazy danych (Singleton), aby fasada miała dostęp do danych.
         """
         self.database = Database()  # Pobieranie jedynej instancji bazy danych (Singleton).
+        self.pricing_engine = BatchPricingEngine()  # Silnik wyceny używany przy każdej zmianie wyboru miejsc lub typu biletu.
+        self.ticket_options = TicketOptionRegistry.default()  # Współdzielony rejestr opcji biletów wczytany z konfiguracji.
     
     def get_available_screenings(self, date):
         """
@@ -23,6 +28,25 @@ class ReservationFacade:
         """
         # Wywoływanie metody get_screenings_for_date() na obiekcie bazy danych i zwracanie jej wyniku.
         return self.database.get_screenings_for_date(date)
+
+    def get_screenings_between(self, start, end, movie_title=None, hall_name=None):
+        """
+        Zwraca seanse z podanego zakresu dat, opcjonalnie zawężone do filmu i/lub sali.
+        Metoda fasady, która deleguje zapytanie zakresowe do indeksu repertuaru w bazie danych.
+        """
+        return self.database.get_screenings_between(start, end, movie_title, hall_name)
+
+    def get_screenings_for_movie(self, movie_title):
+        """
+        Zwraca wszystkie seanse podanego filmu.
+        """
+        return self.database.get_screenings_for_movie(movie_title)
+
+    def get_screenings_for_hall(self, hall_name):
+        """
+        Zwraca wszystkie seanse w podanej sali.
+        """
+        return self.database.get_screenings_for_hall(hall_name)
     
     def get_available_seats(self, screening):
         """
@@ -31,43 +55,135 @@ class ReservationFacade:
         """
         # Wywoływanie metody get_available_seats() na obiekcie screening i zwracanie jej wyniku.
         return screening.get_available_seats()
+
+    def get_available_seat_count(self, screening):
+        """
+        Zwraca liczbę wolnych miejsc dla podanego seansu.
+        Metoda fasady, która odczytuje licznik wolnych miejsc utrzymywany przez seans (bez przeglądania miejsc).
+        """
+        return screening.available_count()
+
+    def find_best_seats(self, screening, count):
+        """
+        Zwraca najlepszy dostępny blok count sąsiadujących miejsc w jednym rzędzie (lub pustą listę, jeśli go nie ma).
+        Metoda fasady używana przy sprzedaży grupowej - miejsca nie są przy tym rezerwowane.
+        """
+        return screening.find_best_available(count)
     
+    def quote_price(self, screening, seats, ticket_factory: TicketFactory):
+        """
+        Oblicza łączną cenę wybranych miejsc dla danego typu biletu bez tworzenia obiektów biletów.
+        Metoda fasady przeznaczona do częstego odświeżania ceny (np. po każdym kliknięciu miejsca lub zmianie typu biletu).
+        """
+        return self.pricing_engine.quote(screening, len(seats), ticket_factory)
+
+    def quote_ticket_options(self, screening, seats, ticket_options):
+        """
+        Oblicza łączną cenę wybranych miejsc dla wszystkich typów biletów naraz (nazwa typu biletu -> cena).
+        """
+        return self.pricing_engine.quote_options(screening, len(seats), ticket_options)
+
+    def get_revenue(self, screenings):
+        """
+        Oblicza przychód z podanych seansów (np. wszystkich seansów dnia) jako sumę cen zapisanych rezerwacji.
+        """
+        return self.pricing_engine.revenue(screenings, self.database.get_reservations())
+
+    def get_projected_value(self, screenings, ticket_factory: TicketFactory):
+        """
+        Oblicza szacunkową wartość zajętych miejsc podanych seansów według bieżącej ceny danego typu biletu (nie jest to przychód).
+        """
+        return self.pricing_engine.projected_value(screenings, ticket_factory)
+
+    def create_tickets(self, screening, seats, ticket_factory: TicketFactory):
+        """
+        Tworzy bilety dla wybranych miejsc przy użyciu fabryki biletów i zwraca je jako kolumnową grupę TicketBatch.
+        Bilety są potrzebne dopiero przy zatwierdzaniu rezerwacji, więc metoda powinna być wywoływana tuż przed make_reservation().
+        """
+        return ticket_factory.create_tickets(screening, seats)
+
     def calculate_price(self, screening, seats, ticket_factory: TicketFactory):
         """
-        Oblicza łączną cenę rezerwacji na podstawie wybranych miejsc i typu biletu (fabryki).
-        Metoda fasady, która oblicza cenę rezerwacji, używając fabryki biletów do stworzenia tymczasowych obiektów biletów.
+        Oblicza łączną cenę rezerwacji na podstawie wybranych miejsc i typu biletu (fabryki) oraz tworzy bilety.
+        Do samego wyświetlania ceny należy używać quote_price(), która nie tworzy obiektów biletów.
         Przyjmowanie obiektu seansu, listy wybranych miejsc oraz obiektu fabryki biletów (np. RegularTicketFactory).
         """
-        total_price = 0  # Inicjalizowanie zmiennej do przechowywania łącznej ceny na 0.
-        tickets = []  # Inicjalizowanie pustej listy do przechowywania obiektów biletów.
-        
-        for seat in seats:  # Iterowanie przez każde miejsce na liście wybranych miejsc.
-            # Używanie podanej fabryki biletów do stworzenia obiektu biletu dla danego seansu i miejsca.
-            ticket = ticket_factory.create_ticket(screening, seat)
-            tickets.append(ticket)  
-            total_price += ticket.price  # Dodawanie ceny utworzonego biletu do łącznej ceny.
-        # Zwracanie łącznej ceny rezerwacji oraz listy utworzonych obiektów biletów.
-        return total_price, tickets
+        tickets = self.create_tickets(screening, seats, ticket_factory)
+        # Zwracanie łącznej ceny rezerwacji oraz grupy biletów (łączna cena to suma kolumny cen).
+        return tickets.total_price, tickets
+
     def make_reservation(self, customer_name, screening, seats, tickets):
         """
         Tworzy nową rezerwację dla klienta.
-        Metoda fasady, która tworzy obiekt rezerwacji, aktualizuje stan miejsc i dodaje rezerwację do bazy danych.
+        Metoda fasady, która atomowo rezerwuje miejsca, tworzy obiekt rezerwacji i dodaje go do bazy danych.
+        Zgłasza ValueError, jeśli którekolwiek z miejsc nie jest już wolne (wtedy stan żadnego miejsca się nie zmienia).
         Przyjmowanie imienia i nazwiska klienta, obiektu seansu, listy zarezerwowanych miejsc oraz listy utworzonych biletów.
         """
+        # Atomowa rezerwacja wszystkich miejsc - jeśli którekolwiek miejsce zostało w międzyczasie zajęte, żadne nie jest rezerwowane.
+        if not screening.reserve_seats(seats):
+            raise ValueError("Wybrane miejsca nie są już dostępne.")
+
         # Tworzenie nowego obiektu Reservation z podanymi danymi.
         reservation = Reservation(customer_name, screening, seats, tickets)
-         
-        # Sprawdzanie, czy aktualny stan miejsca to FreeSeatState przed zmianą na ReservedState.
-        from states.seat_state import ReservedSeatState, FreeSeatState # Importowanie tutaj, aby uniknąć zależności cyklicznych na poziomie modułów
-        for seat in seats:
-            if isinstance(seat.state, FreeSeatState): # Sprawdzanie, czy aktualny stan to FreeSeatState.
-                 seat.state = ReservedSeatState() 
         
         # Dodawanie utworzonej rezerwacji do bazy danych (co automatycznie zapisuje rezerwacje do pliku JSON).
         self.database.add_reservation(reservation)
         # Zwracanie utworzonego obiektu rezerwacji.
         return reservation
 
+    def hold_seats(self, screening, seats, ttl_seconds=DEFAULT_HOLD_TTL_SECONDS):
+        """
+        Czasowo wstrzymuje wybrane miejsca (np. na czas płatności) i zwraca obiekt blokady SeatHold.
+        Blokada jest zapisywana w bazie danych i automatycznie zwalniana po upływie ttl_seconds, jeśli nie zostanie potwierdzona.
+        Zgłasza ValueError, jeśli którekolwiek z miejsc nie jest wolne.
+        """
+        if not screening.hold_seats(seats): # Atomowe wstrzymanie wszystkich miejsc.
+            raise ValueError("Wybrane miejsca nie są już dostępne.")
+        hold = SeatHold(screening, seats, ttl_seconds)
+        self.database.add_hold(hold)
+        return hold
+
+    def confirm_hold(self, hold, customer_name, tickets):
+        """
+        Zamienia aktywną blokadę miejsc na rezerwację klienta.
+        Zgłasza ValueError, jeśli blokada wygasła (także gdy harmonogram wygasania jeszcze jej nie zwolnił), została zwolniona
+        lub jej miejsca nie mogą już zostać zarezerwowane - rezerwacja nie jest wtedy zapisywana, a miejsca, które nadal są wstrzymane, wracają do stanu "wolne".
+        Blokada jest kończona dopiero po potwierdzeniu miejsc, więc nieudana próba nie pozostawia miejsc wstrzymanych na stałe.
+        """
+        if not hold.active:
+            raise ValueError("Blokada miejsc wygasła. Proszę ponownie wybrać miejsca.")
+        if hold.is_expired():
+            self.database.release_hold(hold) # Harmonogram nie zdążył zwolnić blokady - zwalniam jej miejsca teraz.
+            raise ValueError("Blokada miejsc wygasła. Proszę ponownie wybrać miejsca.")
+        if not hold.screening.confirm_held_seats(hold.seats): # Wstrzymane miejsca przechodzą do stanu "zarezerwowane" (tylko przez potwierdzenie blokady).
+            self.database.release_hold(hold) # Zwalniam miejsca blokady, które nadal są wstrzymane.
+            raise ValueError("Wybrane miejsca nie są już dostępne.")
+        # Miejsca należą już do klienta - kończę blokadę (jeśli harmonogram zdążył ją zakończyć, nie zwolnił miejsc, bo nie są już wstrzymane).
+        self.database.complete_hold(hold)
+        reservation = Reservation(customer_name, hold.screening, hold.seats, tickets)
+        self.database.add_reservation(reservation)
+        return reservation
+
+    def release_hold(self, hold):
+        """
+        Zwalnia blokadę miejsc przed upływem jej ważności (np. klient zrezygnował).
+        """
+        return self.database.release_hold(hold)
+
+    def release_expired_holds(self):
+        """
+        Zwalnia wszystkie blokady, których czas ważności minął, i zwraca ich listę.
+        Metoda przydatna, gdy harmonogram wygasania nie działa w wątku tła.
+        """
+        return self.database.hold_scheduler.release_expired()
+
+    def cancel_reservation(self, reservation):
+        """
+        Anuluje istniejącą rezerwację i zwalnia zajęte przez nią miejsca.
+        Metoda fasady, która deleguje anulowanie do bazy danych (anulowanie jest dopisywane do dziennika rezerwacji).
+        """
+        return self.database.cancel_reservation(reservation)
+
     def get_all_reservations(self):
         """
         Zwraca listę wszystkich rezerwacji.
@@ -78,19 +194,7 @@ class ReservationFacade:
     def get_available_ticket_options(self, screening):
         """
         Zwraca słownik dostępnych opcji biletów (nazwa typu biletu jako klucz, fabryka jako wartość)
-        dla danego seansu, w zależności od sali kinowej.
+        dla danego seansu, w zależności od typu i wyposażenia sali kinowej (według pliku config/ticket_options.json).
+        Opcje są zapamiętywane dla każdej sali, a fabryki biletów są współdzielone.
         """
-        hall_name = screening.cinema_hall.name
-        options = {}
-
-        if hall_name == "Sala 1" or hall_name == "Sala 2":
-            options["Normalny"] = RegularTicketFactory()
-            options["Ulgowy"] = DiscountedTicketFactory()
-        elif hall_name == "Sala VIP":
-            options["VIP"] = VIPTicketFactory()
-        # Można dodać domyślną obsługę lub zgłaszanie błędu, jeśli nazwa sali nie pasuje
-        
-        return options
-
-
-
+        return self.ticket_options.options_for(screening.cinema_hall)
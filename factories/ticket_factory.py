@@ -1,12 +1,44 @@
 from abc import ABC, abstractmethod  # Import bazowych klas ABC (Abstract Base Class) i abstractmethod do tworzenia abstrakcyjnych klas i metod.
-from models.ticket import RegularTicket, DiscountedTicket, VIPTicket  # Import konkretnych klas biletów: RegularTicket, DiscountedTicket, VIPTicket.
+from models.ticket import Ticket, RegularTicket, DiscountedTicket, VIPTicket  # Import klasy bazowej i konkretnych klas biletów: RegularTicket, DiscountedTicket, VIPTicket.
+from models.ticket_batch import TicketBatch, UNKNOWN_TYPE_CODE  # Import kolumnowej reprezentacji grupy biletów.
+from strategies.pricing_rules import PricingRuleEngine  # Import silnika reguł cenowych, który dostarcza skompilowane tabele cen seansów.
 
 class TicketFactory(ABC):
     """
     Abstrakcyjna fabryka biletów - wzorzec Factory Method.
     Definiowanie interfejsu do tworzenia obiektów biletów, pozostawiając implementację konkretnym podklasom fabryk.
+    Każda fabryka udostępnia też mnożnik ceny bazowej, dzięki czemu cenę można obliczyć bez tworzenia obiektu biletu.
+    Fabryki są bezstanowe, więc każda klasa fabryki ma jedną współdzieloną instancję.
     """
     
+    _instances = {}  # Słownik przechowujący jedyną instancję każdej klasy fabryki (fabryki są bezstanowe).
+    price_multiplier = 1.0  # Mnożnik ceny bazowej seansu dla biletów tworzonych przez fabrykę.
+    ticket_class = Ticket  # Klasa biletów tworzonych przez fabrykę (używana przy materializacji grupy biletów).
+    type_code = UNKNOWN_TYPE_CODE  # Kod typu biletu zapisywany w grupie biletów.
+    
+    def __new__(cls):
+        """
+        Metoda zwracająca jedyną instancję danej klasy fabryki (tworzoną przy pierwszym wywołaniu).
+        """
+        instance = TicketFactory._instances.get(cls)
+        if instance is None:
+            instance = TicketFactory._instances[cls] = super().__new__(cls)
+        return instance
+    
+    def unit_price(self, screening):
+        """
+        Zwraca cenę jednego biletu tego typu na podany seans, bez tworzenia obiektu biletu.
+        Cena jest odczytywana z tabeli cen seansu, uwzględniającej reguły cenowe (np. weekend, poranek) i mnożnik typu biletu.
+        """
+        return PricingRuleEngine().ticket_price(screening, self)
+    
+    def create_tickets(self, screening, seats):
+        """
+        Tworzy bilety tego typu dla wielu miejsc naraz.
+        Zwraca kolumnową grupę biletów TicketBatch (indeksy miejsc, ceny, kod typu); obiekty biletów powstają dopiero na żądanie.
+        """
+        return TicketBatch.for_seats(screening, seats, self.unit_price(screening), self.type_code, self.ticket_class)
+    
     @abstractmethod
     def create_ticket(self, screening, seat):
         """
@@ -22,12 +54,16 @@ class RegularTicketFactory(TicketFactory):
     Implementowanie TicketFactory i tworzenie obiektów RegularTicket.
     """
     
+    price_multiplier = 1.0  # Bilet normalny kosztuje tyle, ile wynosi cena bazowa seansu.
+    ticket_class = RegularTicket  # Fabryka tworzy bilety normalne.
+    type_code = 1  # Kod typu biletu normalnego.
+    
     def create_ticket(self, screening, seat):
         """
         Tworzenie biletu normalnego z pełną ceną.
         Implementacja metody create_ticket() dla biletów normalnych.
         """
-        price = screening.base_price  # Ustalanie ceny biletu normalnego jako podstawowej ceny seansu.
+        price = self.unit_price(screening)  # Ustalanie ceny biletu normalnego jako podstawowej ceny seansu (po zastosowaniu reguł cenowych).
         return RegularTicket(screening, seat, price)  # Tworzenie i zwracanie nowego obiektu RegularTicket.
 
 class DiscountedTicketFactory(TicketFactory):
@@ -36,12 +72,16 @@ class DiscountedTicketFactory(TicketFactory):
     Implementowanie TicketFactory i tworzenie obiektów DiscountedTicket.
     """
     
+    price_multiplier = 0.7  # Bilet ulgowy kosztuje 70% ceny bazowej (30% zniżki).
+    ticket_class = DiscountedTicket  # Fabryka tworzy bilety ulgowe.
+    type_code = 2  # Kod typu biletu ulgowego.
+    
     def create_ticket(self, screening, seat):
         """
         Tworzenie biletu ulgowego ze zniżką 30%.
         Implementacja metody create_ticket() dla biletów ulgowych.
         """
-        price = screening.base_price * 0.7  # Ustalanie ceny biletu ulgowego jako 70% ceny bazowej (30% zniżki).
+        price = self.unit_price(screening)  # Ustalanie ceny biletu ulgowego jako 70% ceny bazowej po zastosowaniu reguł cenowych (30% zniżki).
         return DiscountedTicket(screening, seat, price)  # Tworzenie i zwracanie nowego obiektu DiscountedTicket.
 
 class VIPTicketFactory(TicketFactory):
@@ -50,10 +90,14 @@ class VIPTicketFactory(TicketFactory):
     Implementowanie TicketFactory i tworzenie obiektów VIPTicket.
     """
     
+    price_multiplier = 1.5  # Bilet VIP kosztuje 150% ceny bazowej (dopłata 50%).
+    ticket_class = VIPTicket  # Fabryka tworzy bilety VIP.
+    type_code = 3  # Kod typu biletu VIP.
+    
     def create_ticket(self, screening, seat):
         """
         Tworzenie biletu VIP z dopłatą 50%.
         Implementacja metody create_ticket() dla biletów VIP.
         """
-        price = screening.base_price * 1.5  # Ustalanie ceny biletu VIP jako 150% ceny bazowej (dopłata 50%).
+        price = self.unit_price(screening)  # Ustalanie ceny biletu VIP jako 150% ceny bazowej po zastosowaniu reguł cenowych (dopłata 50%).
         return VIPTicket(screening, seat, price)  # Tworzenie i zwracanie nowego obiektu VIPTicket.
\ No newline at end of file
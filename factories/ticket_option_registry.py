@@ -0,0 +1,105 @@
+import json  # Import modułu json do wczytania konfiguracji opcji biletów.
+import os  # Import modułu os do budowania ścieżki domyślnego pliku konfiguracji.
+import threading  # Import modułu threading - blokada chroniąca pamięć podręczną opcji.
+import weakref  # Import modułu weakref - pamięć podręczna nie przedłuża życia obiektów sal.
+from types import MappingProxyType  # Import widoku słownika tylko do odczytu - opcje z pamięci podręcznej nie mogą być modyfikowane.
+from factories.ticket_factory import RegularTicketFactory, DiscountedTicketFactory, VIPTicketFactory  # Import fabryk biletów dostępnych w konfiguracji.
+
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "ticket_options.json")  # Domyślny plik konfiguracji opcji biletów.
+
+FACTORY_KEYS = {
+    "regular": RegularTicketFactory,
+    "discounted": DiscountedTicketFactory,
+    "vip": VIPTicketFactory,
+}  # Słownik: klucz fabryki używany w konfiguracji -> klasa fabryki biletów.
+
+DEFAULT_CONFIG = {
+    "factories": {"Normalny": "regular", "Ulgowy": "discounted", "VIP": "vip"},
+    "hall_types": {"standard": ["Normalny", "Ulgowy"], "vip": ["VIP"]},
+    "features": {},
+}  # Konfiguracja wbudowana, używana, gdy plik konfiguracji nie istnieje.
+
+class TicketOptionRegistry:
+    """
+    Rejestr opcji biletów dla sal kinowych.
+    Na podstawie konfiguracji przypisuje typom sal i cechom ich wyposażenia dozwolone typy biletów (nazwa typu -> fabryka biletów).
+    Opcje wyznaczone dla sali są zapamiętywane, więc zmiana seansu to odczyt ze słownika, a dodanie nowej sali nie wymaga zmian w kodzie.
+    """
+
+    _default = None  # Współdzielony rejestr wczytany z domyślnego pliku konfiguracji.
+
+    def __init__(self, config):
+        """
+        Inicjalizacja rejestru na podstawie słownika konfiguracji (klucze: factories, hall_types, features).
+        Zgłasza ValueError, jeśli konfiguracja odwołuje się do nieznanej fabryki lub nieznanego typu biletu.
+        """
+        self._factories = {}  # Słownik: nazwa typu biletu -> współdzielona instancja fabryki.
+        for ticket_name, factory_key in config.get("factories", {}).items():
+            if factory_key not in FACTORY_KEYS:
+                raise ValueError(f"Nieznana fabryka biletów '{factory_key}' dla typu biletu '{ticket_name}'.")
+            self._factories[ticket_name] = FACTORY_KEYS[factory_key]()
+        self._hall_types = self._resolve_names(config.get("hall_types", {}))  # Słownik: typ sali -> nazwy typów biletów.
+        self._features = self._resolve_names(config.get("features", {}))  # Słownik: cecha sali -> dodatkowe nazwy typów biletów.
+        self._cache = weakref.WeakKeyDictionary()  # Pamięć podręczna: sala -> opcje biletów.
+        self._lock = threading.Lock()
+
+    def _resolve_names(self, mapping):
+        """
+        Prywatna metoda sprawdzająca, czy wszystkie nazwy typów biletów w sekcji konfiguracji mają przypisaną fabrykę.
+        """
+        for key, ticket_names in mapping.items():
+            for ticket_name in ticket_names:
+                if ticket_name not in self._factories:
+                    raise ValueError(f"Nieznany typ biletu '{ticket_name}' w konfiguracji '{key}'.")
+        return {key: tuple(ticket_names) for key, ticket_names in mapping.items()}
+
+    @classmethod
+    def from_file(cls, filepath=DEFAULT_CONFIG_PATH):
+        """
+        Tworzy rejestr na podstawie pliku konfiguracji JSON.
+        Jeśli plik nie istnieje, używana jest konfiguracja wbudowana (z ostrzeżeniem).
+        """
+        if not os.path.exists(filepath):
+            print(f"Ostrzeżenie: Plik konfiguracji opcji biletów {filepath} nie istnieje, użyto konfiguracji domyślnej.")
+            return cls(DEFAULT_CONFIG)
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def default(cls):
+        """
+        Zwraca współdzielony rejestr wczytany (jednorazowo) z domyślnego pliku konfiguracji.
+        """
+        if cls._default is None:
+            cls._default = cls.from_file()
+        return cls._default
+
+    def options_for(self, cinema_hall):
+        """
+        Zwraca opcje biletów dla sali (nazwa typu biletu -> fabryka) jako słownik tylko do odczytu.
+        Opcje wynikają z typu sali oraz cech jej wyposażenia i są wyznaczane tylko przy pierwszym zapytaniu o daną salę.
+        """
+        options = self._cache.get(cinema_hall)
+        if options is not None:
+            return options
+        ticket_names = list(self._hall_types.get(cinema_hall.hall_type, ()))
+        if cinema_hall.hall_type not in self._hall_types:
+            print(f"Ostrzeżenie: Brak opcji biletów dla typu sali '{cinema_hall.hall_type}' ({cinema_hall.name}).")
+        for feature in sorted(cinema_hall.features):
+            for ticket_name in self._features.get(feature, ()):
+                if ticket_name not in ticket_names:
+                    ticket_names.append(ticket_name)
+        options = MappingProxyType({name: self._factories[name] for name in ticket_names})
+        with self._lock:
+            self._cache[cinema_hall] = options
+        return options
+
+    def invalidate(self, cinema_hall=None):
+        """
+        Usuwa z pamięci podręcznej opcje podanej sali lub (bez argumentu) wszystkich sal, np. po zmianie typu sali.
+        """
+        with self._lock:
+            if cinema_hall is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(cinema_hall, None)
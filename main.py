@@ -1,11 +1,18 @@
 import sys  # Zaimportowanie modułu sys do obsługi argumentów wiersza poleceń i zakończenia aplikacji
+import argparse  # Zaimportowanie modułu argparse do odczytu opcji wiersza poleceń (np. wybór magazynu danych)
 from PyQt5.QtWidgets import QApplication  # Zaimportowanie klasę QApplication do utworzenia głównej aplikacji
 from views.main_window import MainWindow  # Zaimportowanie klasę MainWindow z modułu views (główne okno GUI)
 from utils.database import Database  # Zaimportowanie klasę Database do zarządzania danymi (wzorzec Singleton)
+from utils.sqlite_storage import SQLiteStorage, DEFAULT_DATABASE_FILE  # Zaimportowanie magazynu danych SQLite (włączanego opcją --sqlite)
+from observers.event_bus import SeatEventBus  # Zaimportowanie szyny zdarzeń zmian stanu miejsc
+from observers.async_dispatcher import AsyncEventDispatcher, DROP_OLDEST  # Zaimportowanie dyspozytora dostarczającego zdarzenia w tle
 from models.movie import Movie  # Zaimportowanie klasę Movie do reprezentacji filmów
 from models.cinema_hall import CinemaHall  # Zaimportowanie klasę CinemaHall do reprezentacji sal kinowych
-from builders.screening_builder import ScreeningBuilder  # Zaimportowanie klasę ScreeningBuilder do tworzenia seansów (wzorzec Builder)
-from datetime import datetime, timedelta  # Zaimportowanie klasy datetime i timedelta do obsługi dat i czasu
+from models.hall_layout import HallLayout  # Zaimportowanie szablonu układu sali (przerwy, przejścia, miejsca dla wózków)
+from builders.schedule_generator import ScheduleGenerator, RecurrenceRule  # Zaimportowanie generatora repertuaru i reguł powtarzania seansów (seanse budowane wzorcem Builder)
+from strategies.pricing_rules import PricingRuleEngine  # Zaimportowanie silnika reguł cenowych (tabele cen seansów)
+from strategies.pricing_strategy import WeekendPricingStrategy, MorningPricingStrategy, OccupancyPricingStrategy  # Zaimportowanie strategii cenowych używanych jako reguły
+from datetime import datetime, time, timedelta  # Zaimportowanie klas datetime, time i timedelta do obsługi dat i czasu
 
 def load_sample_data():
     """Funkcja ładująca przykładowe dane do systemu"""
@@ -27,63 +34,68 @@ def load_sample_data():
     # Przykładowe sale kinowe
     halls = [
         CinemaHall("Sala 1", 8, 10),  # Utworzenie sali 1 (8 rzędów, 10 miejsc w rzędzie)
-        CinemaHall("Sala 2", 10, 12),
-        CinemaHall("Sala VIP", 6, 8),
+        CinemaHall("Sala 2", 10, 12, layout=HallLayout(10, 12, gaps=[(10, 1), (10, 12)], aisles_after=(3, 9), wheelchair=[(10, 2), (10, 11)])),  # Sala 2 - dwa przejścia i miejsca dla wózków w ostatnim rzędzie
+        CinemaHall("Sala VIP", 6, 8, hall_type="vip"),  # Sala VIP - typ sali określa dostępne bilety (config/ticket_options.json)
     ]
     
     for hall in halls:
         db.add_cinema_hall(hall)  # Dodanie każdej sali z listy do bazy danych
     
-    builder = ScreeningBuilder()
-    
     today = datetime.now().date()
     
-    # Generowanie seansu na najbliższe 7 dni, aby system miał początkowe dane
-    for day_offset in range(7):
-        current_date = today + timedelta(days=day_offset)  # Obliczenie daty dla każdego dnia w zakresie
-        
-        # Seans poranny - przykład seansu z zastosowaniem wzorca Builder
-        morning_time = datetime.combine(current_date, datetime.min.time().replace(hour=10, minute=0)) # Ustawia godzinę 10:00
-        db.add_screening(
-            builder.set_movie(movies[0])  # Ustawia film "Oppenheimer" dla tego seansu
-                  .set_cinema_hall(halls[0])  # Ustawia salę "Sala 1" dla tego seansu
-                  .set_date_time(morning_time)  # Ustawia datę i czas seansu
-                  .set_base_price(20)  # Ustawia cenę bazową biletu na 20 zł
-                  .build()  # Buduję obiekt seansu na podstawie ustawionych parametrów
-        )
-        
-        # Seans popołudniowy - kolejny przykład użycia wzorca Builder
-        afternoon_time = datetime.combine(current_date, datetime.min.time().replace(hour=15, minute=30)) # Ustawia godzinę 15:30
-        db.add_screening(
-            builder.set_movie(movies[1])
-                  .set_cinema_hall(halls[1])
-                  .set_date_time(afternoon_time)
-                  .set_base_price(25)
-                  .build() 
-        )
-        
-        # Seans wieczorny - kolejny przykład użycia wzorca Builder
-        evening_time = datetime.combine(current_date, datetime.min.time().replace(hour=20, minute=0)) # Ustawia godzinę 20:00
-        db.add_screening(
-            builder.set_movie(movies[2])
-                  .set_cinema_hall(halls[2])
-                  .set_date_time(evening_time)
-                  .set_base_price(30)
-                  .build()
-        )
+    # Generowanie seansów na najbliższe 7 dni, aby system miał początkowe dane (reguły powtarzania zamiast ręcznych pętli)
+    last_day = today + timedelta(days=6)
+    generator = ScheduleGenerator(db)
+    generator.add(movies[0], halls[0], RecurrenceRule(today, last_day, [time(10, 0)]), 20)  # Seans poranny: "Oppenheimer" w "Sala 1" o 10:00, cena bazowa 20 zł
+    generator.add(movies[1], halls[1], RecurrenceRule(today, last_day, [time(15, 30)]), 25)  # Seans popołudniowy o 15:30, cena bazowa 25 zł
+    generator.add(movies[2], halls[2], RecurrenceRule(today, last_day, [time(20, 0)]), 30)  # Seans wieczorny o 20:00, cena bazowa 30 zł
+    _, conflicts = generator.generate()  # Seanse tworzone są przez ScreeningBuilder (wzorzec Builder) wewnątrz generatora
+    for screening, colliding in conflicts:
+        if any(other.movie.title == screening.movie.title and other.date_time == screening.date_time for other in colliding):
+            continue  # Seans jest już zapisany w magazynie danych (ponowne uruchomienie z opcją --sqlite)
+        print(f"Pominięto seans {screening} - koliduje z {colliding[0]}")
+
+def configure_pricing():
+    """Funkcja konfigurująca reguły cenowe stosowane do wszystkich seansów"""
+    engine = PricingRuleEngine()  # Pobranie instancji silnika reguł (wzorzec Singleton)
+    engine.add_rule(WeekendPricingStrategy())  # Seanse weekendowe są o 20% droższe
+    engine.add_rule(MorningPricingStrategy())  # Seanse poranne są o 20% tańsze (reguły łączą się, np. weekendowy poranek)
+    engine.add_rule(OccupancyPricingStrategy())  # Ceny rosną wraz z zapełnianiem się sali (od 50% i od 80% zajętości)
+
+def parse_arguments(argv):
+    """Funkcja odczytująca opcje aplikacji; pozostałe argumenty (np. opcje Qt) są przekazywane do QApplication"""
+    parser = argparse.ArgumentParser(description="System rezerwacji biletów kinowych WSBCinema")
+    parser.add_argument("--sqlite", nargs="?", const=DEFAULT_DATABASE_FILE, metavar="PLIK",
+                        help=f"przechowywanie danych w bazie SQLite (domyślnie {DEFAULT_DATABASE_FILE}) zamiast w pamięci i pliku reservations.json")
+    return parser.parse_known_args(argv[1:])
 
 def main():
     """Główna funkcja aplikacji, punkt wejścia"""
     db = Database()
+    options, qt_arguments = parse_arguments(sys.argv)
+    storage = SQLiteStorage(options.sqlite) if options.sqlite else None
+    if storage is not None:
+        db.set_backend(storage)  # Filmy, sale, seanse i rezerwacje trafiają do bazy SQLite
 
     load_sample_data()  # Załadowanie przykładowych danych (filmy, sale, seanse)
-    db.reset_all_seats()
+    configure_pricing()  # Konfiguracja reguł cenowych
+    if storage is None:
+        db.reset_all_seats()  # W magazynie SQLite stan miejsc wynika z zapisanych rezerwacji, więc nie jest czyszczony
     db.load_reservations("reservations.json")  # Wczytanie rezerwacji
+    db.hold_scheduler.start()  # Uruchomienie wątku zwalniającego wygasłe blokady miejsc
+    db.persistence.start()  # Zapis dziennika rezerwacji w tle - rezerwacja nie czeka na dysk
+    dispatcher = AsyncEventDispatcher(policy=DROP_OLDEST)  # Obserwatorzy miejsc są powiadamiani w tle; wolny obserwator nie blokuje wątku interfejsu
+    SeatEventBus().set_dispatcher(dispatcher)
+    dispatcher.start()
 
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv[:1] + qt_arguments)
     window = MainWindow()
     window.showMaximized()
     app.aboutToQuit.connect(lambda: db.save_reservations("reservations.json"))
+    app.aboutToQuit.connect(db.persistence.stop)  # Zapisanie na dysk rekordów oczekujących w kolejce zapisu
+    app.aboutToQuit.connect(dispatcher.stop)  # Dostarczenie pozostałych zdarzeń przed zamknięciem aplikacji
+    if storage is not None:
+        app.aboutToQuit.connect(storage.close)  # Zamknięcie połączeń z bazą SQLite
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
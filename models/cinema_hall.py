@@ -1,21 +1,33 @@
+from models.hall_layout import HallLayout  # Import szablonu układu sali, współdzielonego przez wszystkie seanse w sali.
+
+DEFAULT_HALL_TYPE = "standard"  # Domyślny typ sali kinowej.
+
 class CinemaHall:
     """Klasa reprezentująca salę kinową w WSBCinema."""
     
-    def __init__(self, name, rows, seats_per_row):
+    def __init__(self, name, rows, seats_per_row, hall_type=DEFAULT_HALL_TYPE, features=(), layout=None):
         """
         Inicjalizacja obiektu sali kinowej.
-        Konstruktor klasy CinemaHall przyjmuje nazwę sali, liczbę rzędów oraz liczbę miejsc w każdym rzędzie.
+        Konstruktor klasy CinemaHall przyjmuje nazwę sali, liczbę rzędów oraz liczbę miejsc w każdym rzędzie,
+        a opcjonalnie typ sali (np. "standard", "vip"), jej wyposażenie (np. "3d"), od których zależą dostępne typy biletów,
+        oraz szablon układu sali (HallLayout) z przerwami, przejściami i miejscami dla wózków (domyślnie prostokątny układ bez przerw).
         """
+        if layout is not None and (layout.rows, layout.seats_per_row) != (rows, seats_per_row):
+            raise ValueError(f"Wymiary szablonu układu ({layout.rows}x{layout.seats_per_row}) nie zgadzają się z wymiarami sali {name}.")
+        self.id = None  # Stały identyfikator liczbowy nadawany przez bazę danych przy dodaniu sali (None - sala nie została jeszcze dodana).
         self.name = name  # Przypisywanie podanej nazwy do atrybutu 'name' obiektu.
         self.rows = rows  # Przypisywanie podanej liczby rzędów do atrybutu 'rows'.
         self.seats_per_row = seats_per_row  # Przypisywanie podanej liczby miejsc w rzędzie do atrybutu 'seats_per_row'.
+        self.hall_type = hall_type  # Przypisywanie typu sali (klucz w konfiguracji opcji biletów).
+        self.features = frozenset(features)  # Przypisywanie zbioru cech wyposażenia sali.
+        self.layout = layout if layout is not None else HallLayout.rectangular(rows, seats_per_row)  # Przypisywanie szablonu układu sali.
 
     def get_total_seats(self):
         """
         Metoda obliczająca całkowitą liczbę miejsc w sali.
-        Ta metoda zwraca iloczyn liczby rzędów i miejsc w rzędzie, co daje łączną liczbę miejsc.
+        Ta metoda zwraca liczbę miejsc w szablonie układu sali (dla sali prostokątnej - iloczyn liczby rzędów i miejsc w rzędzie).
         """
-        return self.rows * self.seats_per_row  # Obliczanie i zwracanie całkowitej liczby miejsc.
+        return self.layout.seat_count  # Zwracanie całkowitej liczby miejsc (bez przerw w rzędach).
 
     def __str__(self):
         """
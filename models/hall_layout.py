@@ -0,0 +1,170 @@
+from array import array  # Import typu array - zwarta tablica przejścia z pozycji siatki na indeks miejsca.
+from states.seat_state import FREE_CODE  # Import kodu stanu "wolne" - początkowy stan każdego miejsca.
+
+DEFAULT_CATEGORY = "standard"  # Domyślna kategoria miejsca.
+NO_SEAT = -1  # Wartość w tablicy siatki oznaczająca pozycję bez miejsca (przerwa w rzędzie).
+IDEAL_ROW_FRACTION = 2 / 3  # Położenie najlepszego rzędu jako ułamek głębokości sali (od ekranu).
+
+class HallLayout:
+    """
+    Niezmienny szablon układu sali kinowej, współdzielony przez wszystkie seanse w tej sali.
+    Opisuje siatkę rzędów i pozycji z przerwami (brak miejsca), przejściami pomiędzy kolumnami, miejscami dla wózków i kategoriami miejsc.
+    Przeliczenia numeru rzędu i miejsca na indeks miejsca (i odwrotnie), odcinki sąsiadujących miejsc i oceny jakości miejsc są wyznaczone raz, przy tworzeniu szablonu.
+    """
+
+    __slots__ = ("rows", "seats_per_row", "aisles_after", "categories", "seat_count", "_grid", "_positions", "_wheelchair", "_category_codes", "free_codes", "_segments", "_score_prefix")  # Brak słownika atrybutów.
+
+    _rectangular = {}  # Pamięć podręczna prostokątnych szablonów: (rzędy, miejsca w rzędzie) -> szablon.
+
+    def __init__(self, rows, seats_per_row, gaps=(), aisles_after=(), wheelchair=(), categories=None):
+        """
+        Inicjalizacja szablonu.
+        Przyjmuje liczbę rzędów i pozycji w rzędzie, pozycje bez miejsc (pary (rząd, miejsce)), numery miejsc, za którymi biegnie przejście,
+        miejsca dla wózków (domyślnie sala nie ma przejść, więc rząd jest jednym odcinkiem) oraz słownik kategorii: (rząd, miejsce) lub numer rzędu -> nazwa kategorii (pozostałe miejsca mają kategorię "standard").
+        """
+        gaps = frozenset(gaps)
+        categories = categories or {}
+        set_attribute = super().__setattr__  # Atrybuty są ustawiane tylko raz, z pominięciem blokady zmian.
+        set_attribute("rows", rows)  # Liczba rzędów.
+        set_attribute("seats_per_row", seats_per_row)  # Liczba pozycji w rzędzie (łącznie z przerwami).
+        set_attribute("aisles_after", tuple(sorted(aisles_after)))  # Przejścia za podanymi numerami miejsc (tylko zadeklarowane w układzie).
+        category_names = [DEFAULT_CATEGORY]  # Nazwy kategorii; indeks na liście to kod kategorii.
+        grid = array('i', [NO_SEAT]) * (rows * seats_per_row)  # Pozycja w siatce -> indeks miejsca (NO_SEAT dla przerwy).
+        positions = []  # Indeks miejsca -> (rząd, miejsce).
+        category_codes = bytearray()  # Indeks miejsca -> kod kategorii.
+        segments = [()]  # Numer rzędu -> odcinki sąsiadujących miejsc (pary indeksów [początek, koniec)), rozdzielone przerwami i przejściami.
+        score_prefix = array('d', [0.0])  # Sumy prefiksowe ocen jakości miejsc - ocena bloku miejsc w czasie O(1).
+        aisles = frozenset(self.aisles_after)
+        center = (seats_per_row + 1) / 2  # Środek rzędu.
+        ideal_row = 1 + (rows - 1) * IDEAL_ROW_FRACTION  # Rząd o najlepszej widoczności ekranu.
+        for row in range(1, rows + 1):
+            row_segments = []
+            for number in range(1, seats_per_row + 1):
+                if (row, number) in gaps:
+                    continue
+                index = len(positions)
+                grid[(row - 1) * seats_per_row + (number - 1)] = index
+                if row_segments and row_segments[-1][1] == index and number - 1 not in aisles and (row, number - 1) not in gaps:
+                    row_segments[-1][1] = index + 1  # Miejsce przylega do poprzedniego - przedłużenie odcinka.
+                else:
+                    row_segments.append([index, index + 1])  # Początek rzędu, przerwa lub przejście - nowy odcinek.
+                score_prefix.append(score_prefix[-1] + 1.0 - abs(number - center) / seats_per_row - abs(row - ideal_row) / rows)
+                positions.append((row, number))
+                category = categories.get((row, number), categories.get(row, DEFAULT_CATEGORY))
+                if category not in category_names:
+                    category_names.append(category)
+                category_codes.append(category_names.index(category))
+            segments.append(tuple((start, end) for start, end in row_segments))
+        set_attribute("categories", tuple(category_names))  # Nazwy kategorii uporządkowane według kodów.
+        set_attribute("seat_count", len(positions))  # Liczba miejsc w sali (bez przerw).
+        set_attribute("_grid", grid)
+        set_attribute("_positions", tuple(positions))
+        set_attribute("_wheelchair", frozenset(grid[(row - 1) * seats_per_row + (number - 1)] for row, number in wheelchair if (row, number) not in gaps))  # Indeksy miejsc dla wózków.
+        set_attribute("_category_codes", bytes(category_codes))
+        set_attribute("free_codes", bytes([FREE_CODE]) * len(positions))  # Wzorzec kodów stanów "wszystkie wolne", kopiowany przy pierwszej zmianie stanu.
+        set_attribute("_segments", tuple(segments))
+        set_attribute("_score_prefix", score_prefix)
+
+    @classmethod
+    def rectangular(cls, rows, seats_per_row):
+        """
+        Zwraca prostokątny szablon sali bez przerw i przejść, współdzielony przez wszystkie sale o tych wymiarach.
+        """
+        key = (rows, seats_per_row)
+        layout = cls._rectangular.get(key)
+        if layout is None:
+            layout = cls._rectangular[key] = cls(rows, seats_per_row)
+        return layout
+
+    def __setattr__(self, name, value):
+        """
+        Blokada zmiany atrybutów - szablon jest współdzielony przez wiele seansów, więc jest niezmienny.
+        """
+        raise AttributeError("HallLayout jest niezmienny.")
+
+    def __len__(self):
+        """
+        Zwraca liczbę miejsc w sali (bez przerw).
+        """
+        return self.seat_count
+
+    def index(self, row, number):
+        """
+        Zamienia numer rzędu i miejsca (numerowane od 1) na indeks miejsca.
+        Zwraca None, jeśli pozycja leży poza salą lub jest przerwą w rzędzie.
+        """
+        if 1 <= row <= self.rows and 1 <= number <= self.seats_per_row:
+            index = self._grid[(row - 1) * self.seats_per_row + (number - 1)]
+            return index if index != NO_SEAT else None
+        return None
+
+    def position(self, index):
+        """
+        Zamienia indeks miejsca na parę (rząd, numer miejsca).
+        """
+        return self._positions[index]
+
+    def is_wheelchair(self, index):
+        """
+        Sprawdza, czy miejsce o podanym indeksie jest przeznaczone dla osoby na wózku.
+        """
+        return index in self._wheelchair
+
+    def category(self, index):
+        """
+        Zwraca nazwę kategorii miejsca o podanym indeksie.
+        """
+        return self.categories[self._category_codes[index]]
+
+    def indices_in_row(self, row):
+        """
+        Zwraca indeksy miejsc w podanym rzędzie (od lewej do prawej).
+        """
+        start = (row - 1) * self.seats_per_row
+        return [index for index in self._grid[start:start + self.seats_per_row] if index != NO_SEAT]
+
+    def segments(self, row):
+        """
+        Zwraca odcinki sąsiadujących miejsc w podanym rzędzie jako pary indeksów (początek, koniec) - bez przerw i przejść wewnątrz odcinka.
+        """
+        return self._segments[row]
+
+    def quality(self, index):
+        """
+        Zwraca ocenę jakości miejsca o podanym indeksie - im bliżej środka rzędu i najlepszego rzędu, tym wyższa.
+        """
+        return self._score_prefix[index + 1] - self._score_prefix[index]
+
+    def block_quality(self, start, length):
+        """
+        Zwraca łączną ocenę jakości bloku kolejnych miejsc (od indeksu start) w czasie O(1), z sum prefiksowych.
+        """
+        return self._score_prefix[start + length] - self._score_prefix[start]
+
+    def to_dict(self):
+        """
+        Konwertuje szablon na słownik (np. do zapisu w bazie danych): wymiary, przerwy, przejścia, miejsca dla wózków i kategorie inne niż domyślna.
+        """
+        return {
+            "rows": self.rows,
+            "seats_per_row": self.seats_per_row,
+            "gaps": [[row, number] for row in range(1, self.rows + 1) for number in range(1, self.seats_per_row + 1) if self.index(row, number) is None],
+            "aisles_after": list(self.aisles_after),
+            "wheelchair": [list(self.position(index)) for index in sorted(self._wheelchair)],
+            "categories": [[*self.position(index), self.category(index)] for index in range(self.seat_count) if self._category_codes[index]],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Tworzy szablon ze słownika zapisanego metodą to_dict; układ prostokątny bez dodatków jest współdzielonym szablonem z pamięci podręcznej.
+        """
+        rows, seats_per_row = data["rows"], data["seats_per_row"]
+        aisles_after = tuple(data.get("aisles_after", ()))
+        if not data.get("gaps") and not data.get("wheelchair") and not data.get("categories") and not aisles_after:
+            return cls.rectangular(rows, seats_per_row)
+        return cls(rows, seats_per_row,
+                   gaps=[tuple(position) for position in data.get("gaps", ())],
+                   aisles_after=aisles_after,
+                   wheelchair=[tuple(position) for position in data.get("wheelchair", ())],
+                   categories={(row, number): category for row, number, category in data.get("categories", ())})
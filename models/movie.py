@@ -6,6 +6,7 @@ class Movie:
         Inicjalizacja obiektu filmu.
         Konstruktor klasy Movie przyjmuje trzy argumenty: tytuł filmu, czas trwania w minutach oraz wymaganą kategorię wiekową.
         """
+        self.id = None  # Stały identyfikator liczbowy nadawany przez bazę danych przy dodaniu filmu (None - film nie został jeszcze dodany).
         self.title = title  # Przypisywanie podanego tytułu do atrybutu 'title' obiektu.
         self.duration_minutes = duration_minutes  # Przypisywanie podanego czasu trwania do atrybutu 'duration_minutes'.
         self.age_category = age_category  # Przypisywanie podanej kategorii wiekowej do atrybutu 'age_category'.
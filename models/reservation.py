@@ -3,6 +3,9 @@ from datetime import datetime  # Import klasy datetime do zapisywania czasu utwo
 from models.screening import Screening # Import klasy Screening, aby określić typ seansu.
 from models.seat import Seat # Import klasy Seat, aby określić typ listy miejsc.
 from models.ticket import Ticket # Import klasy Ticket, aby określić typ listy biletów.
+from models.ticket_batch import TicketBatch # Import kolumnowej grupy biletów, którą można przekazać zamiast listy biletów.
+
+RECORD_FORMAT_VERSION = 2 # Wersja zapisu rezerwacji: 2 - seans i miejsca według identyfikatorów, 1 - według tytułu filmu, nazwy sali, daty oraz rzędu i numeru miejsca.
 
 class Reservation:
     """
@@ -10,19 +13,20 @@ class Reservation:
     Przechowywanie informacji o kliencie, seansie, zarezerwowanych miejscach, biletach oraz łącznej cenie.
     """
     
-    def __init__(self, customer_name: str, screening: Screening, seats: list[Seat], tickets: list[Ticket]):
+    def __init__(self, customer_name: str, screening: Screening, seats: list[Seat], tickets: 'list[Ticket] | TicketBatch'):
         """
         Inicjalizacja obiektu rezerwacji.
-        Konstruktor przyjmuje imię i nazwisko klienta, obiekt seansu, listę zarezerwowanych obiektów miejsc oraz listę obiektów biletów.
+        Konstruktor przyjmuje imię i nazwisko klienta, obiekt seansu, listę zarezerwowanych obiektów miejsc oraz listę obiektów biletów (lub grupę biletów TicketBatch).
         Dodawanie adnotacji typów dla lepszej czytelności i statycznej analizy.
         """
         self.id: str = str(uuid.uuid4())  # Generowanie unikalnego identyfikatora rezerwacji przy użyciu uuid.uuid4() i konwertowanie go na string.
         self.customer_name: str = customer_name  # Przypisywanie imienia i nazwiska klienta.
         self.screening: Screening = screening  # Przypisywanie odniesienia do obiektu seansu, na który dokonano rezerwacji.
         self.seats: list[Seat] = seats  # Przypisywanie listy obiektów Seat, które zostały zarezerwowane w ramach tej rezerwacji.
-        self.tickets: list[Ticket] = tickets  # Przypisywanie listy obiektów Ticket wygenerowanych dla tej rezerwacji.
+        self.tickets: 'list[Ticket] | TicketBatch' = tickets  # Przypisywanie listy obiektów Ticket wygenerowanych dla tej rezerwacji.
         self.timestamp: datetime = datetime.now()  # Przypisywanie aktualnego czasu utworzenia rezerwacji.
-        self.total_price: float = sum(ticket.price for ticket in tickets)  # Obliczanie łącznej ceny rezerwacji sumując ceny wszystkich biletów na liście.
+        # Obliczanie łącznej ceny rezerwacji: dla grupy TicketBatch jako suma kolumny cen (bez tworzenia obiektów biletów), dla listy - sumując ceny biletów.
+        self.total_price: float = tickets.total_price if isinstance(tickets, TicketBatch) else sum(ticket.price for ticket in tickets)
     
     def __str__(self) -> str:
         """
@@ -32,11 +36,24 @@ class Reservation:
         seats_str = ", ".join([f"R{seat.row}M{seat.number}" for seat in self.seats]) # Formatowanie miejsc
         return f"{self.customer_name} | {self.screening} | Miejsca: {seats_str} | Cena: {self.total_price:.2f} zł"
     
-    def to_dict(self) -> dict:
+    def to_dict(self, by_id: bool = False) -> dict:
         """
         Metoda konwertująca obiekt Reservation na słownik.
         Ta metoda jest pomocnicza do serializacji obiektu Reservation do formatu JSON.
+        Z by_id=True (tylko gdy identyfikatory seansów są trwałe, np. w magazynie SQLite) seans jest zapisywany przez identyfikator,
+        a miejsca przez pozycje w mapie miejsc (wersja 2); w przeciwnym razie - w pierwotnym formacie (wersja 1).
         """
+        if by_id and self.screening.id is not None:
+            seat_map = self.screening.seat_map
+            return {
+                "version": RECORD_FORMAT_VERSION,
+                "id": self.id,
+                "customer_name": self.customer_name,
+                "screening_id": self.screening.id, # Seans odszukiwany przy wczytywaniu jednym odwołaniem do słownika.
+                "seats": [seat_map.index(seat.row, seat.number) for seat in self.seats], # Pozycje miejsc w mapie miejsc seansu.
+                "total_price": self.total_price,
+                "timestamp": self.timestamp.isoformat()
+            }
         return {
             "id": self.id,  # Dodaję identyfikator rezerwacji do słownika.
             "customer_name": self.customer_name,  # Dodaję imię i nazwisko klienta.
@@ -55,25 +72,40 @@ class Reservation:
     def from_dict(data: dict, db) -> 'Reservation | None':
         """
         Metoda statyczna tworząca obiekt Reservation ze słownika (np. z danych JSON).
-        Wymaga dostępu do bazy danych (db), aby znaleźć odpowiedni seans.
+        Wymaga dostępu do bazy danych (db), aby znaleźć odpowiedni seans. Przyjmuje zapis w wersji 2 (identyfikator seansu i pozycje miejsc)
+        oraz w pierwotnej wersji 1 (tytuł filmu, nazwa sali, data oraz rząd i numer miejsca).
         """
         try:
-            screening_date_time = datetime.fromisoformat(data['date_time'])
-            # Wyszukujemy seans w bazie danych na podstawie tytułu filmu, nazwy sali i daty/czasu
-            screening = db.find_screening(data['movie_title'], data['hall_name'], screening_date_time)
-            
-            if not screening:
-                print(f"Ostrzeżenie: Nie znaleziono seansu dla rezerwacji ID: {data.get('id', 'brak')}. Pomijanie.")
-                return None
+            if 'screening_id' in data:
+                # Wersja 2: seans według identyfikatora, miejsca według pozycji w mapie miejsc.
+                screening = db.get_screening(data['screening_id'])
+                if not screening:
+                    print(f"Ostrzeżenie: Nie znaleziono seansu ID: {data['screening_id']} dla rezerwacji ID: {data.get('id', 'brak')}. Pomijanie.")
+                    return None
+                seat_map = screening.seat_map
+                seats = []
+                for index in data['seats']:
+                    if 0 <= index < len(seat_map):
+                        seats.append(seat_map.seat_at(index))
+                    else:
+                        print(f"Ostrzeżenie: Nie znaleziono miejsca o pozycji {index} dla rezerwacji ID: {data.get('id', 'brak')}. Pomijanie miejsca.")
+            else:
+                screening_date_time = datetime.fromisoformat(data['date_time'])
+                # Wersja 1: wyszukujemy seans w bazie danych na podstawie tytułu filmu, nazwy sali i daty/czasu
+                screening = db.find_screening(data['movie_title'], data['hall_name'], screening_date_time)
+
+                if not screening:
+                    print(f"Ostrzeżenie: Nie znaleziono seansu dla rezerwacji ID: {data.get('id', 'brak')}. Pomijanie.")
+                    return None
 
-            # Odtwarzamy obiekty miejsc na podstawie danych ze słownika i stanu miejsc w znalezionym seansie
-            seats = []
-            for seat_data in data['seats']:
-                seat = screening.get_seat(seat_data['row'], seat_data['number'])
-                if seat:
-                    seats.append(seat)
-                else:
-                    print(f"Ostrzeżenie: Nie znaleziono miejsca R{seat_data['row']}M{seat_data['number']} dla rezerwacji ID: {data.get('id', 'brak')}. Pomijanie miejsca.")
+                # Odtwarzamy obiekty miejsc na podstawie danych ze słownika i stanu miejsc w znalezionym seansie
+                seats = []
+                for seat_data in data['seats']:
+                    seat = screening.get_seat(seat_data['row'], seat_data['number'])
+                    if seat:
+                        seats.append(seat)
+                    else:
+                        print(f"Ostrzeżenie: Nie znaleziono miejsca R{seat_data['row']}M{seat_data['number']} dla rezerwacji ID: {data.get('id', 'brak')}. Pomijanie miejsca.")
 
             if not seats:
                 print(f"Ostrzeżenie: Brak prawidłowych miejsc dla rezerwacji ID: {data.get('id', 'brak')}. Pomijanie rezerwacji.")
@@ -85,7 +117,7 @@ class Reservation:
             # Zakładamy, że cena była równo podzielona między bilety (co nie zawsze jest prawdą przy różnych typach).
             num_tickets = len(seats)
             price_per_ticket = data['total_price'] / num_tickets if num_tickets > 0 else 0
-            tickets = [Ticket(screening, seat, price_per_ticket) for seat in seats]
+            tickets = TicketBatch.for_seats(screening, seats, price_per_ticket)  # Kolumnowa grupa biletów - obiekty Ticket powstaną dopiero na żądanie.
 
             reservation = Reservation(data['customer_name'], screening, seats, tickets)
             reservation.id = data['id'] # Przywracamy oryginalne ID
@@ -1,10 +1,11 @@
-from datetime import datetime  # Import klasy datetime z modułu datetime do obsługi dat i czasu seansu.
-from models.seat import Seat  # Import klasy Seat, która reprezentuje pojedyncze miejsce w sali.
+from datetime import datetime, timedelta  # Import klas datetime i timedelta z modułu datetime do obsługi dat, czasu i długości seansu.
+from models.seat_map import SeatMap  # Import klasy SeatMap, która przechowuje stany wszystkich miejsc seansu w zwartej tablicy.
+from states.seat_state import FREE_CODE, RESERVED_CODE, SOLD_CODE, HELD_CODE, RESERVE_ACTION, CANCEL_ACTION, SELL_ACTION, HOLD_ACTION, CONFIRM_ACTION  # Import kodów stanów i akcji do operacji na mapie miejsc.
 
 class Screening:
     """
     Klasa reprezentująca seans filmowy w kinie WSBCinema.
-    Agregowanie obiektów Movie, CinemaHall oraz listy obiektów Seat.
+    Agregowanie obiektów Movie, CinemaHall oraz mapy miejsc (SeatMap), z której na żądanie tworzone są obiekty Seat.
     Obiekt Screening łączy film, salę kinową i określony czas, tworząc konkretne wydarzenie, na które można kupić bilety.
     """
     
@@ -13,38 +14,75 @@ class Screening:
         Inicjalizacja obiektu seansu.
         Konstruktor przyjmuje obiekt filmu, obiekt sali kinowej, datę i czas seansu oraz podstawową cenę biletu.
         """
+        self.id = None  # Stały identyfikator liczbowy nadawany przez bazę danych przy dodaniu seansu - rezerwacje odwołują się do seansu przez ten identyfikator.
         self.movie = movie  # Przypisywanie obiektu filmu do atrybutu 'movie'.
         self.cinema_hall = cinema_hall  # Przypisywanie obiektu sali kinowej do atrybutu 'cinema_hall'.
         self.date_time = date_time  # Przypisywanie daty i czasu seansu do atrybutu 'date_time'.
         self.base_price = base_price  # Przypisywanie podstawowej ceny biletu do atrybutu 'base_price'.
-        self.seats = self._initialize_seats()  # Wywoływanie prywatnej metody _initialize_seats() do stworzenia listy miejsc w sali dla tego seansu i przypisywanie jej do atrybutu 'seats'.
+        self.seat_map = SeatMap(cinema_hall.layout, self)  # Tworzenie mapy stanów miejsc na podstawie współdzielonego szablonu układu sali.
 
-    def _initialize_seats(self):
+    @property
+    def end_time(self):
         """
-        Prywatna metoda inicjalizująca wszystkie miejsca w sali kinowej dla danego seansu.
-        Tworzenie obiektów Seat dla każdego miejsca w sali, na podstawie wymiarów sali (liczby rzędów i miejsc w rzędzie).
+        Właściwość zwracająca datę i czas zakończenia seansu (początek seansu plus czas trwania filmu).
         """
-        seats = []  # Tworzenie pustej listy, która będzie przechowywać obiekty Seat.
-        for row in range(1, self.cinema_hall.rows + 1):  # Iterowanie przez każdy rząd w sali kinowej (od 1 do liczby rzędów).
-            for seat_num in range(1, self.cinema_hall.seats_per_row + 1):  # Iterowanie przez każde miejsce w danym rzędzie (od 1 do liczby miejsc w rzędzie).
-                seats.append(Seat(row, seat_num))  # Tworzenie nowego obiektu Seat z numerem rzędu i miejsca i dodawanie go do listy 'seats'.
-        return seats  # Zwracanie listy wszystkich utworzonych obiektów Seat.
+        return self.date_time + timedelta(minutes=self.movie.duration_minutes)
+
+    @property
+    def seats(self):
+        """
+        Właściwość zwracająca listę wszystkich miejsc seansu.
+        Obiekty Seat są tworzone na żądanie jako widoki na mapę miejsc; kolejność to rzędy od pierwszego, miejsca od lewej.
+        """
+        return list(self.seat_map)
 
     def get_available_seats(self):
         """
         Metoda zwracająca listę dostępnych miejsc (niezarezerwowanych i niesprzedanych).
+        Wolne miejsca są wyszukiwane bezpośrednio w tablicy kodów stanów, a widoki Seat tworzone są tylko dla nich.
+        """
+        if self.available_count() == 0:
+            return []  # Seans jest wyprzedany - nie ma potrzeby przeszukiwać mapy miejsc.
+        return [self.seat_map.seat_at(index) for index in self.seat_map.indices_with(FREE_CODE)]  # Zwracanie listy dostępnych miejsc.
+
+    def available_count(self):
+        """
+        Metoda zwracająca liczbę wolnych miejsc.
+        Wartość pochodzi z licznika utrzymywanego przez mapę miejsc, więc nie wymaga przeglądania miejsc.
+        """
+        return self.seat_map.count(FREE_CODE)
+
+    def reserved_count(self):
+        """
+        Metoda zwracająca liczbę zarezerwowanych miejsc.
+        """
+        return self.seat_map.count(RESERVED_CODE)
+
+    def sold_count(self):
+        """
+        Metoda zwracająca liczbę sprzedanych miejsc.
         """
-        return [seat for seat in self.seats if seat.is_available()]  # Zwracanie listy dostępnych miejsc.
+        return self.seat_map.count(SOLD_CODE)
+
+    def held_count(self):
+        """
+        Metoda zwracająca liczbę czasowo wstrzymanych miejsc.
+        """
+        return self.seat_map.count(HELD_CODE)
+
+    def occupancy(self):
+        """
+        Metoda zwracająca zajętość sali jako ułamek z przedziału [0, 1] (miejsca niedostępne / wszystkie miejsca).
+        """
+        total = len(self.seat_map)
+        return (total - self.available_count()) / total if total else 0.0
 
     def find_seat(self, row, number):
         """
         Metoda wyszukująca konkretne miejsce po numerze rzędu i miejsca.
-        Ta metoda pozwala znaleźć konkretny obiekt Seat w liście 'self.seats' na podstawie jego numeru rzędu i miejsca.
+        Pozycja miejsca w mapie jest wyliczana bezpośrednio z numeru rzędu i miejsca, więc nie wymaga przeglądania wszystkich miejsc.
         """
-        for seat in self.seats:  # Iterowanie przez wszystkie miejsca w liście 'self.seats'.
-            if seat.row == row and seat.number == number:
-                return seat  # Zwracanie obiektu Seat, jeśli znaleziono pasujące miejsce.
-        return None  # Zwracanie None, jeśli nie znaleziono miejsca.
+        return self.seat_map.seat(row, number)  # Zwracanie widoku Seat lub None, jeśli miejsca nie ma w sali.
 
     def get_seat(self, row, number):
         """
@@ -52,6 +90,95 @@ class Screening:
         """
         return self.find_seat(row, number)
 
+    def find_best_available(self, count):
+        """
+        Metoda wyszukująca najlepszy blok count sąsiadujących wolnych miejsc w jednym rzędzie (jak najbliżej środka sali).
+        Zwraca listę miejsc (widoków Seat) lub pustą listę, jeśli nie ma wystarczająco długiego ciągu wolnych miejsc; miejsca nie są rezerwowane.
+        """
+        indices = self.seat_map.find_best_block(count)
+        return [self.seat_map.seat_at(index) for index in indices] if indices else []
+
+    def reserve_seats(self, seats):
+        """
+        Metoda rezerwująca grupę miejsc w sposób atomowy.
+        Zwraca True, jeśli zarezerwowano wszystkie miejsca, lub False (bez żadnej zmiany), jeśli którekolwiek z nich nie jest wolne.
+        """
+        return self._apply_batch(seats, RESERVE_ACTION)
+
+    def sell_seats(self, seats):
+        """
+        Metoda sprzedająca grupę miejsc w sposób atomowy (wszystkie albo żadne).
+        """
+        return self._apply_batch(seats, SELL_ACTION)
+
+    def cancel_seats(self, seats):
+        """
+        Metoda anulująca rezerwację grupy miejsc w sposób atomowy (wszystkie albo żadne).
+        """
+        return self._apply_batch(seats, CANCEL_ACTION)
+
+    def hold_seats(self, seats):
+        """
+        Metoda czasowo wstrzymująca grupę wolnych miejsc w sposób atomowy (wszystkie albo żadne).
+        """
+        return self._apply_batch(seats, HOLD_ACTION)
+
+    def confirm_held_seats(self, seats):
+        """
+        Metoda potwierdzająca czasową blokadę grupy miejsc w sposób atomowy - wstrzymane miejsca przechodzą do stanu "zarezerwowane".
+        Używana wyłącznie przy potwierdzaniu blokady przez jej właściciela; zwykła rezerwacja i sprzedaż wstrzymanych miejsc są niedozwolone.
+        """
+        return self._apply_batch(seats, CONFIRM_ACTION)
+
+    def release_held_seats(self, seats):
+        """
+        Metoda zwalniająca te z podanych miejsc, które nadal są wstrzymane (np. po wygaśnięciu blokady).
+        Miejsca, które w międzyczasie zarezerwowano lub sprzedano, pozostają bez zmian; zwracana jest liczba zwolnionych miejsc.
+        """
+        with self.seat_map.lock:  # Sprawdzenie stanów, zwolnienie i odczyt stanów do zdarzenia są niepodzielne względem innych wątków.
+            indices = []
+            for seat in seats:
+                index = self.seat_map.index(seat.row, seat.number)
+                if index is not None and self.seat_map.get_code(index) == HELD_CODE:
+                    indices.append(index)
+            if not indices or not self.seat_map.apply_batch(indices, CANCEL_ACTION):
+                return 0
+            codes = self.seat_map.snapshot(indices)
+        self.seat_map.notify(indices, codes)  # Jedno powiadomienie dla wszystkich zwolnionych miejsc (dostarczane poza blokadą seansu).
+        return len(indices)
+
+    def attach(self, observer):
+        """
+        Metoda rejestrująca obserwatora wszystkich miejsc seansu.
+        Obserwator otrzymuje zbiorcze zdarzenia przez metodę update_many() zamiast osobnych powiadomień z każdego miejsca.
+        Szyna zdarzeń przechowuje tylko słabą referencję, więc wywołujący musi utrzymywać obiekt obserwatora przy życiu.
+        """
+        self.seat_map.attach_screening_observer(observer)
+
+    def detach(self, observer):
+        """
+        Metoda wyrejestrowująca obserwatora wszystkich miejsc seansu.
+        """
+        self.seat_map.detach_screening_observer(observer)
+
+    def _apply_batch(self, seats, action):
+        """
+        Prywatna metoda wykonująca akcję na grupie miejsc: walidacja wszystkich miejsc, zmiana stanów i jedno zbiorcze powiadomienie.
+        Miejsca są wskazywane numerem rzędu i miejsca, więc mogą to być widoki Seat tego seansu lub dowolne obiekty z atrybutami row i number.
+        """
+        indices = []
+        for seat in seats:
+            index = self.seat_map.index(seat.row, seat.number)
+            if index is None:
+                return False  # Miejsce nie istnieje w tej sali - operacja odrzucona w całości.
+            indices.append(index)
+        with self.seat_map.lock:  # Stany do zdarzenia są odczytywane razem ze zmianą - inny wątek nie zmieni ich pomiędzy.
+            if not self.seat_map.apply_batch(indices, action):
+                return False
+            codes = self.seat_map.snapshot(indices)
+        self.seat_map.notify(indices, codes)  # Jedno powiadomienie dla całej grupy miejsc (dostarczane poza blokadą seansu).
+        return True
+
     def __str__(self):
         """
         Metoda zwracająca tekstową reprezentację obiektu seansu.
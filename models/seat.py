@@ -1,71 +1,181 @@
-from states.seat_state import FreeSeatState  # Importuję klasę FreeSeatState, która reprezentuje stan wolnego miejsca (część wzorca State).
+from states.seat_state import FREE_STATE, SEAT_STATES  # Importuję współdzieloną instancję stanu wolnego miejsca (część wzorca State) oraz instancje stanów uporządkowane według kodów.
 from observers.seat_observer import SeatSubject  # Importuję klasę SeatSubject, która jest bazą dla obiektów obserwowanych (część wzorca Observer).
 
 class Seat(SeatSubject):
     """
     Klasa reprezentująca pojedyncze miejsce w sali kinowej.
     Przechowywanie informacji o numerze rzędu, numerze miejsca oraz stanie miejsca.
+    Miejsce seansu jest lekkim widokiem na pozycję w mapie miejsc (SeatMap) - jego stan i obserwatorzy są przechowywani w mapie.
     """
-    
-    def __init__(self, row: int, number: int):
+
+    __slots__ = ("row", "number", "_state", "_seat_map", "_index")  # Brak słownika atrybutów - widoki miejsc są tanie w tworzeniu.
+
+    def __init__(self, row: int, number: int, seat_map=None, index=None):
         """
         Inicjalizacja obiektu miejsca.
         Przypisywanie numeru rzędu i numeru miejsca do odpowiednich atrybutów.
-        Ustawianie początkowego stanu miejsca na wolne.
+        Bez mapy miejsc obiekt jest samodzielny i ustawia swój stan początkowy na wolne; z mapą jest widokiem na jej pozycję o podanym indeksie.
         """
-        super().__init__()  # Wywołuję konstruktor klasy nadrzędnej (SeatSubject) do inicjalizacji mechanizmu obserwatorów.
         self.row = row  # Przypisywanie numeru rzędu do atrybutu row.
         self.number = number  # Przypisywanie numeru miejsca do atrybutu number.
-        self._state = FreeSeatState()  # Ustawiam początkowy stan miejsca na FreeSeatState, czyli wolne (inicjalizacja wzorca State).
-    
+        self._seat_map = seat_map  # Mapa miejsc seansu, na którą wskazuje ten widok (None dla samodzielnego miejsca).
+        self._index = index  # Pozycja miejsca w mapie miejsc.
+        if seat_map is None:
+            super().__init__()  # Wywołuję konstruktor klasy nadrzędnej (SeatSubject) do inicjalizacji mechanizmu obserwatorów.
+            self._state = FREE_STATE  # Ustawiam początkowy stan miejsca na FreeSeatState, czyli wolne (inicjalizacja wzorca State).
+
     @property
     def state(self):
         """
         Getter dla stanu miejsca.
         Ta właściwość pozwala na bezpieczny odczyt aktualnego stanu miejsca.
         """
+        if self._seat_map is not None:
+            return SEAT_STATES[self._seat_map.get_code(self._index)]  # Zwracam współdzieloną instancję stanu odpowiadającą kodowi z mapy.
         return self._state  # Zwracam aktualny obiekt stanu miejsca.
-    
+
     @state.setter
     def state(self, state):
         """
         Setter dla stanu miejsca.
         Ta właściwość pozwala na ustawienie nowego stanu miejsca. Po zmianie stanu, powiadamiani są wszyscy obserwatorzy.
         """
-        self._state = state  # Ustawiam nowy obiekt stanu miejsca.
-        self.notify()  # Wywołuję metodę notify() z klasy nadrzędnej (SeatSubject), aby powiadomić wszystkich zarejestrowanych obserwatorów o tej zmianie stanu (mechanizm wzorca Observer).
-    
+        if self._seat_map is not None:
+            self._seat_map.set_code(self._index, state.code)  # Zapisuję kod nowego stanu w mapie miejsc seansu.
+        else:
+            self._state = state  # Ustawiam nowy obiekt stanu miejsca.
+        self.notify()  # Wywołuję metodę notify(), aby powiadomić wszystkich zarejestrowanych obserwatorów o tej zmianie stanu (mechanizm wzorca Observer).
+
+    def attach(self, observer):
+        """
+        Dodawanie obserwatora miejsca.
+        Dla widoku na mapę miejsc obserwator jest rejestrowany w szynie zdarzeń (tylko przez słabą referencję), więc pozostaje zarejestrowany także dla kolejnych widoków tego miejsca.
+        """
+        if self._seat_map is not None:
+            self._seat_map.attach(self._index, observer)
+        else:
+            super().attach(observer)
+
+    def detach(self, observer):
+        """
+        Usuwanie obserwatora miejsca.
+        """
+        if self._seat_map is not None:
+            self._seat_map.detach(self._index, observer)
+        else:
+            super().detach(observer)
+
+    def notify(self):
+        """
+        Powiadamianie obserwatorów miejsca o zmianie stanu.
+        """
+        if self._seat_map is not None:
+            self._seat_map.notify((self._index,))  # Publikacja zmiany w szynie zdarzeń - dla obserwatorów miejsca i całego seansu.
+        else:
+            super().notify()
+
     def reserve(self):
         """
         Metoda do próby rezerwacji miejsca.
         Ta metoda deleguje operację rezerwacji do aktualnego obiektu stanu miejsca.
         """
-        return self._state.reserve(self)  # Wywołuję metodę reserve() na aktualnym obiekcie stanu, przekazując referencję do siebie (self).
-    
+        if self._seat_map is not None:
+            with self._seat_map.lock:  # Odczyt stanu i przejście do nowego stanu są niepodzielne względem innych wątków.
+                return self.state.reserve(self)
+        return self.state.reserve(self)  # Wywołuję metodę reserve() na aktualnym obiekcie stanu, przekazując referencję do siebie (self).
+
     def cancel(self):
         """
         Metoda do próby anulowania rezerwacji miejsca.
         Ta metoda deleguje operację anulowania do aktualnego obiektu stanu miejsca.
         """
-        return self._state.cancel(self)  # Wywołuję metodę cancel() na aktualnym obiekcie stanu, przekazując referencję do siebie.
-    
+        if self._seat_map is not None:
+            with self._seat_map.lock:  # Odczyt stanu i przejście do nowego stanu są niepodzielne względem innych wątków.
+                return self.state.cancel(self)
+        return self.state.cancel(self)  # Wywołuję metodę cancel() na aktualnym obiekcie stanu, przekazując referencję do siebie.
+
     def sell(self):
         """
         Metoda do próby sprzedaży miejsca.
         Ta metoda deleguje operację sprzedaży do aktualnego obiektu stanu miejsca.
         """
-        return self._state.sell(self)  # Wywołuję metodę sell() na aktualnym obiekcie stanu, przekazując referencję do siebie.
-    
+        if self._seat_map is not None:
+            with self._seat_map.lock:  # Odczyt stanu i przejście do nowego stanu są niepodzielne względem innych wątków.
+                return self.state.sell(self)
+        return self.state.sell(self)  # Wywołuję metodę sell() na aktualnym obiekcie stanu, przekazując referencję do siebie.
+
+    def hold(self):
+        """
+        Metoda do próby czasowego wstrzymania miejsca.
+        Ta metoda deleguje operację wstrzymania do aktualnego obiektu stanu miejsca.
+        """
+        if self._seat_map is not None:
+            with self._seat_map.lock:  # Odczyt stanu i przejście do nowego stanu są niepodzielne względem innych wątków.
+                return self.state.hold(self)
+        return self.state.hold(self)  # Wywołuję metodę hold() na aktualnym obiekcie stanu, przekazując referencję do siebie.
+
+    def confirm(self):
+        """
+        Metoda do próby potwierdzenia czasowej blokady miejsca (wstrzymane -> zarezerwowane).
+        Ta metoda deleguje operację potwierdzenia do aktualnego obiektu stanu miejsca.
+        """
+        if self._seat_map is not None:
+            with self._seat_map.lock:  # Odczyt stanu i przejście do nowego stanu są niepodzielne względem innych wątków.
+                return self.state.confirm(self)
+        return self.state.confirm(self)
+
     def is_available(self):
         """
         Metoda sprawdzająca czy miejsce jest dostępne do rezerwacji/sprzedaży.
         Ta metoda deleguje sprawdzenie dostępności do aktualnego obiektu stanu miejsca.
         """
-        return self._state.is_available()  # Wywołuję metodę is_available() na aktualnym obiekcie stanu.
-    
+        return self.state.is_available()  # Wywołuję metodę is_available() na aktualnym obiekcie stanu.
+
+    def __eq__(self, other):
+        """
+        Porównanie miejsc.
+        Dwa widoki są równe, jeśli wskazują na tę samą pozycję tej samej mapy miejsc; samodzielne miejsca porównywane są po tożsamości.
+        """
+        if not isinstance(other, Seat):
+            return NotImplemented
+        if self._seat_map is None or other._seat_map is None:
+            return self is other
+        return self._seat_map is other._seat_map and self._index == other._index
+
+    def __hash__(self):
+        """
+        Skrót miejsca zgodny z metodą __eq__, pozwalający używać widoków w zbiorach i jako kluczy słowników.
+        """
+        if self._seat_map is None:
+            return id(self)
+        return hash((id(self._seat_map), self._index))
+
     def __str__(self):
         """
         Metoda zwracająca tekstową reprezentację obiektu miejsca.
         Zwraca sformatowany string, np. "R1M5" dla miejsca w rzędzie 1, miejsce 5.
         """
-        return f"Rząd {self.row} Miejsce {self.number}"  # Zwracam sformatowany tekst z numerem rzędu i miejsca.
\ No newline at end of file
+        return f"Rząd {self.row} Miejsce {self.number}"  # Zwracam sformatowany tekst z numerem rzędu i miejsca.
+
+class SeatSnapshot(Seat):
+    """
+    Widok miejsca z utrwalonym stanem z chwili publikacji zdarzenia.
+    Dostarczany obserwatorom przez szynę zdarzeń - także przy dostarczaniu asynchronicznym obserwator widzi stan po danej zmianie,
+    a nie stan z chwili dostarczenia; porównania i operacje na miejscu dotyczą tej samej pozycji mapy miejsc co zwykły widok.
+    """
+
+    __slots__ = ("_snapshot_state",)  # Stan miejsca utrwalony w chwili zmiany.
+
+    def __init__(self, row: int, number: int, seat_map, index, state):
+        """
+        Inicjalizacja widoku z utrwalonym stanem.
+        """
+        super().__init__(row, number, seat_map, index)
+        self._snapshot_state = state  # Współdzielona instancja stanu odpowiadająca kodowi z chwili zmiany.
+
+    @property
+    def state(self):
+        """
+        Getter zwracający stan miejsca z chwili publikacji zdarzenia (tylko do odczytu).
+        """
+        return self._snapshot_state
@@ -0,0 +1,89 @@
+import time  # Import modułu time do wyznaczania chwili wygaśnięcia blokady (czas uniksowy, zachowywany po restarcie aplikacji).
+import uuid  # Import modułu uuid do generowania unikalnych identyfikatorów blokad.
+from datetime import datetime  # Import klasy datetime do zapisu daty i czasu seansu.
+
+DEFAULT_HOLD_TTL_SECONDS = 600  # Domyślny czas ważności blokady miejsc (10 minut).
+
+class SeatHold:
+    """
+    Klasa reprezentująca czasową blokadę (wstrzymanie) grupy miejsc na seans.
+    Blokada jest ważna do chwili expires_at; jeśli nie zostanie wcześniej potwierdzona rezerwacją, miejsca wracają do puli wolnych.
+    """
+
+    def __init__(self, screening, seats, ttl_seconds=DEFAULT_HOLD_TTL_SECONDS, expires_at=None):
+        """
+        Inicjalizacja obiektu blokady.
+        Konstruktor przyjmuje seans, listę wstrzymanych miejsc oraz czas ważności w sekundach (lub gotową chwilę wygaśnięcia).
+        """
+        self.id: str = str(uuid.uuid4())  # Generowanie unikalnego identyfikatora blokady.
+        self.screening = screening  # Seans, którego miejsca są wstrzymane.
+        self.seats = seats  # Lista wstrzymanych miejsc.
+        self.expires_at: float = expires_at if expires_at is not None else time.time() + ttl_seconds  # Chwila wygaśnięcia (czas uniksowy).
+        self.active: bool = True  # Flaga aktywności - False po potwierdzeniu, zwolnieniu lub wygaśnięciu blokady.
+
+    def is_expired(self, now=None) -> bool:
+        """
+        Metoda sprawdzająca, czy blokada wygasła w podanej chwili (domyślnie teraz).
+        """
+        return (now if now is not None else time.time()) >= self.expires_at
+
+    def __str__(self) -> str:
+        """
+        Metoda zwracająca tekstową reprezentację blokady.
+        """
+        seats_str = ", ".join([f"R{seat.row}M{seat.number}" for seat in self.seats])
+        return f"Blokada {self.id} | {self.screening} | Miejsca: {seats_str} | Ważna do: {datetime.fromtimestamp(self.expires_at).strftime('%H:%M:%S')}"
+
+    def to_dict(self, by_id: bool = False) -> dict:
+        """
+        Metoda konwertująca obiekt SeatHold na słownik (do zapisu w dzienniku rezerwacji).
+        Seans jest zapisywany tak samo jak w rezerwacji: przy trwałych identyfikatorach (by_id=True) przez identyfikator i pozycje miejsc,
+        a w przeciwnym razie przez tytuł filmu, nazwę sali oraz datę i czas.
+        """
+        if by_id and self.screening.id is not None:
+            seat_map = self.screening.seat_map
+            return {
+                "id": self.id,
+                "screening_id": self.screening.id,
+                "seats": [seat_map.index(seat.row, seat.number) for seat in self.seats],
+                "expires_at": self.expires_at,
+            }
+        return {
+            "id": self.id,
+            "movie_title": self.screening.movie.title,
+            "hall_name": self.screening.cinema_hall.name,
+            "date_time": self.screening.date_time.isoformat(),
+            "seats": [{"row": seat.row, "number": seat.number} for seat in self.seats],
+            "expires_at": self.expires_at,
+        }
+
+    @staticmethod
+    def from_dict(data: dict, db) -> 'SeatHold | None':
+        """
+        Metoda statyczna tworząca obiekt SeatHold ze słownika i ponownie wstrzymująca jego miejsca.
+        Zwraca None, jeśli blokada już wygasła, seans nie istnieje lub miejsca nie są już wolne.
+        """
+        try:
+            if data['expires_at'] <= time.time():
+                return None  # Blokada wygasła, gdy aplikacja nie działała - miejsca pozostają wolne.
+            if 'screening_id' in data:
+                screening = db.get_screening(data['screening_id'])
+            else:
+                screening = db.find_screening(data['movie_title'], data['hall_name'], datetime.fromisoformat(data['date_time']))
+            if not screening:
+                print(f"Ostrzeżenie: Nie znaleziono seansu dla blokady ID: {data.get('id', 'brak')}. Pomijanie.")
+                return None
+            if 'screening_id' in data:
+                seat_map = screening.seat_map
+                seats = [seat_map.seat_at(index) if 0 <= index < len(seat_map) else None for index in data['seats']]
+            else:
+                seats = [screening.get_seat(seat_data['row'], seat_data['number']) for seat_data in data['seats']]
+            if None in seats or not screening.hold_seats(seats):
+                print(f"Ostrzeżenie: Miejsca blokady ID: {data.get('id', 'brak')} nie są już wolne. Pomijanie.")
+                return None
+            hold = SeatHold(screening, seats, expires_at=data['expires_at'])
+            hold.id = data['id']  # Przywracamy oryginalne ID
+            return hold
+        except KeyError as e:
+            print(f"Błąd wczytywania blokady: Brakujący klucz {e} w danych: {data}")
+            return None
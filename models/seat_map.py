@@ -0,0 +1,260 @@
+import threading  # Import modułu threading - każda mapa miejsc ma własną blokadę (blokowanie na poziomie seansu).
+from states.seat_state import FREE_CODE, SEAT_STATES, TRANSITIONS  # Import kodu stanu "wolne", którym wypełniana jest nowa mapa miejsc, listy wszystkich stanów oraz tablicy przejść.
+from models.seat import Seat  # Import klasy Seat, której obiekty są lekkimi widokami na pojedyncze pozycje mapy.
+from observers.event_bus import SeatEventBus  # Import szyny zdarzeń, przez którą publikowane są zmiany stanu miejsc.
+
+class SeatMap:
+    """
+    Zwarta mapa stanów miejsc dla jednego seansu.
+    Układ sali (rzędy, przerwy, przejścia, kategorie) pochodzi ze współdzielonego, niezmiennego szablonu HallLayout; mapa przechowuje tylko stany miejsc.
+    Stan każdego miejsca to jeden bajt (kod stanu) w tablicy bytearray, tworzonej dopiero przy pierwszej zmianie stanu - do tego czasu wszystkie miejsca są wolne.
+    Obiekty Seat są tworzone na żądanie jako widoki na pozycje tej tablicy.
+    """
+
+    __slots__ = ("layout", "screening", "lock", "_codes", "_counts", "_runs", "__weakref__")  # Brak słownika atrybutów - mapa zajmuje stałą, niewielką ilość pamięci.
+
+    def __init__(self, layout, screening=None):
+        """
+        Inicjalizacja mapy miejsc.
+        Konstruktor przyjmuje szablon układu sali oraz seans, do którego należy mapa; wszystkie miejsca są początkowo wolne.
+        """
+        self.layout = layout  # Współdzielony szablon układu sali.
+        self.screening = screening  # Seans, którego miejsca opisuje mapa (przekazywany w zdarzeniach zmian).
+        self.lock = threading.RLock()  # Blokada seansu - sprawdzenie i zmiana stanu miejsc odbywają się niepodzielnie; różne seanse nie blokują się nawzajem.
+        self._codes = None  # Kody stanów miejsc; None oznacza, że wszystkie miejsca są wolne (tablica powstaje przy pierwszej zmianie).
+        self._counts = [0] * len(SEAT_STATES)  # Liczniki miejsc w poszczególnych stanach, aktualizowane przy każdej zmianie stanu.
+        self._counts[FREE_CODE] = layout.seat_count  # Początkowo wszystkie miejsca są wolne.
+        self._runs = None  # Podsumowania wolnych miejsc w rzędach (rząd -> ciągi wolnych miejsc), tworzone przy pierwszym wyszukiwaniu.
+
+    @property
+    def rows(self):
+        """
+        Liczba rzędów w sali (z szablonu układu).
+        """
+        return self.layout.rows
+
+    @property
+    def seats_per_row(self):
+        """
+        Liczba pozycji w rzędzie (z szablonu układu, łącznie z przerwami).
+        """
+        return self.layout.seats_per_row
+
+    def __len__(self):
+        """
+        Zwraca łączną liczbę miejsc w mapie.
+        """
+        return self.layout.seat_count
+
+    def __iter__(self):
+        """
+        Iteruje po wszystkich miejscach, tworząc dla każdego widok Seat (rzędami, od lewej do prawej).
+        """
+        for index in range(self.layout.seat_count):
+            yield self.seat_at(index)
+
+    def index(self, row, number):
+        """
+        Zamienia numer rzędu i miejsca (numerowane od 1) na pozycję w tablicy stanów.
+        Zwraca None, jeśli miejsce nie istnieje w sali (także gdy w tym miejscu rzędu jest przerwa).
+        """
+        return self.layout.index(row, number)
+
+    def position(self, index):
+        """
+        Zamienia pozycję w tablicy stanów na parę (rząd, numer miejsca).
+        """
+        return self.layout.position(index)
+
+    def seat(self, row, number):
+        """
+        Zwraca widok Seat dla miejsca o podanym rzędzie i numerze lub None, jeśli takiego miejsca nie ma.
+        """
+        index = self.index(row, number)
+        return self.seat_at(index) if index is not None else None
+
+    def seat_at(self, index):
+        """
+        Zwraca widok Seat dla miejsca na podanej pozycji tablicy stanów.
+        """
+        row, number = self.position(index)
+        return Seat(row, number, self, index)
+
+    def codes(self):
+        """
+        Zwraca kody stanów wszystkich miejsc (tylko do odczytu) - przed pierwszą zmianą jest to współdzielony wzorzec "wszystkie wolne" z szablonu.
+        """
+        codes = self._codes
+        return codes if codes is not None else self.layout.free_codes
+
+    def get_code(self, index):
+        """
+        Zwraca kod stanu miejsca na podanej pozycji.
+        """
+        return self.codes()[index]
+
+    def set_code(self, index, code):
+        """
+        Ustawia kod stanu miejsca na podanej pozycji i aktualizuje liczniki miejsc w poszczególnych stanach.
+        """
+        with self.lock:
+            if self._codes is None:
+                self._codes = bytearray(self.layout.free_codes)  # Pierwsza zmiana stanu - kopia wzorca z szablonu.
+            counts = self._counts
+            counts[self._codes[index]] -= 1  # Miejsce opuszcza dotychczasowy stan.
+            counts[code] += 1  # Miejsce przechodzi do nowego stanu.
+            self._codes[index] = code
+            if self._runs is not None:
+                self._runs[self.layout.position(index)[0]] = None  # Podsumowanie rzędu jest nieaktualne - zostanie przeliczone przy następnym wyszukiwaniu.
+
+    def apply(self, index, action):
+        """
+        Wykonuje akcję (rezerwacja, anulowanie, sprzedaż) na miejscu o podanej pozycji na podstawie tablicy przejść.
+        Operacja działa bezpośrednio na kodach stanów, bez tworzenia widoków miejsc; zwraca True, jeśli akcja była dozwolona.
+        """
+        with self.lock:
+            new_code = TRANSITIONS[self.codes()[index]][action]
+            if new_code is None:
+                return False  # Akcja niedozwolona w bieżącym stanie miejsca.
+            self.set_code(index, new_code)
+            return True
+
+    def apply_batch(self, indices, action):
+        """
+        Wykonuje akcję na wszystkich podanych pozycjach w sposób atomowy (wszystko albo nic).
+        Najpierw sprawdza, czy akcja jest dozwolona dla każdego miejsca (i czy pozycje się nie powtarzają), a dopiero potem zmienia stany.
+        Zwraca True, jeśli wszystkie miejsca zmieniły stan, lub False, jeśli żadne nie zostało zmienione.
+        """
+        if len(set(indices)) != len(indices):
+            return False  # To samo miejsce podane dwukrotnie - operacja odrzucona w całości.
+        with self.lock:  # Walidacja i zmiana stanów pod jedną blokadą - inny wątek nie zajmie miejsca pomiędzy nimi.
+            codes = self.codes()
+            new_codes = []
+            for index in indices:
+                new_code = TRANSITIONS[codes[index]][action]
+                if new_code is None:
+                    return False  # Co najmniej jedno miejsce nie pozwala na tę akcję - nic nie jest zmieniane.
+                new_codes.append(new_code)
+            for index, new_code in zip(indices, new_codes):
+                self.set_code(index, new_code)
+            return True
+
+    def count(self, code):
+        """
+        Zwraca liczbę miejsc w podanym stanie.
+        Wynik pochodzi z liczników aktualizowanych przy każdej zmianie stanu, więc nie wymaga przeglądania tablicy.
+        """
+        return self._counts[code]
+
+    def indices_with(self, code):
+        """
+        Generator zwracający pozycje wszystkich miejsc w podanym stanie.
+        Kolejne pozycje są wyszukiwane metodą find na tablicy kodów, bez tworzenia obiektów dla pozostałych miejsc.
+        """
+        codes = self.codes()
+        index = codes.find(code)
+        while index != -1:
+            yield index
+            index = codes.find(code, index + 1)
+
+    def reset(self):
+        """
+        Przywraca wszystkie miejsca do stanu "wolne" - mapa wraca do współdzielonego wzorca z szablonu.
+        """
+        with self.lock:
+            self._codes = None
+            self._counts = [0] * len(SEAT_STATES)  # Reset liczników - wszystkie miejsca są znowu wolne.
+            self._counts[FREE_CODE] = self.layout.seat_count
+            self._runs = None
+
+    def free_runs(self, row):
+        """
+        Zwraca ciągi sąsiadujących wolnych miejsc w podanym rzędzie jako pary (indeks pierwszego miejsca, długość).
+        Podsumowanie rzędu jest zapamiętywane i przeliczane tylko po zmianie stanu któregoś z jego miejsc.
+        """
+        with self.lock:
+            if self._runs is None:
+                self._runs = [None] * (self.layout.rows + 1)
+            runs = self._runs[row]
+            if runs is None:
+                runs = []
+                codes = self.codes()
+                for start, end in self.layout.segments(row):
+                    index = start
+                    while index < end:
+                        if codes[index] != FREE_CODE:
+                            index += 1
+                            continue
+                        first = index
+                        while index < end and codes[index] == FREE_CODE:
+                            index += 1
+                        runs.append((first, index - first))
+                runs = self._runs[row] = tuple(runs)
+            return runs
+
+    def find_best_block(self, count):
+        """
+        Wyszukuje blok count sąsiadujących wolnych miejsc w jednym rzędzie o najwyższej łącznej ocenie jakości (najbliżej środka sali).
+        Przegląda tylko ciągi wolnych miejsc co najmniej tej długości; zwraca listę indeksów miejsc lub None, jeśli takiego bloku nie ma.
+        """
+        if count < 1:
+            raise ValueError("Liczba szukanych miejsc musi być dodatnia.")
+        block_quality = self.layout.block_quality
+        best_start, best_score = None, None
+        with self.lock:
+            if self._counts[FREE_CODE] < count:
+                return None  # Za mało wolnych miejsc w całej sali - nie ma potrzeby przeglądać rzędów.
+            for row in range(1, self.layout.rows + 1):
+                for start, length in self.free_runs(row):
+                    for first in range(start, start + length - count + 1):
+                        score = block_quality(first, count)
+                        if best_score is None or score > best_score:
+                            best_start, best_score = first, score
+        return list(range(best_start, best_start + count)) if best_start is not None else None
+
+    @property
+    def topic(self):
+        """
+        Temat szyny zdarzeń, pod którym publikowane są zmiany tej mapy - seans, a dla mapy bez seansu sama mapa.
+        """
+        return self.screening if self.screening is not None else self
+
+    def attach(self, index, observer):
+        """
+        Rejestruje w szynie zdarzeń obserwatora miejsca na podanej pozycji.
+        """
+        SeatEventBus().subscribe(observer, self.topic, index)
+
+    def detach(self, index, observer):
+        """
+        Wyrejestrowuje obserwatora miejsca na podanej pozycji.
+        """
+        SeatEventBus().unsubscribe(observer, self.topic, index)
+
+    def attach_screening_observer(self, observer):
+        """
+        Rejestruje w szynie zdarzeń obserwatora wszystkich miejsc seansu (jedna rejestracja zamiast osobnej dla każdego miejsca).
+        """
+        SeatEventBus().subscribe(observer, self.topic)
+
+    def detach_screening_observer(self, observer):
+        """
+        Wyrejestrowuje obserwatora wszystkich miejsc seansu.
+        """
+        SeatEventBus().unsubscribe(observer, self.topic)
+
+    def snapshot(self, indices):
+        """
+        Zwraca kody stanów miejsc na podanych pozycjach (bajty w tej samej kolejności), odczytane pod blokadą seansu.
+        """
+        with self.lock:
+            codes = self.codes()
+            return bytes(codes[index] for index in indices)
+
+    def notify(self, indices, codes=None):
+        """
+        Publikuje w szynie zdarzeń zmianę stanu miejsc na podanych pozycjach wraz z ich kodami stanów po zmianie.
+        Obserwatorzy pojedynczych miejsc otrzymują update(seat), a obserwatorzy seansu - jedno zbiorcze zdarzenie SeatChangeEvent.
+        Bez podanych kodów stany są odczytywane w chwili publikacji.
+        """
+        SeatEventBus().publish(self.topic, self, indices, codes)
@@ -21,6 +21,13 @@ class Ticket:
         """
         # Zwracanie sformatowanego stringa zawierającego tytuł filmu, czas seansu, numer miejsca i cenę.
         return f"Bilet na {self.screening.movie.title} o {self.screening.date_time.strftime('%H:%M')}, Miejsce: {self.seat}, Cena: {self.price:.2f} zł"
+    
+    def flatten(self):
+        """
+        Metoda zamieniająca bilet na niezmienny rekord FrozenTicket z zapamiętaną ceną i opisem.
+        Dla zwykłego biletu rekord nie zawiera żadnych dodatków.
+        """
+        return FrozenTicket(self.screening, self.seat, self.price, str(self), type(self).__name__)
 
 class RegularTicket(Ticket):
     """
@@ -41,4 +48,48 @@ class VIPTicket(Ticket):
     Klasa reprezentująca bilet VIP.
     VIPTicket dziedziczy po klasie Ticket. Dodatkowa opłata za bilet VIP jest ustalana w fabryce biletów lub przez dekorator.
     """
-    pass  # Klasa pusta, funkcjonalność VIP może być dodana przez dekorator.
\ No newline at end of file
+    pass  # Klasa pusta, funkcjonalność VIP może być dodana przez dekorator.
+
+class FrozenTicket(Ticket):
+    """
+    Klasa reprezentująca niezmienny, "spłaszczony" bilet.
+    Powstaje ze stosu dekoratorów (np. bilet + 3D + zestaw przekąsek) i przechowuje gotową cenę oraz opis,
+    więc odczyt ceny i opisu nie wymaga rekurencyjnego przechodzenia przez kolejne dekoratory.
+    """
+    
+    def __init__(self, screening, seat, price, label, ticket_type="Ticket", addons=()):
+        """
+        Inicjalizacja niezmiennego biletu.
+        Konstruktor przyjmuje seans, miejsce, obliczoną cenę, gotowy opis biletu, nazwę typu biletu bazowego oraz krotkę klas zastosowanych dodatków.
+        """
+        set_attribute = super().__setattr__  # Atrybuty są ustawiane tylko raz, z pominięciem blokady zmian.
+        set_attribute("screening", screening)  # Seans, na który jest bilet.
+        set_attribute("seat", seat)  # Miejsce, które rezerwuje bilet.
+        set_attribute("price", price)  # Cena biletu razem z dopłatami za dodatki.
+        set_attribute("label", label)  # Pełny opis biletu razem z dodatkami.
+        set_attribute("ticket_type", ticket_type)  # Nazwa klasy biletu bazowego (np. "RegularTicket").
+        set_attribute("addons", tuple(addons))  # Klasy dodatków (dekoratorów) w kolejności ich zastosowania.
+    
+    def __setattr__(self, name, value):
+        """
+        Blokada zmiany atrybutów - bilet spłaszczony jest niezmienny.
+        """
+        raise AttributeError("FrozenTicket jest niezmienny.")
+    
+    def __delattr__(self, name):
+        """
+        Blokada usuwania atrybutów - bilet spłaszczony jest niezmienny.
+        """
+        raise AttributeError("FrozenTicket jest niezmienny.")
+    
+    def flatten(self):
+        """
+        Bilet jest już spłaszczony, więc metoda zwraca ten sam obiekt.
+        """
+        return self
+    
+    def __str__(self):
+        """
+        Metoda zwracająca zapamiętany opis biletu.
+        """
+        return self.label
\ No newline at end of file
@@ -0,0 +1,97 @@
+from array import array  # Import typu array - zwarte kolumny indeksów miejsc i cen biletów.
+from models.ticket import Ticket  # Import klasy bazowej Ticket, której obiekty są tworzone dopiero na żądanie.
+
+UNKNOWN_TYPE_CODE = 0  # Kod typu biletu dla biletów o nieznanym typie (np. odtworzonych z zapisanej ceny rezerwacji).
+
+class TicketBatch:
+    """
+    Kolumnowa reprezentacja grupy biletów na jeden seans.
+    Zamiast listy obiektów Ticket przechowuje kolumny: indeksy miejsc w mapie miejsc i ceny biletów oraz wspólny kod typu biletu.
+    Obiekty Ticket są tworzone dopiero na żądanie (np. przy iteracji), więc sprzedaż grupowa lub import tysięcy biletów nie tworzy tysięcy obiektów.
+    """
+
+    __slots__ = ("screening", "seat_indices", "prices", "type_code", "ticket_class", "_tickets")  # Brak słownika atrybutów.
+
+    def __init__(self, screening, seat_indices, prices, type_code=UNKNOWN_TYPE_CODE, ticket_class=Ticket):
+        """
+        Inicjalizacja grupy biletów.
+        Przyjmuje seans, kolumnę indeksów miejsc, kolumnę cen (tej samej długości), kod typu biletu oraz klasę biletu używaną przy tworzeniu obiektów.
+        """
+        if len(seat_indices) != len(prices):
+            raise ValueError("Liczba miejsc i liczba cen w grupie biletów muszą być równe.")
+        self.screening = screening  # Seans, na który są bilety.
+        self.seat_indices = array('I', seat_indices)  # Pozycje miejsc w mapie miejsc seansu.
+        self.prices = array('d', prices)  # Ceny poszczególnych biletów.
+        self.type_code = type_code  # Kod typu biletów (wspólny dla całej grupy).
+        self.ticket_class = ticket_class  # Klasa biletu tworzona przy materializacji (np. RegularTicket).
+        self._tickets = None  # Lista obiektów Ticket, tworzona dopiero przy pierwszym użyciu.
+
+    @classmethod
+    def for_seats(cls, screening, seats, price, type_code=UNKNOWN_TYPE_CODE, ticket_class=Ticket):
+        """
+        Tworzy grupę biletów w tej samej cenie dla podanych miejsc seansu.
+        Zgłasza ValueError, jeśli któreś miejsce nie istnieje w sali seansu.
+        """
+        seat_map = screening.seat_map
+        indices = array('I')
+        for seat in seats:
+            index = seat_map.index(seat.row, seat.number)
+            if index is None:
+                raise ValueError(f"Miejsce R{seat.row}M{seat.number} nie istnieje w sali {screening.cinema_hall.name}.")
+            indices.append(index)
+        return cls(screening, indices, array('d', [price]) * len(indices), type_code, ticket_class)
+
+    def __len__(self):
+        """
+        Zwraca liczbę biletów w grupie.
+        """
+        return len(self.seat_indices)
+
+    @property
+    def total_price(self):
+        """
+        Łączna cena wszystkich biletów w grupie - suma kolumny cen, bez tworzenia obiektów biletów.
+        """
+        return sum(self.prices)
+
+    def seat(self, position):
+        """
+        Zwraca widok Seat miejsca biletu na podanej pozycji w grupie.
+        """
+        return self.screening.seat_map.seat_at(self.seat_indices[position])
+
+    def seats(self):
+        """
+        Zwraca listę widoków Seat wszystkich miejsc w grupie.
+        """
+        seat_at = self.screening.seat_map.seat_at
+        return [seat_at(index) for index in self.seat_indices]
+
+    def ticket(self, position):
+        """
+        Tworzy obiekt biletu dla pozycji w grupie (lub zwraca już utworzony, jeśli grupa została zmaterializowana).
+        """
+        if self._tickets is not None:
+            return self._tickets[position]
+        return self.ticket_class(self.screening, self.seat(position), self.prices[position])
+
+    def materialize(self):
+        """
+        Tworzy (jednorazowo) i zwraca listę obiektów Ticket dla całej grupy.
+        """
+        if self._tickets is None:
+            ticket_class, screening, seat_at = self.ticket_class, self.screening, self.screening.seat_map.seat_at
+            self._tickets = [ticket_class(screening, seat_at(index), price) for index, price in zip(self.seat_indices, self.prices)]
+        return self._tickets
+
+    def __getitem__(self, position):
+        """
+        Zwraca bilet na podanej pozycji w grupie (obiekt Ticket tworzony na żądanie).
+        """
+        return self.ticket(position)
+
+    def __iter__(self):
+        """
+        Iteruje po obiektach Ticket całej grupy (grupa jest przy tym materializowana).
+        """
+        return iter(self.materialize())
@@ -0,0 +1,171 @@
+import threading  # Import modułu threading do obsługi wątku dostarczającego zdarzenia w tle.
+import time  # Import modułu time do pomiaru opóźnienia dostarczenia zdarzeń.
+from collections import deque  # Import kolejki dwustronnej - ograniczona kolejka zdarzeń oczekujących na dostarczenie.
+
+BLOCK = "block"  # Polityka przeciążenia: wywołujący czeka, aż w kolejce zwolni się miejsce.
+DROP_OLDEST = "drop_oldest"  # Polityka przeciążenia: najstarsze oczekujące zdarzenie jest odrzucane na rzecz nowego.
+DROP_NEW = "drop_new"  # Polityka przeciążenia: nowe zdarzenie jest odrzucane.
+POLICIES = (BLOCK, DROP_OLDEST, DROP_NEW)  # Wszystkie obsługiwane polityki przeciążenia.
+
+class AsyncEventDispatcher:
+    """
+    Asynchroniczny dyspozytor zdarzeń zmian stanu miejsc.
+    Zadania dostarczenia zdarzeń trafiają do ograniczonej kolejki i są wykonywane przez wątek tła, więc czas rezerwacji nie zależy od liczby ani szybkości obserwatorów.
+    Po zapełnieniu kolejki stosowana jest wybrana polityka przeciążenia, a statystyki dostarczania są dostępne przez metodę metrics().
+    """
+
+    DEFAULT_MAX_QUEUE = 1000  # Domyślna maksymalna liczba zdarzeń oczekujących w kolejce.
+    DEFAULT_BLOCK_TIMEOUT = 0.1  # Domyślny maksymalny czas (w sekundach), przez jaki wywołujący czeka na miejsce w kolejce przy polityce BLOCK.
+
+    def __init__(self, max_queue=DEFAULT_MAX_QUEUE, policy=BLOCK, block_timeout=DEFAULT_BLOCK_TIMEOUT):
+        """
+        Inicjalizacja dyspozytora.
+        Konstruktor przyjmuje pojemność kolejki, politykę przeciążenia oraz (dla polityki BLOCK) maksymalny czas oczekiwania na miejsce w kolejce;
+        po jego upływie zdarzenie jest odrzucane, więc wolny obserwator nie zatrzyma wątku zmieniającego stan miejsc (None - czekanie bez limitu).
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Nieznana polityka przeciążenia: {policy}")
+        if max_queue < 1:
+            raise ValueError("Pojemność kolejki musi być dodatnia.")
+        self.max_queue = max_queue  # Maksymalna liczba oczekujących zdarzeń.
+        self.policy = policy  # Polityka stosowana po zapełnieniu kolejki.
+        self.block_timeout = block_timeout  # Maksymalny czas oczekiwania na miejsce w kolejce (None - bez limitu).
+        self._queue = deque()  # Kolejka wpisów (chwila zgłoszenia, zadanie).
+        self._condition = threading.Condition()  # Warunek chroniący kolejkę i liczniki oraz budzący wątek tła i oczekujących.
+        self._in_flight = 0  # Liczba zadań aktualnie wykonywanych przez wątek tła (0 lub 1).
+        self._thread = None  # Wątek tła dostarczający zdarzenia.
+        self._running = False  # Flaga działania wątku tła.
+        self._drain = True  # Czy po zatrzymaniu należy dostarczyć zdarzenia pozostałe w kolejce.
+        self._submitted = 0  # Liczba zdarzeń przyjętych do kolejki.
+        self._delivered = 0  # Liczba zdarzeń dostarczonych obserwatorom.
+        self._dropped = 0  # Liczba zdarzeń odrzuconych z powodu przeciążenia.
+        self._errors = 0  # Liczba zdarzeń, których dostarczenie zakończyło się wyjątkiem obserwatora.
+        self._max_depth = 0  # Największa zaobserwowana długość kolejki.
+        self._total_latency = 0.0  # Suma opóźnień od zgłoszenia do dostarczenia (w sekundach).
+        self._max_latency = 0.0  # Największe zaobserwowane opóźnienie dostarczenia (w sekundach).
+
+    def submit(self, task):
+        """
+        Zgłasza zadanie dostarczenia zdarzenia (funkcję bez argumentów) do wykonania w tle.
+        Jeśli wątek tła nie działa, zadanie jest wykonywane od razu; zwraca False, jeśli zdarzenie zostało odrzucone przez politykę przeciążenia.
+        """
+        with self._condition:
+            if not self._running:
+                run_inline = True
+            else:
+                run_inline = False
+                if len(self._queue) >= self.max_queue and not self._make_room():
+                    self._dropped += 1
+                    return False
+                self._queue.append((time.perf_counter(), task))
+                self._submitted += 1
+                self._max_depth = max(self._max_depth, len(self._queue))
+                self._condition.notify_all()  # Obudzenie wątku tła.
+        if run_inline:
+            self._execute(time.perf_counter(), task)
+        return True
+
+    def _make_room(self):
+        """
+        Prywatna metoda stosująca politykę przeciążenia przy pełnej kolejce (wywoływana pod blokadą).
+        Zwraca True, jeśli w kolejce jest miejsce na nowe zdarzenie.
+        """
+        if self.policy == DROP_NEW:
+            return False
+        if self.policy == DROP_OLDEST:
+            self._queue.popleft()  # Odrzucenie najstarszego oczekującego zdarzenia.
+            self._dropped += 1
+            return True
+        # Polityka BLOCK - czekanie, aż wątek tła zwolni miejsce w kolejce (lub zostanie zatrzymany).
+        return self._condition.wait_for(lambda: len(self._queue) < self.max_queue or not self._running, self.block_timeout) and self._running
+
+    def flush(self, timeout=None):
+        """
+        Czeka, aż wszystkie zgłoszone dotąd zdarzenia zostaną dostarczone.
+        Zwraca True, jeśli kolejka została opróżniona przed upływem czasu oczekiwania.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: (not self._queue and self._in_flight == 0) or self._thread is None, timeout)
+
+    def start(self):
+        """
+        Uruchamia wątek tła dostarczający zdarzenia.
+        """
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._drain = True
+        self._thread = threading.Thread(target=self._run, name="AsyncEventDispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, drain=True):
+        """
+        Zatrzymuje wątek tła i czeka na jego zakończenie.
+        Przy drain=True zdarzenia pozostałe w kolejce są jeszcze dostarczane; w przeciwnym razie są odrzucane.
+        """
+        with self._condition:
+            self._running = False
+            self._drain = drain
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        with self._condition:
+            self._thread = None
+            self._condition.notify_all()  # Obudzenie wątków czekających w flush().
+
+    def metrics(self):
+        """
+        Zwraca słownik ze statystykami dostarczania: liczby zdarzeń przyjętych, dostarczonych, odrzuconych i błędnych,
+        bieżącą i największą długość kolejki oraz średnie i największe opóźnienie dostarczenia w milisekundach.
+        """
+        with self._condition:
+            completed = self._delivered + self._errors
+            return {
+                "submitted": self._submitted,
+                "delivered": self._delivered,
+                "dropped": self._dropped,
+                "errors": self._errors,
+                "queue_depth": len(self._queue),
+                "max_queue_depth": self._max_depth,
+                "avg_latency_ms": (self._total_latency / completed * 1000) if completed else 0.0,
+                "max_latency_ms": self._max_latency * 1000,
+            }
+
+    def _run(self):
+        """
+        Pętla wątku tła: pobieranie kolejnych zadań z kolejki i ich wykonywanie poza blokadą.
+        """
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or not self._running)
+                if not self._queue or (not self._running and not self._drain):
+                    self._dropped += len(self._queue)  # Zatrzymanie bez opróżniania - pozostałe zdarzenia są odrzucane.
+                    self._queue.clear()
+                    return
+                submitted_at, task = self._queue.popleft()
+                self._in_flight = 1
+                self._condition.notify_all()  # Zwolniło się miejsce w kolejce - obudzenie wywołujących z polityką BLOCK.
+            self._execute(submitted_at, task)
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()  # Obudzenie wątków czekających w flush().
+
+    def _execute(self, submitted_at, task):
+        """
+        Prywatna metoda wykonująca zadanie i aktualizująca statystyki; wyjątek obserwatora nie przerywa dostarczania kolejnych zdarzeń.
+        """
+        try:
+            task()
+            failed = False
+        except Exception as e:
+            print(f"Ostrzeżenie: Błąd obserwatora podczas dostarczania zdarzenia: {e}")
+            failed = True
+        latency = time.perf_counter() - submitted_at
+        with self._condition:
+            if failed:
+                self._errors += 1
+            else:
+                self._delivered += 1
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
@@ -0,0 +1,145 @@
+import threading  # Import modułu threading - blokada subskrypcji oraz lokalny stan wątku dla łączenia zdarzeń.
+import weakref  # Import modułu weakref - szyna przechowuje słabe referencje do subskrybentów i seansów.
+from functools import partial  # Import funkcji partial do przygotowania zadania dostarczenia dla dyspozytora asynchronicznego.
+from contextlib import contextmanager  # Import dekoratora contextmanager do zdefiniowania bloku łączenia zdarzeń.
+from observers.seat_observer import SeatChangeEvent  # Import zbiorczego zdarzenia zmiany stanu miejsc.
+from states.seat_state import SEAT_STATES  # Import instancji stanów uporządkowanych według kodów - odtwarzanie stanów utrwalonych w zdarzeniu.
+from models.seat import SeatSnapshot  # Import widoku miejsca z utrwalonym stanem, dostarczanego obserwatorom.
+
+class SeatEventBus:
+    """
+    Szyna zdarzeń zmian stanu miejsc - Singleton.
+    Obserwatorzy subskrybują temat (seans), pojedyncze miejsce seansu albo wszystkie seanse naraz, zamiast rejestrować się osobno w każdym miejscu.
+    Subskrybenci i seanse są przechowywani przez słabe referencje, więc szyna nie przedłuża ich życia.
+    Kontrakt SeatObserver jest zachowany: obserwatorzy seansu otrzymują update_many(event), a obserwatorzy miejsca - update(seat).
+    Stany miejsc są utrwalane w zdarzeniu w chwili publikacji, więc także przy dostarczaniu asynchronicznym obserwator widzi każdą kolejną zmianę.
+    """
+
+    _instance = None  # Prywatne pole statyczne przechowujące jedyną instancję szyny.
+
+    def __new__(cls):
+        """
+        Metoda tworząca nową instancję klasy lub zwracająca istniejącą (implementacja wzorca Singleton).
+        """
+        if cls._instance is None:
+            instance = super(SeatEventBus, cls).__new__(cls)
+            instance._lock = threading.Lock()  # Blokada chroniąca struktury subskrypcji.
+            instance._topics = weakref.WeakKeyDictionary()  # Temat (seans) -> słownik: indeks miejsca lub None (cały seans) -> zbiór subskrybentów.
+            instance._global = weakref.WeakSet()  # Subskrybenci zmian we wszystkich seansach.
+            instance._local = threading.local()  # Stan łączenia zdarzeń, osobny dla każdego wątku.
+            instance._dispatcher = None  # Dyspozytor asynchroniczny (None - zdarzenia dostarczane od razu w wątku zmiany stanu).
+            cls._instance = instance
+        return cls._instance
+
+    def subscribe(self, observer, topic=None, seat_index=None):
+        """
+        Rejestruje obserwatora.
+        Bez tematu - zmiany we wszystkich seansach; z tematem (seansem) - zmiany w tym seansie; z indeksem miejsca - zmiany tylko tego miejsca.
+        Szyna przechowuje słabą referencję, więc wywołujący musi sam utrzymywać obiekt obserwatora przy życiu.
+        """
+        with self._lock:
+            if topic is None:
+                self._global.add(observer)
+                return
+            subscriptions = self._topics.setdefault(topic, {})
+            subscriptions.setdefault(seat_index, weakref.WeakSet()).add(observer)
+
+    def unsubscribe(self, observer, topic=None, seat_index=None):
+        """
+        Wyrejestrowuje obserwatora z podanego tematu (lub z subskrypcji globalnej).
+        """
+        with self._lock:
+            if topic is None:
+                self._global.discard(observer)
+                return
+            subscriptions = self._topics.get(topic)
+            if subscriptions and seat_index in subscriptions:
+                subscriptions[seat_index].discard(observer)
+                if not subscriptions[seat_index]:
+                    del subscriptions[seat_index]  # Usuwanie pustego zbioru, aby słownik pozostał rzadki.
+
+    def set_dispatcher(self, dispatcher):
+        """
+        Ustawia dyspozytora asynchronicznego (np. AsyncEventDispatcher), przez którego dostarczane będą zdarzenia.
+        Przekazanie None przywraca dostarczanie synchroniczne, w wątku wykonującym zmianę stanu miejsc.
+        """
+        self._dispatcher = dispatcher
+
+    def has_subscribers(self, topic):
+        """
+        Sprawdza, czy ktokolwiek nasłuchuje zmian w podanym temacie (lub globalnie).
+        """
+        if self._global:
+            return True
+        subscriptions = self._topics.get(topic)
+        return bool(subscriptions) and any(subscriptions.values())  # Zbiory mogą być puste po usunięciu obserwatorów przez odśmiecacz.
+
+    @contextmanager
+    def batch(self):
+        """
+        Blok łączenia zdarzeń: zmiany opublikowane w bieżącym wątku wewnątrz bloku są dostarczane po jego zakończeniu,
+        jako jedno zdarzenie na seans (powtarzające się miejsca są zgłaszane raz). Bloki można zagnieżdżać.
+        """
+        local = self._local
+        depth = getattr(local, "depth", 0)
+        if depth == 0:
+            local.pending = {}  # Słownik: temat -> (mapa miejsc, słownik indeks -> kod stanu, zachowujący kolejność).
+        local.depth = depth + 1
+        try:
+            yield self
+        finally:
+            local.depth -= 1
+            if local.depth == 0:
+                pending, local.pending = local.pending, None
+                for topic, (seat_map, changes) in pending.items():
+                    self._dispatch(topic, seat_map, tuple(changes), bytes(changes.values()))
+
+    def publish(self, topic, seat_map, indices, codes=None):
+        """
+        Publikuje zmianę stanu miejsc o podanych indeksach w mapie miejsc seansu (temacie) wraz z kodami ich stanów po zmianie
+        (bez podanych kodów - odczytywanymi teraz z mapy miejsc).
+        Wewnątrz bloku batch() zmiana jest odkładana i łączona z kolejnymi (miejsce zgłaszane raz, ze stanem po ostatniej zmianie); poza nim - dostarczana od razu jednym zdarzeniem.
+        """
+        if not self.has_subscribers(topic):
+            return  # Nikt nie nasłuchuje - nie ma potrzeby tworzenia widoków miejsc ani zdarzeń.
+        if codes is None:
+            codes = seat_map.snapshot(indices)  # Utrwalenie stanów w chwili publikacji.
+        local = self._local
+        if getattr(local, "depth", 0) > 0:
+            entry = local.pending.setdefault(topic, (seat_map, {}))
+            for index, code in zip(indices, codes):
+                entry[1][index] = code  # Słownik zachowuje kolejność i usuwa powtórzenia.
+            return
+        self._dispatch(topic, seat_map, tuple(indices), codes)
+
+    def _dispatch(self, topic, seat_map, indices, codes):
+        """
+        Przekazuje zdarzenie do dostarczenia: przez dyspozytora asynchronicznego, jeśli jest ustawiony, lub od razu.
+        Zdarzenie niesie kody stanów z chwili zmiany, więc w trybie asynchronicznym obserwatorzy nie odczytują stanu z chwili dostarczenia.
+        """
+        dispatcher = self._dispatcher
+        if dispatcher is not None:
+            dispatcher.submit(partial(self._deliver, topic, seat_map, indices, codes))
+        else:
+            self._deliver(topic, seat_map, indices, codes)
+
+    def _deliver(self, topic, seat_map, indices, codes):
+        """
+        Dostarcza zdarzenie: obserwatorzy seansu i globalni otrzymują jedno zdarzenie SeatChangeEvent, a obserwatorzy miejsc - update(seat).
+        Miejsca są widokami SeatSnapshot ze stanem utrwalonym w chwili zmiany.
+        """
+        with self._lock:
+            subscriptions = self._topics.get(topic, {})
+            screening_observers = list(subscriptions.get(None, ())) + list(self._global)
+            seat_observers = {index: list(subscriptions[index]) for index in indices if index in subscriptions}
+        if not screening_observers and not seat_observers:
+            return
+        position = seat_map.position
+        seats = [SeatSnapshot(*position(index), seat_map, index, SEAT_STATES[code]) for index, code in zip(indices, codes)]
+        for seat in seats:
+            for observer in seat_observers.get(seat._index, ()):
+                observer.update(seat)
+        if screening_observers:
+            event = SeatChangeEvent(seat_map.screening, seats)
+            for observer in screening_observers:
+                observer.update_many(event)
@@ -14,6 +14,36 @@ class SeatObserver(ABC):
         Przyjmowanie obiektu miejsca, którego stan się zmienił.
         """
         pass # Metoda abstrakcyjna bez implementacji.
+    
+    def update_many(self, event):
+        """
+        Metoda aktualizująca obserwatora o zmianie stanu wielu miejsc jednocześnie.
+        Przyjmowanie zbiorczego zdarzenia SeatChangeEvent; domyślna implementacja wywołuje update() dla każdego zmienionego miejsca.
+        """
+        for seat in event.seats:
+            self.update(seat)
+
+class SeatChangeEvent:
+    """
+    Zbiorcze zdarzenie zmiany stanu miejsc jednego seansu.
+    Przekazywane obserwatorom seansu jednym wywołaniem, niezależnie od liczby zmienionych miejsc.
+    """
+    
+    __slots__ = ("screening", "seats")  # Zdarzenie przechowuje tylko seans i listę zmienionych miejsc.
+    
+    def __init__(self, screening, seats):
+        """
+        Inicjalizacja zdarzenia.
+        Przyjmowanie seansu oraz listy miejsc (widoków Seat), których stan się zmienił.
+        """
+        self.screening = screening  # Seans, którego dotyczy zmiana.
+        self.seats = seats  # Lista miejsc, których stan się zmienił.
+    
+    def __len__(self):
+        """
+        Zwracanie liczby zmienionych miejsc.
+        """
+        return len(self.seats)
 
 class SeatView(SeatObserver):
     """
@@ -36,6 +66,8 @@ class SeatSubject:
     Umożliwianie rejestrowania, wyrejestrowywania i powiadamiania obserwatorów.
     """
     
+    __slots__ = ("_observers",)  # Deklaracja slotów pozwala klasom pochodnym (np. widokom Seat) obejść się bez słownika atrybutów.
+    
     def __init__(self):
         """
         Inicjalizacja obiektu podmiotu.
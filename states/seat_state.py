@@ -1,11 +1,72 @@
 from abc import ABC, abstractmethod  # Importuję klasy bazowe ABC i abstractmethod do tworzenia abstrakcyjnych klas i metod.
 
+# Kody stanów miejsc - zwarta reprezentacja stanu używana przez mapę miejsc seansu (jeden bajt na miejsce).
+FREE_CODE = 0  # Kod stanu "wolne".
+RESERVED_CODE = 1  # Kod stanu "zarezerwowane".
+SOLD_CODE = 2  # Kod stanu "sprzedane".
+HELD_CODE = 3  # Kod stanu "wstrzymane" (czasowa blokada miejsca, zwalniana po upływie ważności).
+
+# Kody akcji wykonywanych na miejscu - indeksy kolumn w tablicy przejść stanów.
+RESERVE_ACTION = 0  # Akcja rezerwacji miejsca.
+CANCEL_ACTION = 1  # Akcja anulowania rezerwacji miejsca.
+SELL_ACTION = 2  # Akcja sprzedaży miejsca.
+HOLD_ACTION = 3  # Akcja czasowego wstrzymania (zablokowania) miejsca.
+CONFIRM_ACTION = 4  # Akcja potwierdzenia blokady przez jej właściciela (wstrzymane -> zarezerwowane).
+
+# Tablica przejść stanów: TRANSITIONS[kod stanu][kod akcji] -> kod nowego stanu lub None, jeśli akcja jest niedozwolona.
+# Z tej samej tablicy korzystają obiekty stanów (wzorzec State) oraz operacje masowe na mapie miejsc seansu.
+TRANSITIONS = (
+    (RESERVED_CODE, None, SOLD_CODE, HELD_CODE, None),  # Wolne: rezerwacja -> zarezerwowane, anulowanie niemożliwe, sprzedaż -> sprzedane, wstrzymanie -> wstrzymane.
+    (None, FREE_CODE, SOLD_CODE, None, None),  # Zarezerwowane: ponowna rezerwacja niemożliwa, anulowanie -> wolne, sprzedaż -> sprzedane.
+    (None, None, None, None, None),  # Sprzedane: żadna akcja nie jest dozwolona.
+    (None, FREE_CODE, None, None, RESERVED_CODE),  # Wstrzymane: rezerwacja i sprzedaż niemożliwe (miejsce chroni blokada), anulowanie (wygaśnięcie) -> wolne, potwierdzenie blokady -> zarezerwowane.
+)
+
 class SeatState(ABC):
     """
     Abstrakcyjny stan miejsca - wzorzec State.
-    Definiuje interfejs dla wszystkich konkretnych stanów miejsca (wolne, zarezerwowane, sprzedane).
+    Definiuje interfejs dla wszystkich konkretnych stanów miejsca (wolne, zarezerwowane, sprzedane, wstrzymane).
+    Stany nie przechowują danych miejsca, dlatego każda klasa stanu ma dokładnie jedną, współdzieloną instancję (wzorzec Flyweight).
     """
     
+    _instances = {}  # Słownik: klasa stanu -> jej jedyna instancja.
+    
+    def __new__(cls):
+        """
+        Zwraca współdzieloną instancję danej klasy stanu, tworząc ją tylko przy pierwszym wywołaniu.
+        Dzięki temu wywołania typu FreeSeatState() nie alokują nowych obiektów przy każdej zmianie stanu.
+        """
+        instance = SeatState._instances.get(cls)
+        if instance is None:
+            instance = super().__new__(cls)
+            SeatState._instances[cls] = instance
+        return instance
+    
+    def hold(self, seat):
+        """
+        Próba czasowego wstrzymania miejsca w danym stanie.
+        Wynik wynika bezpośrednio z tablicy przejść - wstrzymać można tylko wolne miejsce.
+        """
+        return self._transition(seat, HOLD_ACTION)
+    
+    def confirm(self, seat):
+        """
+        Próba potwierdzenia czasowej blokady miejsca przez jej właściciela.
+        Wynik wynika bezpośrednio z tablicy przejść - potwierdzić można tylko wstrzymane miejsce (przechodzi do stanu "zarezerwowane").
+        """
+        return self._transition(seat, CONFIRM_ACTION)
+    
+    def _transition(self, seat, action):
+        """
+        Wykonuje przejście stanu miejsca na podstawie tablicy przejść TRANSITIONS.
+        Zwraca True, jeśli akcja jest dozwolona w tym stanie (miejsce otrzymuje nowy stan), lub False w przeciwnym razie.
+        """
+        new_code = TRANSITIONS[self.code][action]
+        if new_code is None:
+            return False  # Akcja niedozwolona w bieżącym stanie.
+        seat.state = SEAT_STATES[new_code]  # Ustawiam współdzieloną instancję nowego stanu.
+        return True
+    
     @abstractmethod
     def reserve(self, seat):
         """
@@ -50,28 +111,28 @@ class FreeSeatState(SeatState):
     Implementuje zachowanie dla miejsca, które jest wolne i dostępne do rezerwacji lub sprzedaży.
     """
     
+    code = FREE_CODE  # Kod stanu zapisywany w mapie miejsc seansu.
+    
     def reserve(self, seat):
         """
         Rezerwuje wolne miejsce.
         Zmienia stan miejsca na ReservedSeatState.
         """
-        seat.state = ReservedSeatState()  # Ustawiam nowy stan miejsca na ReservedSeatState.
-        return True  # Operacja rezerwacji zakończyła się sukcesem.
+        return self._transition(seat, RESERVE_ACTION)  # Przejście do stanu ReservedSeatState według tablicy przejść.
     
     def cancel(self, seat):
         """
         Próba anulowania rezerwacji wolnego miejsca.
         Anulowanie rezerwacji nie jest możliwe dla miejsca, które już jest wolne.
         """
-        return False  # Operacja anulowania zakończyła się niepowodzeniem.
+        return self._transition(seat, CANCEL_ACTION)  # Tablica przejść nie pozwala na anulowanie w tym stanie - wynik False.
     
     def sell(self, seat):
         """
         Sprzedaje wolne miejsce.
         Zmienia stan miejsca na SoldSeatState.
         """
-        seat.state = SoldSeatState()  # Ustawiam nowy stan miejsca na SoldSeatState.
-        return True  # Operacja sprzedaży zakończyła się sukcesem.
+        return self._transition(seat, SELL_ACTION)  # Przejście do stanu SoldSeatState według tablicy przejść.
     
     def is_available(self):
         """
@@ -92,28 +153,28 @@ class ReservedSeatState(SeatState):
     Implementuje zachowanie dla miejsca, które zostało zarezerwowane.
     """
     
+    code = RESERVED_CODE  # Kod stanu zapisywany w mapie miejsc seansu.
+    
     def reserve(self, seat):
         """
         Próba rezerwacji zarezerwowanego miejsca.
         Nie można zarezerwować miejsca, które już jest zarezerwowane.
         """
-        return False  # Operacja rezerwacji zakończyła się niepowodzeniem.
+        return self._transition(seat, RESERVE_ACTION)  # Tablica przejść nie pozwala na rezerwację w tym stanie - wynik False.
     
     def cancel(self, seat):
         """
         Anuluje rezerwację zarezerwowanego miejsca.
         Zmienia stan miejsca na FreeSeatState.
         """
-        seat.state = FreeSeatState()  # Ustawiam nowy stan miejsca na FreeSeatState.
-        return True  # Operacja anulowania zakończyła się sukcesem.
+        return self._transition(seat, CANCEL_ACTION)  # Przejście do stanu FreeSeatState według tablicy przejść.
     
     def sell(self, seat):
         """
         Sprzedaje zarezerwowane miejsce.
         Zmienia stan miejsca na SoldSeatState.
         """
-        seat.state = SoldSeatState()  # Ustawiam nowy stan miejsca na SoldSeatState.
-        return True  # Operacja sprzedaży zakończyła się sukcesem.
+        return self._transition(seat, SELL_ACTION)  # Przejście do stanu SoldSeatState według tablicy przejść.
     
     def is_available(self):
         """
@@ -134,26 +195,28 @@ class SoldSeatState(SeatState):
     Implementuje zachowanie dla miejsca, które zostało sprzedane.
     """
     
+    code = SOLD_CODE  # Kod stanu zapisywany w mapie miejsc seansu.
+    
     def reserve(self, seat):
         """
         Próba rezerwacji sprzedanego miejsca.
         Nie można zarezerwować miejsca, które zostało sprzedane.
         """
-        return False  # Operacja rezerwacji zakończyła się niepowodzeniem.
+        return self._transition(seat, RESERVE_ACTION)  # Tablica przejść nie pozwala na rezerwację w tym stanie - wynik False.
     
     def cancel(self, seat):
         """
         Próba anulowania rezerwacji sprzedanego miejsca.
         Nie można anulować rezerwacji miejsca, które zostało sprzedane.
         """
-        return False  # Operacja anulowania zakończyła się niepowodzeniem.
+        return self._transition(seat, CANCEL_ACTION)  # Tablica przejść nie pozwala na anulowanie w tym stanie - wynik False.
     
     def sell(self, seat):
         """
         Próba sprzedaży sprzedanego miejsca.
         Nie można sprzedać miejsca, które już zostało sprzedane.
         """
-        return False  # Operacja sprzedaży zakończyła się niepowodzeniem.
+        return self._transition(seat, SELL_ACTION)  # Tablica przejść nie pozwala na sprzedaż w tym stanie - wynik False.
     
     def is_available(self):
         """
@@ -166,4 +229,55 @@ class SoldSeatState(SeatState):
         """
         Zwraca tekstową reprezentację stanu "sprzedane".
         """
-        return "sprzedane"  # Zwracam tekstową nazwę stanu.
\ No newline at end of file
+        return "sprzedane"  # Zwracam tekstową nazwę stanu.
+
+class HeldSeatState(SeatState):
+    """
+    Stan wstrzymanego miejsca.
+    Implementuje zachowanie dla miejsca czasowo zablokowanego (np. w trakcie płatności), które po upływie ważności wraca do stanu wolnego.
+    """
+    
+    code = HELD_CODE  # Kod stanu zapisywany w mapie miejsc seansu.
+    
+    def reserve(self, seat):
+        """
+        Próba rezerwacji wstrzymanego miejsca.
+        Miejsce chroni blokada innego klienta - rezerwacja jest możliwa tylko przez potwierdzenie blokady (confirm).
+        """
+        return self._transition(seat, RESERVE_ACTION)  # Tablica przejść nie pozwala na rezerwację w tym stanie - wynik False.
+    
+    def cancel(self, seat):
+        """
+        Zwalnia wstrzymane miejsce (anulowanie lub wygaśnięcie blokady).
+        Zmienia stan miejsca na FreeSeatState.
+        """
+        return self._transition(seat, CANCEL_ACTION)  # Przejście do stanu FreeSeatState według tablicy przejść.
+    
+    def sell(self, seat):
+        """
+        Próba sprzedaży wstrzymanego miejsca.
+        Nie można sprzedać miejsca zablokowanego dla innego klienta.
+        """
+        return self._transition(seat, SELL_ACTION)  # Tablica przejść nie pozwala na sprzedaż w tym stanie - wynik False.
+    
+    def is_available(self):
+        """
+        Sprawdza czy miejsce w stanie HeldSeatState jest dostępne.
+        Wstrzymane miejsce nie jest dostępne dla innych klientów do czasu wygaśnięcia blokady.
+        """
+        return False  # Zwracam False, ponieważ miejsce jest zablokowane.
+    
+    def __str__(self):
+        """
+        Zwraca tekstową reprezentację stanu "wstrzymane".
+        """
+        return "wstrzymane"  # Zwracam tekstową nazwę stanu.
+
+# Współdzielone instancje stanów (Flyweight).
+FREE_STATE = FreeSeatState()  # Jedyna instancja stanu "wolne".
+RESERVED_STATE = ReservedSeatState()  # Jedyna instancja stanu "zarezerwowane".
+SOLD_STATE = SoldSeatState()  # Jedyna instancja stanu "sprzedane".
+HELD_STATE = HeldSeatState()  # Jedyna instancja stanu "wstrzymane".
+
+# Instancje stanów uporządkowane według kodów - pozwala odczytać obiekt stanu na podstawie kodu zapisanego w mapie miejsc.
+SEAT_STATES = (FREE_STATE, RESERVED_STATE, SOLD_STATE, HELD_STATE)
\ No newline at end of file
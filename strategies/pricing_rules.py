@@ -0,0 +1,147 @@
+import threading  # Import modułu threading - blokada chroniąca listę reguł i pamięć podręczną tabel cen.
+import weakref  # Import modułu weakref - pamięć podręczna nie przedłuża życia seansów.
+from itertools import combinations  # Import funkcji combinations do wyznaczenia wszystkich zestawów dodatków.
+from strategies.pricing_strategy import CompositePricingStrategy  # Import strategii złożonej, która łączy reguły cenowe.
+from decorators.ticket_decorator import ThreeDTicketDecorator, SnackComboTicketDecorator  # Import dekoratorów biletów, których dopłaty trafiają do tabeli cen.
+
+class PriceTable:
+    """
+    Skompilowana tabela cen jednego seansu.
+    Przechowuje cenę bazową po zastosowaniu reguł, ceny poszczególnych typów biletów oraz dopłaty za wszystkie zestawy dodatków,
+    dzięki czemu wycena biletu przy kasie jest odczytem ze słownika zamiast łańcucha wywołań strategii i dekoratorów.
+    """
+
+    def __init__(self, base_price, token, adjusted_price, addons):
+        """
+        Inicjalizacja tabeli cen.
+        Przyjmuje cenę bazową seansu, znacznik ważności tabeli, cenę bazową po zastosowaniu reguł oraz listę klas dekoratorów (dodatków).
+        """
+        self.base_price = base_price  # Cena bazowa seansu, dla której skompilowano tabelę.
+        self.token = token  # Znacznik ważności - tabela jest nieaktualna, gdy znacznik się zmieni.
+        self.adjusted_price = adjusted_price  # Cena bazowa po zastosowaniu wszystkich reguł dotyczących seansu.
+        self._ticket_prices = {}  # Słownik: klasa fabryki biletów -> cena biletu tego typu.
+        self._addon_surcharges = {}  # Słownik: zbiór klas dodatków -> łączna dopłata.
+        for size in range(len(addons) + 1):
+            for combo in combinations(addons, size):
+                self._addon_surcharges[frozenset(combo)] = sum(addon.surcharge for addon in combo)
+
+    def ticket_price(self, ticket_factory):
+        """
+        Zwraca cenę biletu typu tworzonego przez podaną fabrykę.
+        Cena dla danego typu jest obliczana przy pierwszym odczycie i zapamiętywana w tabeli.
+        """
+        factory_class = type(ticket_factory)
+        price = self._ticket_prices.get(factory_class)
+        if price is None:
+            price = self._ticket_prices[factory_class] = self.adjusted_price * ticket_factory.price_multiplier
+        return price
+
+    def price(self, ticket_factory, addons=()):
+        """
+        Zwraca cenę biletu danego typu z podanymi dodatkami (klasami dekoratorów, np. ThreeDTicketDecorator).
+        """
+        surcharge = self._addon_surcharges.get(frozenset(addons))
+        if surcharge is None:
+            surcharge = sum(addon.surcharge for addon in addons)  # Dodatek spoza listy silnika - dopłata liczona wprost.
+        return self.ticket_price(ticket_factory) + surcharge
+
+class PricingRuleEngine:
+    """
+    Silnik reguł cenowych - Singleton.
+    Łączy strategie cenowe (np. weekend, poranek, sala) z mnożnikami typów biletów i dopłatami dekoratorów i kompiluje je w tabelę cen dla każdego seansu.
+    Tabela jest obliczana raz i zapamiętywana; traci ważność po zmianie ceny bazowej seansu, listy reguł lub znacznika reguły zależnej od stanu seansu
+    (np. po przekroczeniu progu zajętości sali przez OccupancyPricingStrategy).
+    """
+
+    _instance = None  # Prywatne pole statyczne przechowujące jedyną instancję silnika.
+
+    def __new__(cls):
+        """
+        Metoda tworząca nową instancję klasy lub zwracająca istniejącą (implementacja wzorca Singleton).
+        """
+        if cls._instance is None:
+            instance = super(PricingRuleEngine, cls).__new__(cls)
+            instance._lock = threading.Lock()  # Blokada chroniąca reguły i pamięć podręczną.
+            instance._rules = CompositePricingStrategy([])  # Reguły cenowe stosowane kolejno.
+            instance._addons = (ThreeDTicketDecorator, SnackComboTicketDecorator)  # Dodatki, których zestawy są wyceniane z góry.
+            instance.version = 0  # Wersja reguł - zwiększana przy każdej zmianie, unieważnia wszystkie tabele.
+            instance._tables = weakref.WeakKeyDictionary()  # Pamięć podręczna: seans -> skompilowana tabela cen.
+            cls._instance = instance
+        return cls._instance
+
+    @property
+    def rules(self):
+        """
+        Zwraca listę aktualnych reguł cenowych (kopię).
+        """
+        return list(self._rules.strategies)
+
+    def add_rule(self, strategy):
+        """
+        Dodaje regułę cenową (strategię) na końcu listy reguł.
+        """
+        with self._lock:
+            self._rules.strategies.append(strategy)
+            self.version += 1
+
+    def remove_rule(self, strategy):
+        """
+        Usuwa regułę cenową z listy reguł (jeśli na niej jest).
+        """
+        with self._lock:
+            if strategy in self._rules.strategies:
+                self._rules.strategies.remove(strategy)
+                self.version += 1
+
+    def clear_rules(self):
+        """
+        Usuwa wszystkie reguły cenowe - ceny biletów wracają do cen bazowych pomnożonych przez mnożniki typów biletów.
+        """
+        with self._lock:
+            self._rules.strategies.clear()
+            self.version += 1
+
+    def set_addons(self, addons):
+        """
+        Ustawia listę dodatków (klas dekoratorów biletów), których zestawy są wyceniane w tabelach cen.
+        """
+        with self._lock:
+            self._addons = tuple(addons)
+            self.version += 1
+
+    def price_table(self, screening):
+        """
+        Zwraca tabelę cen seansu, kompilując ją tylko wtedy, gdy nie ma jej w pamięci podręcznej lub jest nieaktualna.
+        """
+        token = self._cache_token(screening)
+        table = self._tables.get(screening)
+        if table is not None and table.token == token:
+            return table  # Tabela aktualna - odczyt bez ponownego stosowania reguł.
+        with self._lock:
+            token = self._cache_token(screening)
+            table = PriceTable(screening.base_price, token, self._rules.price_for(screening, screening.base_price), self._addons)
+            self._tables[screening] = table
+        return table
+
+    def ticket_price(self, screening, ticket_factory, addons=()):
+        """
+        Zwraca cenę biletu danego typu (i z podanymi dodatkami) na podany seans - odczyt z tabeli cen seansu.
+        """
+        return self.price_table(screening).price(ticket_factory, addons)
+
+    def invalidate(self, screening=None):
+        """
+        Usuwa z pamięci podręcznej tabelę cen podanego seansu lub (bez argumentu) wszystkie tabele.
+        """
+        with self._lock:
+            if screening is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(screening, None)
+
+    def _cache_token(self, screening):
+        """
+        Prywatna metoda wyznaczająca znacznik ważności tabeli cen seansu: cena bazowa, data i godzina seansu, nazwa sali, wersja reguł i znaczniki reguł zależnych od stanu seansu.
+        Data i sala należą do znacznika, bo zależą od nich reguły weekendowe, poranne i dla sal - przeniesienie seansu unieważnia jego tabelę cen.
+        """
+        return (screening.base_price, screening.date_time, screening.cinema_hall.name, self.version, self._rules.cache_token(screening))
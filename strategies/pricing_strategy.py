@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod  # Import bazowych klas ABC i abstractmethod do tworzenia abstrakcyjnych klas i metod.
+from bisect import bisect_right  # Import wyszukiwania binarnego do wyznaczania progu zajętości sali.
 from datetime import datetime  # Import klasy datetime do obsługi daty i czasu (potrzebne do strategii cenowych zależnych od czasu).
 
 class PricingStrategy(ABC):
@@ -14,6 +15,27 @@ class PricingStrategy(ABC):
         Przyjmowanie podstawowej ceny biletu i zwracanie ceny po zastosowaniu strategii.
         """
         pass # Metoda abstrakcyjna bez implementacji.
+    
+    def applies_to(self, screening) -> bool:
+        """
+        Sprawdzanie, czy strategia ma zastosowanie do podanego seansu.
+        Domyślnie strategia dotyczy każdego seansu; strategie zależne od czasu lub sali nadpisują tę metodę.
+        """
+        return True
+    
+    def price_for(self, screening, base_price: float) -> float:
+        """
+        Obliczanie ceny biletu na podany seans.
+        Domyślnie stosowanie calculate_price(), jeśli strategia dotyczy seansu; strategie zależne od stanu seansu nadpisują tę metodę.
+        """
+        return self.calculate_price(base_price) if self.applies_to(screening) else base_price
+    
+    def cache_token(self, screening):
+        """
+        Zwracanie znacznika stanu seansu, od którego zależy cena (None - cena zależy tylko od danych stałych seansu).
+        Zmiana znacznika oznacza, że zapamiętane ceny seansu są nieaktualne.
+        """
+        return None
 
 class RegularPricingStrategy(PricingStrategy):
     """
@@ -40,6 +62,12 @@ class WeekendPricingStrategy(PricingStrategy):
         Zwracanie ceny bazowej powiększonej o 20%.
         """
         return base_price * 1.2  # Zwiększanie ceny bazowej o 20%.
+    
+    def applies_to(self, screening) -> bool:
+        """
+        Sprawdzanie, czy seans odbywa się w weekend (sobota lub niedziela).
+        """
+        return screening.date_time.weekday() >= 5  # Dni tygodnia 5 i 6 to sobota i niedziela.
 
 class MorningPricingStrategy(PricingStrategy):
     """
@@ -47,12 +75,135 @@ class MorningPricingStrategy(PricingStrategy):
     Cena biletu obniżona o 20% na poranne seanse.
     """
     
+    MORNING_END_HOUR = 12  # Godzina, przed którą seans jest uznawany za poranny.
+    
     def calculate_price(self, base_price: float) -> float:
         """
         Obliczanie ceny biletu na poranny seans (20% taniej).
         Zwracanie ceny bazowej pomniejszonej o 20%.
         """
         return base_price * 0.8  # Zmniejszanie ceny bazowej o 20%.
+    
+    def applies_to(self, screening) -> bool:
+        """
+        Sprawdzanie, czy seans zaczyna się rano (przed godziną MORNING_END_HOUR).
+        """
+        return screening.date_time.hour < self.MORNING_END_HOUR
+
+class HallPricingStrategy(PricingStrategy):
+    """
+    Strategia cenowa dla wybranych sal.
+    Cena biletu mnożona przez podany mnożnik dla seansów w salach o podanych nazwach.
+    """
+    
+    def __init__(self, hall_names, multiplier: float):
+        """
+        Inicjalizacja strategii z listą nazw sal i mnożnikiem ceny.
+        """
+        self.hall_names = frozenset(hall_names)  # Nazwy sal, których dotyczy strategia.
+        self.multiplier = multiplier  # Mnożnik ceny bazowej.
+    
+    def calculate_price(self, base_price: float) -> float:
+        """
+        Obliczanie ceny biletu w wybranej sali.
+        """
+        return base_price * self.multiplier  # Mnożenie ceny bazowej przez mnożnik sali.
+    
+    def applies_to(self, screening) -> bool:
+        """
+        Sprawdzanie, czy seans odbywa się w jednej z wybranych sal.
+        """
+        return screening.cinema_hall.name in self.hall_names
+
+class CompositePricingStrategy(PricingStrategy):
+    """
+    Strategia złożona - łączenie wielu strategii cenowych.
+    Strategie są stosowane kolejno, a każda przyjmuje cenę obliczoną przez poprzednią (np. weekend i poranek jednocześnie).
+    """
+    
+    def __init__(self, strategies):
+        """
+        Inicjalizacja strategii złożonej z listą strategii składowych.
+        """
+        self.strategies = list(strategies)  # Strategie składowe w kolejności stosowania.
+    
+    def calculate_price(self, base_price: float) -> float:
+        """
+        Obliczanie ceny biletu przez kolejne zastosowanie wszystkich strategii składowych.
+        """
+        for strategy in self.strategies:
+            base_price = strategy.calculate_price(base_price)
+        return base_price
+    
+    def price_for(self, screening, base_price: float) -> float:
+        """
+        Obliczanie ceny biletu na podany seans z zastosowaniem tylko tych strategii składowych, które go dotyczą.
+        """
+        for strategy in self.strategies:
+            base_price = strategy.price_for(screening, base_price)
+        return base_price
+    
+    def cache_token(self, screening):
+        """
+        Zwracanie krotki znaczników wszystkich strategii składowych (None, jeśli żadna nie zależy od stanu seansu).
+        """
+        tokens = tuple(strategy.cache_token(screening) for strategy in self.strategies)
+        return tokens if any(token is not None for token in tokens) else None
+
+class OccupancyPricingStrategy(PricingStrategy):
+    """
+    Dynamiczna strategia cenowa zależna od zajętości sali.
+    Cena rośnie wraz z zapełnianiem się seansu zgodnie z listą progów (zajętość, mnożnik).
+    Zajętość jest odczytywana z liczników mapy miejsc aktualizowanych przy każdej zmianie stanu miejsca, więc wycena nie wymaga przeglądania miejsc.
+    """
+    
+    DEFAULT_TIERS = ((0.5, 1.1), (0.8, 1.25))  # Domyślne progi: od 50% zajętości +10%, od 80% zajętości +25%.
+    
+    def __init__(self, tiers=DEFAULT_TIERS, screening=None):
+        """
+        Inicjalizacja strategii z listą progów (ułamek zajętości, mnożnik ceny).
+        Opcjonalny seans pozwala używać strategii przez calculate_price() (np. w PricingContext) bez przekazywania seansu przy każdym wywołaniu.
+        """
+        tiers = sorted(tiers)
+        for threshold, multiplier in tiers:
+            if not 0 <= threshold <= 1 or multiplier <= 0:
+                raise ValueError(f"Nieprawidłowy próg zajętości: {threshold}, mnożnik: {multiplier}")
+        self.thresholds = [threshold for threshold, _ in tiers]  # Posortowane progi zajętości.
+        self.multipliers = [1.0] + [multiplier for _, multiplier in tiers]  # Mnożnik dla każdego przedziału (poniżej pierwszego progu - bez zmian).
+        self.screening = screening  # Seans używany przez calculate_price() (może być None).
+    
+    def tier(self, screening) -> int:
+        """
+        Wyznaczanie numeru przedziału cenowego seansu (0 - poniżej pierwszego progu).
+        Zajętość pochodzi z liczników mapy miejsc (O(1)), a przedział jest wyszukiwany binarnie wśród kilku progów.
+        """
+        return bisect_right(self.thresholds, screening.occupancy())
+    
+    def multiplier_for(self, screening) -> float:
+        """
+        Zwracanie mnożnika ceny odpowiadającego bieżącej zajętości seansu.
+        """
+        return self.multipliers[self.tier(screening)]
+    
+    def calculate_price(self, base_price: float) -> float:
+        """
+        Obliczanie ceny biletu dla seansu przekazanego w konstruktorze (bez seansu cena pozostaje bez zmian).
+        """
+        if self.screening is None:
+            return base_price
+        return base_price * self.multiplier_for(self.screening)
+    
+    def price_for(self, screening, base_price: float) -> float:
+        """
+        Obliczanie ceny biletu na podany seans według jego bieżącej zajętości.
+        """
+        return base_price * self.multiplier_for(screening)
+    
+    def cache_token(self, screening):
+        """
+        Zwracanie numeru przedziału cenowego - zapamiętane ceny seansu są przeliczane dopiero po przekroczeniu progu zajętości.
+        """
+        return self.tier(screening)
 
 class PricingContext:
     """
@@ -77,4 +228,11 @@ class PricingContext:
         Obliczanie ceny biletu używając aktualnej strategii.
         Delegowanie obliczenia ceny do obiektu strategii przechowywanego w kontekście.
         """
-        return self.strategy.calculate_price(base_price)  # Wywoływanie metody calculate_price na aktualnej strategii.
\ No newline at end of file
+        return self.strategy.calculate_price(base_price)  # Wywoływanie metody calculate_price na aktualnej strategii.
+    
+    def price_for(self, screening, base_price: float) -> float:
+        """
+        Obliczanie ceny biletu na podany seans używając aktualnej strategii.
+        Pozwala używać strategii zależnych od seansu (np. od dnia tygodnia lub zajętości sali).
+        """
+        return self.strategy.price_for(screening, base_price)
\ No newline at end of file
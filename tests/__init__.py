@@ -0,0 +1,2 @@
+# Plik __init__.py w katalogu tests
+# Oznacza katalog tests jako pakiet Python
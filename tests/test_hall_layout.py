@@ -0,0 +1,40 @@
+import unittest  # Import modułu unittest - testy nie wymagają dodatkowych bibliotek.
+from datetime import datetime
+from models.movie import Movie
+from models.cinema_hall import CinemaHall
+from models.hall_layout import HallLayout
+from models.screening import Screening
+
+class HallLayoutTest(unittest.TestCase):
+    """
+    Testy szablonu układu sali i wyszukiwania bloków sąsiadujących miejsc.
+    """
+
+    def screening(self, hall):
+        """
+        Tworzy seans w podanej sali.
+        """
+        return Screening(Movie("Film", 100, 12), hall, datetime(2026, 1, 1, 18), 20)
+
+    def test_rectangular_hall_has_no_aisles(self):
+        self.assertEqual(HallLayout(8, 10).aisles_after, ())
+        self.assertEqual(HallLayout.rectangular(8, 10).segments(1), ((0, 10),))
+
+    def test_group_larger_than_half_a_row_fits(self):
+        seats = self.screening(CinemaHall("Sala 1", 8, 10)).find_best_available(6)
+        self.assertEqual(len(seats), 6)
+        self.assertEqual(len({seat.row for seat in seats}), 1)
+        self.assertEqual([seat.number for seat in seats], list(range(seats[0].number, seats[0].number + 6)))
+
+    def test_declared_aisle_splits_blocks(self):
+        hall = CinemaHall("Sala 2", 8, 10, layout=HallLayout(8, 10, aisles_after=(5,)))
+        self.assertEqual(self.screening(hall).find_best_available(6), [])
+        self.assertEqual(len(self.screening(hall).find_best_available(5)), 5)
+
+    def test_layout_round_trip(self):
+        layout = HallLayout(8, 10, aisles_after=(3,))
+        self.assertEqual(HallLayout.from_dict(layout.to_dict()).aisles_after, (3,))
+        self.assertIs(HallLayout.from_dict(HallLayout(8, 10).to_dict()), HallLayout.rectangular(8, 10))
+
+if __name__ == "__main__":
+    unittest.main()
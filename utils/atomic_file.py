@@ -0,0 +1,115 @@
+import json  # Import modułu json - kodowanie rekordów w liniach oraz dekodowanie kolejnych elementów uszkodzonej listy JSON.
+import os  # Import modułu os - fsync i atomowa podmiana plików.
+import zlib  # Import modułu zlib - suma kontrolna CRC32 każdego rekordu.
+
+def encode_record(record):
+    """
+    Koduje rekord (dziennika lub migawki) jako jedną linię: suma kontrolna CRC32 (8 cyfr szesnastkowych), spacja i rekord w formacie JSON.
+    """
+    payload = json.dumps(record, ensure_ascii=False)  # Serializacja rekordu do jednej linii JSON.
+    return f"{zlib.crc32(payload.encode('utf-8')):08x} {payload}\n"
+
+def decode_record(line, allow_plain=True):
+    """
+    Dekoduje linię zapisaną funkcją encode_record (lub, przy allow_plain=True, linię samego JSON z wcześniejszych wersji dziennika).
+    Zgłasza ValueError, jeśli suma kontrolna się nie zgadza lub rekord nie jest poprawnym JSON.
+    """
+    if allow_plain and line.startswith("{"):
+        return json.loads(line)  # Rekord bez sumy kontrolnej (dziennik zapisany przez wcześniejszą wersję aplikacji).
+    checksum, _, payload = line.partition(" ")
+    if len(checksum) != 8 or int(checksum, 16) != zlib.crc32(payload.encode('utf-8')):
+        raise ValueError("niezgodna suma kontrolna")
+    return json.loads(payload)
+
+def salvage_json_list(text):
+    """
+    Odzyskuje kolejne kompletne elementy z uszkodzonej (np. urwanej) listy JSON.
+    Elementy są dekodowane po kolei metodą raw_decode; odczyt kończy się na pierwszym niekompletnym elemencie.
+    """
+    decoder = json.JSONDecoder()
+    items = []
+    position = text.find("[") + 1
+    if position == 0:
+        return items  # To nie jest lista JSON - nie ma czego odzyskać.
+    length = len(text)
+    while position < length:
+        while position < length and text[position] in " \t\r\n,":
+            position += 1  # Pominięcie separatorów pomiędzy elementami.
+        if position >= length or text[position] == "]":
+            break
+        try:
+            item, position = decoder.raw_decode(text, position)
+        except json.JSONDecodeError:
+            break  # Niekompletny element - koniec odzyskanych danych.
+        items.append(item)
+    return items
+
+def write_atomically(path, write, binary=False):
+    """
+    Zapisuje plik w sposób odporny na awarie: dane trafiają do pliku tymczasowego, który po fsync zastępuje plik docelowy (os.replace).
+    Po awarii w trakcie zapisu pod ścieżką docelową pozostaje poprzednia, kompletna wersja pliku. Funkcja write otrzymuje otwarty plik (binarny przy binary=True).
+    """
+    temp_path = path + ".tmp"
+    try:
+        with open(temp_path, 'wb') if binary else open(temp_path, 'w', encoding='utf-8') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())  # Dane pliku tymczasowego są na dysku przed podmianą.
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)  # Nieudany zapis - plik docelowy pozostaje bez zmian.
+        raise
+    os.replace(temp_path, path)  # Atomowa podmiana pliku.
+    try:
+        directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        try:
+            os.fsync(directory)  # Utrwalenie samej podmiany (wpisu katalogu).
+        finally:
+            os.close(directory)
+    except OSError:
+        pass  # System bez fsync katalogów (np. Windows) - podmiana i tak jest atomowa.
+
+def write_record_lines(path, records):
+    """
+    Zapisuje atomowo rekordy (dowolny iterowalny strumień słowników) jako linie z sumą kontrolną CRC32 - po jednym rekordzie w linii.
+    Rekordy są kodowane i zapisywane po kolei, bez budowania pełnej listy w pamięci; zwraca liczbę zapisanych rekordów.
+    """
+    count = 0
+    def write(f):
+        nonlocal count
+        for record in records:
+            f.write(encode_record(record))
+            count += 1
+    write_atomically(path, write)
+    return count
+
+def iter_record_lines(path):
+    """
+    Generator zwracający kolejne rekordy pliku zapisanego funkcją write_record_lines, dekodowane strumieniowo.
+    Rekord z niezgodną sumą kontrolną lub urwany jest pomijany z ostrzeżeniem, więc koszt odzyskiwania zależy tylko od uszkodzonych rekordów.
+    Plik w dawnym formacie (lista JSON) jest wczytywany w całości, a z uszkodzonej listy odzyskiwane są wszystkie kompletne elementy.
+    """
+    with open(path, 'rb') as f:
+        first = f.read(64).lstrip()[:1]
+        f.seek(0)
+        if first == b"[":
+            text = f.read().decode('utf-8')
+            try:
+                yield from json.loads(text)  # Dawny format - pełna lista rezerwacji.
+            except json.JSONDecodeError as e:
+                records = salvage_json_list(text)
+                print(f"Ostrzeżenie: Plik {path} jest uszkodzony ({e}), odzyskano {len(records)} rekordów.")
+                yield from records
+            return
+        for line_number, raw_line in enumerate(f, start=1):
+            line = raw_line.strip()
+            if not line:
+                continue  # Pomijanie pustych linii.
+            try:
+                if not raw_line.endswith(b"\n"):
+                    raise ValueError("rekord urwany")
+                record = decode_record(line.decode('utf-8'), allow_plain=False)
+            except ValueError as e:  # Także UnicodeDecodeError i json.JSONDecodeError.
+                print(f"Ostrzeżenie: Pominięto uszkodzony rekord {line_number} w {path}: {e}")
+                continue
+            yield record
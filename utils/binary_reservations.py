@@ -0,0 +1,215 @@
+import argparse  # Import modułu argparse - konwersja plików rezerwacji z wiersza poleceń.
+import struct  # Import modułu struct - rekordy o stałej szerokości.
+import sys  # Import modułu sys - kod wyjścia konwertera.
+import uuid  # Import modułu uuid - identyfikatory rezerwacji zapisywane jako 16 bajtów.
+from datetime import datetime, timedelta  # Import klas datetime i timedelta - daty zapisywane jako mikrosekundy od epoki.
+from utils.atomic_file import write_atomically, write_record_lines, iter_record_lines  # Import atomowego zapisu pliku oraz zapisu i odczytu migawki JSON (linie z sumami kontrolnymi).
+
+MAGIC = b"WSBR"  # Sygnatura pliku w formacie binarnym.
+FORMAT_VERSION = 2  # Wersja formatu binarnego (wersja 2 dodaje rekordy odwołujące się do seansów i miejsc przez identyfikatory).
+SUPPORTED_VERSIONS = (1, 2)  # Wersje formatu binarnego, które można odczytać.
+BINARY_EXTENSION = ".wsbr"  # Rozszerzenie plików rezerwacji w formacie binarnym.
+
+HEADER = struct.Struct("<4sH")  # Nagłówek pliku: sygnatura i wersja formatu.
+STRING = struct.Struct("<cI")  # Definicja napisu w tablicy napisów: znacznik i długość w bajtach (treść w UTF-8 następuje po nim).
+RECORD = struct.Struct("<c16sIIIqdqH")  # Rekord rezerwacji: znacznik, id, napisy (klient, film, sala), data seansu, cena, znacznik czasu, liczba miejsc.
+SEAT = struct.Struct("<HH")  # Miejsce rezerwacji: rząd i numer.
+SCREENING_RECORD = struct.Struct("<c16sIIdqH")  # Rekord rezerwacji w wersji 2: znacznik, id, napis (klient), identyfikator seansu, cena, znacznik czasu, liczba miejsc.
+SEAT_INDEX = struct.Struct("<H")  # Miejsce rezerwacji w wersji 2: pozycja w mapie miejsc seansu.
+COUNT = struct.Struct("<H")  # Liczba miejsc - ostatnie pole obu rodzajów rekordów rezerwacji.
+STRING_TAG = b"S"  # Znacznik definicji napisu.
+RECORD_TAG = b"R"  # Znacznik rekordu rezerwacji w wersji 1 (seans według tytułu filmu, nazwy sali i daty).
+SCREENING_RECORD_TAG = b"V"  # Znacznik rekordu rezerwacji w wersji 2 (seans i miejsca według identyfikatorów).
+STRING_CODE, RECORD_CODE, SCREENING_RECORD_CODE = STRING_TAG[0], RECORD_TAG[0], SCREENING_RECORD_TAG[0]  # Znaczniki jako liczby - porównywane bez tworzenia obiektów bytes.
+
+EPOCH = datetime(1970, 1, 1)  # Początek skali czasu dat zapisywanych w rekordach.
+MICROSECOND = timedelta(microseconds=1)
+READ_CHUNK = 1 << 16  # Rozmiar bloku odczytu pliku binarnego (rekordy są dekodowane z bufora w pamięci).
+
+def is_binary_file(path):
+    """
+    Sprawdza, czy plik rezerwacji jest w formacie binarnym - po sygnaturze na początku pliku lub (dla nieistniejącego pliku) po rozszerzeniu.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except FileNotFoundError:
+        return path.endswith(BINARY_EXTENSION)
+
+def write_reservations(path, records):
+    """
+    Zapisuje rezerwacje (słowniki w formacie Reservation.to_dict, dowolny iterowalny strumień) do pliku binarnego.
+    Tytuły filmów, nazwy sal i nazwiska klientów trafiają do tablicy napisów (każdy napis zapisywany raz, przed pierwszym użyciem),
+    a rezerwacje do rekordów o stałej szerokości z listą miejsc - w wersji 2 (identyfikator seansu i pozycje miejsc) lub, dla słowników
+    w pierwotnym formacie, w wersji 1. Plik jest zapisywany atomowo; zwraca liczbę zapisanych rezerwacji.
+    """
+    strings = {}  # Tablica napisów: napis -> numer.
+    count = 0
+
+    def intern(f, text):
+        number = strings.get(text)
+        if number is None:
+            number = strings[text] = len(strings)
+            encoded = text.encode('utf-8')
+            f.write(STRING.pack(STRING_TAG, len(encoded)))
+            f.write(encoded)
+        return number
+
+    def write(f):
+        nonlocal count
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION))
+        for data in records:
+            customer = intern(f, data['customer_name'])
+            if 'screening_id' in data:
+                seats = data['seats']
+                f.write(SCREENING_RECORD.pack(SCREENING_RECORD_TAG, uuid.UUID(data['id']).bytes, customer, data['screening_id'],
+                                              data['total_price'], _to_micros(data['timestamp']), len(seats)))
+                f.write(struct.pack(f"<{len(seats)}H", *seats))
+                count += 1
+                continue
+            movie = intern(f, data['movie_title'])
+            hall = intern(f, data['hall_name'])
+            seats = data['seats']
+            f.write(RECORD.pack(RECORD_TAG, uuid.UUID(data['id']).bytes, customer, movie, hall,
+                                _to_micros(data['date_time']), data['total_price'], _to_micros(data['timestamp']), len(seats)))
+            f.write(b"".join(SEAT.pack(seat['row'], seat['number']) for seat in seats))
+            count += 1
+
+    write_atomically(path, write, binary=True)
+    return count
+
+def iter_reservations(path):
+    """
+    Generator odczytujący kolejne rezerwacje z pliku binarnego jako słowniki w formacie Reservation.to_dict.
+    Plik jest czytany blokami po READ_CHUNK bajtów, a rekordy dekodowane strumieniowo, bez tworzenia pełnej listy;
+    odczyt urwanego pliku kończy się na ostatnim kompletnym rekordzie (z ostrzeżeniem).
+    """
+    strings = []  # Tablica napisów: numer -> napis.
+    dates = {}  # Pamięć podręczna dat seansów: mikrosekundy -> data w formacie ISO (seanse powtarzają się w wielu rezerwacjach).
+    unpack_record = RECORD.unpack_from
+    unpack_screening_record = SCREENING_RECORD.unpack_from
+    unpack_string = STRING.unpack_from
+    unpack_count = COUNT.unpack_from
+    with open(path, 'rb') as f:
+        header = f.read(HEADER.size)
+        magic, version = HEADER.unpack(header) if len(header) == HEADER.size else (header, None)
+        if magic != MAGIC or version not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Plik {path} nie jest plikiem rezerwacji w formacie binarnym w wersji {FORMAT_VERSION}.")
+        buffer = f.read(READ_CHUNK)
+        offset = 0
+        while True:
+            if offset == len(buffer):
+                buffer = f.read(READ_CHUNK)
+                offset = 0
+                if not buffer:
+                    return  # Koniec pliku.
+            tag = buffer[offset]
+            if tag == SCREENING_RECORD_CODE:
+                end = offset + SCREENING_RECORD.size
+                seats_end = end + SEAT_INDEX.size * unpack_count(buffer, end - COUNT.size)[0] if end <= len(buffer) else end
+                if seats_end > len(buffer):
+                    # Niepełny rekord na końcu bufora - doczytanie kolejnego bloku.
+                    chunk = f.read(max(READ_CHUNK, seats_end - len(buffer)))
+                    if not chunk:
+                        break
+                    buffer = buffer[offset:] + chunk
+                    offset = 0
+                    continue
+                _, id_bytes, customer, screening_id, total_price, timestamp, seat_count = unpack_screening_record(buffer, offset)
+                hex_id = id_bytes.hex()
+                yield {
+                    "version": 2,
+                    "id": f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}",
+                    "customer_name": strings[customer],
+                    "screening_id": screening_id,
+                    "seats": list(struct.unpack_from(f"<{seat_count}H", buffer, end)),
+                    "total_price": total_price,
+                    "timestamp": (EPOCH + timedelta(microseconds=timestamp)).isoformat(),
+                }
+                offset = seats_end
+            elif tag == RECORD_CODE:
+                end = offset + RECORD.size
+                seats_end = end + SEAT.size * unpack_count(buffer, end - COUNT.size)[0] if end <= len(buffer) else end
+                if seats_end > len(buffer):
+                    # Niepełny rekord na końcu bufora - doczytanie kolejnego bloku.
+                    chunk = f.read(max(READ_CHUNK, seats_end - len(buffer)))
+                    if not chunk:
+                        break
+                    buffer = buffer[offset:] + chunk
+                    offset = 0
+                    continue
+                _, id_bytes, customer, movie, hall, date_time, total_price, timestamp, seat_count = unpack_record(buffer, offset)
+                date_text = dates.get(date_time)
+                if date_text is None:
+                    date_text = dates[date_time] = _from_micros(date_time)
+                hex_id = id_bytes.hex()
+                yield {
+                    "id": f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}",
+                    "customer_name": strings[customer],
+                    "movie_title": strings[movie],
+                    "hall_name": strings[hall],
+                    "date_time": date_text,
+                    "seats": [{"row": row, "number": number} for row, number in SEAT.iter_unpack(buffer[end:seats_end])],
+                    "total_price": total_price,
+                    "timestamp": (EPOCH + timedelta(microseconds=timestamp)).isoformat(),
+                }
+                offset = seats_end
+            elif tag == STRING_CODE:
+                end = offset + STRING.size
+                string_end = end + unpack_string(buffer, offset)[1] if end <= len(buffer) else end
+                if string_end > len(buffer):
+                    chunk = f.read(max(READ_CHUNK, string_end - len(buffer)))
+                    if not chunk:
+                        break
+                    buffer = buffer[offset:] + chunk
+                    offset = 0
+                    continue
+                strings.append(buffer[end:string_end].decode('utf-8'))
+                offset = string_end
+            else:
+                print(f"Ostrzeżenie: Nieznany znacznik rekordu w pliku {path}, odczyt przerwany.")
+                return
+    print(f"Ostrzeżenie: Plik {path} jest urwany, wczytano rezerwacje do ostatniego kompletnego rekordu.")
+
+def json_to_binary(json_path, binary_path):
+    """
+    Konwertuje plik rezerwacji JSON (linie z sumami kontrolnymi lub dawna lista słowników) do formatu binarnego; zwraca liczbę rezerwacji.
+    Rekordy są odczytywane strumieniowo; uszkodzone rekordy są pomijane.
+    """
+    return write_reservations(binary_path, iter_record_lines(json_path))
+
+def binary_to_json(binary_path, json_path):
+    """
+    Konwertuje plik rezerwacji w formacie binarnym do formatu migawki JSON (linie z sumami kontrolnymi); zwraca liczbę rezerwacji.
+    """
+    return write_record_lines(json_path, iter_reservations(binary_path))
+
+def _to_micros(iso_text):
+    """
+    Prywatna funkcja zamieniająca datę w formacie ISO na liczbę mikrosekund od początku epoki.
+    """
+    return (datetime.fromisoformat(iso_text) - EPOCH) // MICROSECOND
+
+def _from_micros(micros):
+    """
+    Prywatna funkcja zamieniająca liczbę mikrosekund od początku epoki na datę w formacie ISO.
+    """
+    return (EPOCH + micros * MICROSECOND).isoformat()
+
+def main():
+    """
+    Konwerter plików rezerwacji: kierunek konwersji wynika z formatu pliku wejściowego.
+    """
+    parser = argparse.ArgumentParser(description="Konwersja pliku rezerwacji WSBCinema pomiędzy formatem JSON a binarnym.")
+    parser.add_argument("source", help="plik wejściowy (JSON lub binarny)")
+    parser.add_argument("target", help="plik wyjściowy")
+    args = parser.parse_args()
+    if is_binary_file(args.source):
+        count = binary_to_json(args.source, args.target)
+    else:
+        count = json_to_binary(args.source, args.target)
+    print(f"Skonwertowano {count} rezerwacji: {args.source} -> {args.target}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,20 @@
 import json # Importuję moduł json do pracy z danymi w formacie JSON (serializacja i deserializacja).
 import os # Importuję moduł os do obsługi ścieżek plików i sprawdzania ich istnienia.
-from models.reservation import Reservation # Importuję klasę Reservation, ponieważ będę ją serializować/deserializować.
+import threading # Importuję moduł threading - blokada chroni wspólne listy i dziennik przed równoczesną modyfikacją z wielu wątków.
+from models.reservation import Reservation, RECORD_FORMAT_VERSION # Importuję klasę Reservation, ponieważ będę ją serializować/deserializować, oraz bieżącą wersję zapisu rezerwacji.
 # Importuję klasy modeli, które są agregowane w obiektach Database i Screening.
 from models.movie import Movie
 from models.cinema_hall import CinemaHall
 from models.screening import Screening
-from states.seat_state import FreeSeatState
+from utils.id_registry import IdRegistry # Importuję rejestr nadający filmom, salom i seansom stałe identyfikatory liczbowe.
+from utils.schedule_index import ScheduleIndex, HallIntervalIndex, DEFAULT_CLEANING_MINUTES # Importuję indeks repertuaru (kubełki dzienne i zapytania zakresowe), indeks zajętości sal oraz domyślną przerwę techniczną.
+from models.seat_hold import SeatHold # Importuję klasę SeatHold (czasowa blokada miejsc), ponieważ blokady są zapisywane w dzienniku.
+from utils.hold_scheduler import HoldExpiryScheduler # Importuję harmonogram wygasania blokad miejsc.
+from utils.reservation_journal import ReservationJournal # Importuję dziennik rezerwacji (append-only) używany do trwałego zapisu.
+from utils.write_behind import WriteBehindWriter # Importuję zapis w tle, który zapisuje rekordy dziennika grupami poza wątkiem wywołującym.
+from observers.event_bus import SeatEventBus # Importuję szynę zdarzeń, aby łączyć serie zmian miejsc w jedno zdarzenie na seans.
+
+DEFAULT_RESERVATIONS_FILE = "reservations.json" # Domyślna ścieżka pliku migawki rezerwacji.
 
 class Database:
     """
@@ -34,10 +43,23 @@ class Database:
         Ta metoda jest wywoływana tylko raz, przy pierwszym tworzeniu instancji Singletonu.
         """
         if not self._is_initialized: # Sprawdzam, czy dane nie zostały już zainicjalizowane.
+            self._lock = threading.RLock()  # Blokada bazy danych - krótko chroni listy, indeksy i dziennik; stan miejsc chronią blokady seansów.
+            self._compaction_lock = threading.RLock()  # Blokada kompaktacji - jedna kompaktacja naraz; zajmowana przed blokadą bazy danych, nigdy pod nią.
             self.movies = []  # Inicjalizuję pustą listę do przechowywania obiektów Movie.
             self.cinema_halls = []  # Inicjalizuję pustą listę do przechowywania obiektów CinemaHall.
             self.screenings = []  # Inicjalizuję pustą listę do przechowywania obiektów Screening.
+            self._movies_by_id = IdRegistry("film")  # Rejestr filmów: identyfikator -> obiekt Movie.
+            self._halls_by_id = IdRegistry("sala")  # Rejestr sal: identyfikator -> obiekt CinemaHall.
+            self._screenings_by_id = IdRegistry("seans")  # Rejestr seansów: identyfikator -> obiekt Screening (rezerwacje odwołują się do seansów przez identyfikator).
+            self._screening_index = {}  # Indeks seansów: (tytuł filmu, nazwa sali, data i czas) -> obiekt Screening (wczytywanie zapisu w wersji 1).
+            self.schedule = ScheduleIndex()  # Indeks repertuaru: seanse pogrupowane według dni, filmów i sal.
+            self.hall_intervals = HallIntervalIndex(DEFAULT_CLEANING_MINUTES)  # Indeks zajętości sal - wykrywanie nakładających się seansów.
             self.reservations = []  # Inicjalizuję pustą listę do przechowywania obiektów Reservation.
+            self.persistence = WriteBehindWriter() # Zapis w tle rekordów dziennika (po uruchomieniu metodą start() rezerwacja nie czeka na dysk).
+            self.journal = ReservationJournal(DEFAULT_RESERVATIONS_FILE, writer=self.persistence) # Dziennik, do którego dopisywane są nowe rezerwacje i anulowania.
+            self.holds = {}  # Aktywne czasowe blokady miejsc: identyfikator -> obiekt SeatHold.
+            self.hold_scheduler = HoldExpiryScheduler(self.release_hold)  # Harmonogram zwalniający wygasłe blokady.
+            self.storage = None  # Magazyn danych (np. SQLiteStorage); None - dane przechowywane w pamięci, a rezerwacje w pliku JSON.
             self._is_initialized = True # Ustawiam flagę na True, aby zapobiec ponownej inicjalizacji.
     
     def __init__(self):
@@ -48,40 +70,188 @@ class Database:
          """
          self._initialize() # Wywołuję metodę _initialize() aby upewnić się, że struktury danych są gotowe.
 
+    def set_backend(self, storage):
+        """
+        Ustawia magazyn danych (np. SQLiteStorage) o tym samym interfejsie co baza danych; None przywraca przechowywanie w pamięci.
+        Filmy, sale, seanse i rezerwacje trafiają wtedy do magazynu, a zapytania o nie są kierowane do jego indeksów.
+        Czasowe blokady miejsc nadal zapisuje dziennik - leżący obok pliku magazynu, a nie obok pliku rezerwacji JSON.
+        """
+        with self._lock:
+            self.storage = storage
+            if storage is not None:
+                self.journal = self._open_journal(self._holds_path())
+            else:
+                self.journal.by_id = False # Bez magazynu identyfikatory seansów nie są trwałe.
+
+    def _open_journal(self, filepath):
+        """
+        Tworzy dziennik dla podanego pliku migawki z bieżącym progiem kompaktacji i zapisem w tle.
+        Rekordy odwołują się do seansów przez identyfikatory tylko przy magazynie danych - w pamięci identyfikatory zależą od kolejności
+        tworzenia repertuaru (np. względem bieżącej daty), więc po ponownym uruchomieniu mogłyby wskazywać inny seans.
+        """
+        return ReservationJournal(filepath, self.journal.compact_every, self.persistence, by_id=self.storage is not None)
+
+    def _holds_path(self):
+        """
+        Zwraca ścieżkę migawki blokad miejsc używaną przy magazynie danych (np. wsbcinema_holds.json obok wsbcinema.db).
+        """
+        return os.path.splitext(self.storage.path)[0] + "_holds.json"
+
     def add_movie(self, movie):
         """
         Dodaje obiekt filmu do listy filmów w bazie danych.
-        Metoda przyjmuje obiekt Movie i dodaje go do wewnętrznej listy filmów.
+        Metoda przyjmuje obiekt Movie i dodaje go do wewnętrznej listy filmów, nadając mu kolejny identyfikator (jeśli go jeszcze nie ma).
         """
-        self.movies.append(movie)  # Dodaję obiekt movie do listy self.movies.
+        if self.storage is not None:
+            self.storage.add_movie(movie)
+            return
+        with self._lock:
+            self._movies_by_id.register(movie)  # Nadaję filmowi identyfikator.
+            self.movies.append(movie)  # Dodaję obiekt movie do listy self.movies.
     
     def add_cinema_hall(self, cinema_hall):
         """
         Dodaje obiekt sali kinowej do listy sal w bazie danych.
-        Metoda przyjmuje obiekt CinemaHall i dodaje go do wewnętrznej listy sal.
+        Metoda przyjmuje obiekt CinemaHall i dodaje go do wewnętrznej listy sal, nadając mu kolejny identyfikator (jeśli go jeszcze nie ma).
         """
-        self.cinema_halls.append(cinema_hall)  # Dodaję obiekt cinema_hall do listy self.cinema_halls.
+        if self.storage is not None:
+            self.storage.add_cinema_hall(cinema_hall)
+            return
+        with self._lock:
+            self._halls_by_id.register(cinema_hall)  # Nadaję sali identyfikator.
+            self.cinema_halls.append(cinema_hall)  # Dodaję obiekt cinema_hall do listy self.cinema_halls.
     
     def add_screening(self, screening):
         """
         Dodaje obiekt seansu do listy seansów w bazie danych.
-        Metoda przyjmuje obiekt Screening i dodaje go do wewnętrznej listy seansów.
+        Metoda przyjmuje obiekt Screening i dodaje go do wewnętrznej listy seansów, nadając mu kolejny identyfikator (jeśli go jeszcze nie ma).
+        Zgłasza ValueError, jeśli seans nakłada się (z uwzględnieniem przerwy technicznej) na inny seans w tej samej sali.
+        Identyfikatory są nadawane w kolejności dodawania, więc pozostają stałe, dopóki repertuar jest tworzony w tej samej kolejności.
         """
-        self.screenings.append(screening)  # Dodaję obiekt screening do listy self.screenings.
+        if self.storage is not None:
+            self.storage.add_screening(screening)
+            return
+        with self._lock:
+            self.hall_intervals.add(screening)  # Sprawdzam kolizje w sali - przy kolizji seans nie jest dodawany.
+            self._screenings_by_id.register(screening)  # Nadaję seansowi identyfikator, przez który odwołują się do niego rezerwacje.
+            self.screenings.append(screening)  # Dodaję obiekt screening do listy self.screenings.
+            # Aktualizuję indeks seansów (przy duplikacie klucza zachowuję pierwszy seans, tak jak wcześniejsze wyszukiwanie liniowe).
+            self._screening_index.setdefault(self._screening_key(screening.movie.title, screening.cinema_hall.name, screening.date_time), screening)
+            self.schedule.add(screening)  # Aktualizuję indeks repertuaru.
     
     def add_reservation(self, reservation):
         """
         Dodaje obiekt rezerwacji do listy rezerwacji w bazie danych.
-        Metoda przyjmuje obiekt Reservation i dodaje go do wewnętrznej listy rezerwacji. Po dodaniu zapisuje rezerwacje do pliku.
+        Metoda przyjmuje obiekt Reservation i dodaje go do wewnętrznej listy rezerwacji. Po dodaniu dopisuje rezerwację do dziennika.
+        Przy magazynie danych rezerwacja jest zapisywana w jego transakcji; jeśli miejsca zajęto w międzyczasie (np. w innym procesie),
+        miejsca rezerwacji są zwalniane, a wywołujący otrzymuje ValueError.
+        """
+        if self.storage is not None:
+            try:
+                self.storage.add_reservation(reservation)
+            except ValueError:
+                reservation.screening.cancel_seats(reservation.seats) # Wycofuję rezerwację miejsc w pamięci - baza danych jej nie przyjęła.
+                raise
+            return
+        with self._lock:
+            self.reservations.append(reservation)  # Dodaję obiekt reservation do listy self.reservations.
+            self.journal.append_reservation(reservation) # Dopisuję jeden rekord do dziennika zamiast przepisywać cały plik.
+        self._compact_if_needed() # Co pewną liczbę rekordów zapisuję pełną migawkę i czyszczę dziennik (już poza blokadą bazy danych).
+
+    def cancel_reservation(self, reservation):
+        """
+        Anuluje rezerwację: usuwa ją z listy, zwalnia jej miejsca i dopisuje anulowanie do dziennika.
+        Zwraca True, jeśli rezerwacja została anulowana, lub False, jeśli nie było jej w bazie danych.
+        """
+        with self._lock:
+            if self.storage is not None:
+                if not self.storage.cancel_reservation(reservation): # Usuwam rezerwację i jej miejsca z magazynu danych.
+                    return False
+            elif reservation not in self.reservations:
+                return False
+            else:
+                self.reservations.remove(reservation) # Usuwam rezerwację z listy rezerwacji.
+                self.journal.append_cancellation(reservation.id) # Dopisuję rekord anulowania do dziennika.
+        self._compact_if_needed()
+        # Miejsca zwalniam już poza blokadą bazy danych (pod blokadą seansu), aby nie zagnieżdżać blokad.
+        with SeatEventBus().batch(): # Obserwatorzy seansu otrzymają jedno zdarzenie dla wszystkich zwolnionych miejsc.
+            for seat in reservation.seats:
+                seat.cancel() # Zwalniam miejsca zajęte przez anulowaną rezerwację.
+        return True
+
+    def add_hold(self, hold):
+        """
+        Rejestruje czasową blokadę miejsc: zapisuje ją w dzienniku i w harmonogramie wygasania.
+        Miejsca blokady muszą być już wstrzymane w seansie (Screening.hold_seats).
+        """
+        with self._lock:
+            self.holds[hold.id] = hold
+            self.journal.append_hold(hold) # Blokada przetrwa restart aplikacji, jeśli do tego czasu nie wygaśnie.
+            self.hold_scheduler.schedule(hold)
+        self._compact_if_needed()
+
+    def release_hold(self, hold):
+        """
+        Zwalnia czasową blokadę: miejsca, które nadal są wstrzymane, wracają do stanu "wolne".
+        Metoda jest wywoływana przy anulowaniu blokady oraz przez harmonogram po jej wygaśnięciu.
+        """
+        if not self._end_hold(hold):
+            return False
+        hold.screening.release_held_seats(hold.seats) # Zwolnienie wstrzymanych miejsc jedną operacją zbiorczą.
+        return True
+
+    def complete_hold(self, hold):
+        """
+        Kończy czasową blokadę potwierdzoną rezerwacją lub sprzedażą (miejsca nie są zwalniane).
+        Zwraca False, jeśli blokada nie jest już aktywna (np. zdążyła wygasnąć).
+        """
+        return self._end_hold(hold)
+
+    def get_holds(self):
+        """
+        Zwraca listę aktywnych blokad miejsc.
+        """
+        return list(self.holds.values())
+
+    def _end_hold(self, hold):
+        """
+        Oznacza blokadę jako nieaktywną, usuwa ją z listy aktywnych blokad i dopisuje jej zakończenie do dziennika.
+        """
+        with self._lock:
+            if not hold.active:
+                return False
+            hold.active = False
+            self.holds.pop(hold.id, None)
+            self.journal.append_release(hold.id)
+        self._compact_if_needed()
+        return True
+
+    def flush(self, timeout=None):
         """
-        self.reservations.append(reservation)  # Dodaję obiekt reservation do listy self.reservations.
-        self.save_reservations("reservations.json") # Automatycznie zapisuję rezerwacje do pliku po dodaniu nowej.
+        Bariera trwałości: czeka, aż wszystkie zmiany dopisane do dziennika zostaną zapisane na dysk.
+        Zwraca True, jeśli zapis zakończył się przed upływem czasu oczekiwania.
+        """
+        return self.journal.flush(timeout)
+
+    def _compact_if_needed(self):
+        """
+        Wykonuje kompaktację dziennika, jeśli przekroczył on ustalony próg liczby rekordów.
+        Metoda jest wywoływana poza blokadą bazy danych; jeśli inny wątek właśnie wykonuje kompaktację, nie czeka na nią.
+        """
+        if self.journal.needs_compaction() and self._compaction_lock.acquire(blocking=False):
+            try:
+                if self.journal.needs_compaction(): # Inny wątek mógł właśnie zakończyć kompaktację.
+                    self.save_reservations(self.journal.snapshot_path)
+            finally:
+                self._compaction_lock.release()
     
     def get_movies(self):
         """
         Zwraca listę wszystkich filmów w bazie danych.
         Metoda zwraca wewnętrzną listę obiektów Movie.
         """
+        if self.storage is not None:
+            return self.storage.get_movies()
         return self.movies  # Zwracam listę self.movies.
     
     def get_cinema_halls(self):
@@ -89,6 +259,8 @@ class Database:
         Zwraca listę wszystkich sal kinowych w bazie danych.
         Metoda zwraca wewnętrzną listę obiektów CinemaHall.
         """
+        if self.storage is not None:
+            return self.storage.get_cinema_halls()
         return self.cinema_halls  # Zwracam listę self.cinema_halls.
     
     def get_screenings(self):
@@ -96,6 +268,8 @@ class Database:
         Zwraca listę wszystkich seansów w bazie danych.
         Metoda zwraca wewnętrzną listę obiektów Screening.
         """
+        if self.storage is not None:
+            return self.storage.get_screenings()
         return self.screenings  # Zwracam listę self.screenings.
     
     def get_reservations(self):
@@ -103,74 +277,213 @@ class Database:
         Zwraca listę wszystkich rezerwacji w bazie danych.
         Metoda zwraca wewnętrzną listę obiektów Reservation.
         """
+        if self.storage is not None:
+            return self.storage.get_reservations()
         return self.reservations  # Zwracam listę self.reservations.
     
+    def get_movie(self, movie_id):
+        """
+        Zwraca film o podanym identyfikatorze lub None, jeśli takiego filmu nie ma.
+        """
+        if self.storage is not None:
+            return self.storage.get_movie(movie_id)
+        return self._movies_by_id.get(movie_id)
+
+    def get_cinema_hall(self, hall_id):
+        """
+        Zwraca salę kinową o podanym identyfikatorze lub None, jeśli takiej sali nie ma.
+        """
+        if self.storage is not None:
+            return self.storage.get_cinema_hall(hall_id)
+        return self._halls_by_id.get(hall_id)
+
+    def get_screening(self, screening_id):
+        """
+        Zwraca seans o podanym identyfikatorze lub None, jeśli takiego seansu nie ma.
+        Wyszukiwanie to jedno odwołanie do rejestru seansów - bez porównywania tytułów, nazw sal i dat.
+        """
+        if self.storage is not None:
+            return self.storage.get_screening(screening_id)
+        return self._screenings_by_id.get(screening_id)
+
     def get_screenings_for_date(self, date):
         """
         Zwraca listę seansów zaplanowanych na podaną datę.
-        Metoda filtruje listę wszystkich seansów i zwraca tylko te, których data seansu zgadza się z podaną datą.
+        Metoda odczytuje kubełek seansów danego dnia z indeksu repertuaru (seanse są posortowane według godziny).
         """
-        # Używam list comprehension do stworzenia nowej listy seansów, których data seansu (ignorując czas) jest równa podanej dacie.
-        return [s for s in self.screenings if s.date_time.date() == date]
+        if self.storage is not None:
+            return self.storage.get_screenings_for_date(date) # Zapytanie zakresowe po indeksie daty w magazynie danych.
+        return self.schedule.for_date(date)
+
+    def get_screenings_between(self, start, end, movie_title=None, hall_name=None):
+        """
+        Zwraca listę seansów z podanego zakresu dat, opcjonalnie tylko dla wskazanego filmu i/lub sali.
+        Granice typu date obejmują całe dni, a granice typu datetime tworzą zakres [start, end).
+        """
+        if self.storage is not None:
+            return self.storage.get_screenings_between(start, end, movie_title, hall_name)
+        return self.schedule.between(start, end, movie_title, hall_name)
+
+    def get_screenings_for_movie(self, movie_title):
+        """
+        Zwraca listę wszystkich seansów podanego filmu w porządku chronologicznym.
+        """
+        if self.storage is not None:
+            return self.storage.get_screenings_for_movie(movie_title)
+        return self.schedule.for_movie(movie_title)
+
+    def get_screenings_for_hall(self, hall_name):
+        """
+        Zwraca listę wszystkich seansów w podanej sali w porządku chronologicznym.
+        """
+        if self.storage is not None:
+            return self.storage.get_screenings_for_hall(hall_name)
+        return self.schedule.for_hall(hall_name)
 
     def save_reservations(self, filepath):
         """
-        Zapisuje listę rezerwacji do pliku JSON.
-        Ta metoda serializuje listę obiektów Reservation do formatu JSON i zapisuje ją w podanym pliku.
-        """
-        # Tworzę listę słowników, konwertując każdy obiekt Reservation za pomocą metody to_dict().
-        reservations_data = [r.to_dict() for r in self.reservations]
-        try:
-            # Otwieram plik w trybie zapisu ('w') z kodowaniem UTF-8.
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # Zapisuję listę słowników do pliku w formacie JSON z wcięciami (indent=4) dla czytelności.
-                json.dump(reservations_data, f, indent=4)
-            # Wyświetlam komunikat potwierdzający zapis.
-            print(f"Rezerwacje zapisane do {filepath}")
-        except IOError as e:
-            # W przypadku błędu wejścia/wyjścia (np. brak uprawnień), wyświetlam komunikat o błędzie.
-            print(f"Błąd zapisu rezerwacji do {filepath}: {e}")
+        Zapisuje listę rezerwacji do pliku JSON (migawki).
+        Ta metoda wykonuje kompaktację: serializuje pełną listę rezerwacji do podanego pliku i czyści powiązany z nim dziennik.
+        Przy magazynie danych rezerwacje są już zapisane w magazynie, więc kompaktowany jest tylko dziennik blokad miejsc.
+        Pod blokadą bazy danych kopiowana jest tylko lista rezerwacji i odkładany dziennik; serializacja i zapis migawki na dysk
+        odbywają się poza nią, więc w tym czasie można rezerwować miejsca (nowe rekordy trafiają do nowego dziennika).
+        """
+        with self._compaction_lock:
+            with self._lock:
+                if self.storage is None and filepath != self.journal.snapshot_path:
+                    # Zapis do innego pliku oznacza zmianę miejsca przechowywania - dziennik zostaje powiązany z nowym plikiem.
+                    self.journal = self._open_journal(filepath)
+                journal = self.journal
+                # Kopia listy rezerwacji z chwili odłożenia dziennika (przy magazynie danych migawka nie zawiera rezerwacji - w dzienniku pozostają tylko blokady).
+                reservations = list(self.reservations) if self.storage is None else []
+                try:
+                    journal.begin_compaction() # Odkładam bieżący dziennik - kolejne rekordy trafią do nowego.
+                    for hold in list(self.holds.values()):
+                        journal.append_hold(hold) # Aktywne blokady nie należą do migawki, więc przenoszę je do nowego dziennika.
+                except IOError as e:
+                    print(f"Błąd zapisu rezerwacji do {filepath}: {e}")
+                    return
+            try:
+                journal.finish_compaction(reservations) # Zapisuję pełną migawkę i usuwam odłożony dziennik - już poza blokadą bazy danych.
+                if self.storage is None:
+                    # Wyświetlam komunikat potwierdzający zapis.
+                    print(f"Rezerwacje zapisane do {filepath}")
+            except IOError as e:
+                # W przypadku błędu wejścia/wyjścia (np. brak uprawnień), wyświetlam komunikat o błędzie.
+                # Odłożony dziennik pozostaje na dysku i jest odtwarzany przy wczytywaniu, więc żadna zmiana nie jest tracona.
+                print(f"Błąd zapisu rezerwacji do {filepath}: {e}")
 
     def load_reservations(self, filepath):
         """
-        Wczytuje listę rezerwacji z pliku JSON.
-        Ta metoda odczytuje dane rezerwacji z pliku JSON i deserializuje je z powrotem do listy obiektów Reservation.
+        Wczytuje listę rezerwacji z pliku JSON (migawki) oraz z powiązanego z nim dziennika.
+        Ta metoda odtwarza rekordy dziennika (dodania i anulowania), a następnie strumieniowo deserializuje migawkę do listy obiektów Reservation, pomijając rekordy zmienione w dzienniku.
+        Przy magazynie danych blokady zapisane w pierwotnym formacie (seans według tytułu, sali i daty) są po wczytaniu od razu zapisywane ponownie w bieżącej wersji.
+        Przy magazynie danych rezerwacje są wczytywane z magazynu na żądanie, a z dziennika obok pliku magazynu odtwarzane są tylko blokady miejsc.
         """
-        if not os.path.exists(filepath):
-            # Sprawdzam, czy plik z rezerwacjami istnieje. Jeśli nie, przerywam ładowanie.
-            print(f"Plik {filepath} nie istnieje, nie wczytano rezerwacji.")
-            return
+        legacy_count = 0 # Liczba blokad do przeniesienia do bieżącej wersji formatu - tylko przy magazynie danych (migracja odbywa się po zwolnieniu blokady bazy danych).
+        with self._lock:
+            if self.storage is not None:
+                filepath = self._holds_path() # Plik rezerwacji JSON nie jest używany - rezerwacje są w magazynie danych.
+            self.journal = self._open_journal(filepath) # Kolejne zapisy trafią do dziennika powiązanego z tym plikiem.
+            if not self.journal.exists():
+                # Sprawdzam, czy plik z rezerwacjami lub dziennik istnieje. Jeśli nie, przerywam ładowanie.
+                print(f"Plik {filepath} nie istnieje, nie wczytano rezerwacji.")
+                return
+
+            try:
+                # Najpierw odtwarzam dziennik (jest krótki - czyszczony przy każdej kompaktacji), aby migawkę można było potem czytać strumieniowo.
+                added = {}  # Rezerwacje dodane w dzienniku: identyfikator -> dane rezerwacji (w kolejności dodania).
+                cancelled = set()  # Identyfikatory rezerwacji anulowanych w dzienniku.
+                holds_data = {}  # Blokady miejsc zapisane w dzienniku: identyfikator -> dane blokady.
+                for record in self.journal.replay():
+                    if record.get('op') == "add":
+                        data = record['reservation']
+                        added[data.get('id')] = data
+                        cancelled.discard(data.get('id'))
+                    elif record.get('op') == "cancel":
+                        added.pop(record.get('id'), None)
+                        cancelled.add(record.get('id'))
+                    elif record.get('op') == "hold":
+                        data = record['hold']
+                        holds_data[data.get('id')] = data
+                    elif record.get('op') == "release":
+                        holds_data.pop(record.get('id'), None)
+                # Przy magazynie danych (trwałe identyfikatory) liczę blokady zapisane w pierwotnym formacie - zostaną przeniesione do bieżącej wersji.
+                # W pamięci rekordy pozostają w pierwotnym formacie, bo identyfikatory seansów nie są stałe między uruchomieniami.
+                legacy_count = sum(1 for data in holds_data.values() if 'screening_id' not in data) if self.storage is not None else 0
 
-        try:
-            # Otwieram plik w trybie odczytu ('r') z kodowaniem UTF-8.
-            with open(filepath, 'r', encoding='utf-8') as f:
-                # Wczytuję dane z pliku JSON do listy słowników.
-                reservations_data = json.load(f)
-            
-            # Tworzę nową listę rezerwacji, deserializując każdy słownik za pomocą metody from_dict().
-            # Przekazuję aktualną listę seansów, aby metoda from_dict mogła odtworzyć powiązania z seansami.
-            self.reservations = [Reservation.from_dict(data, self) for data in reservations_data if Reservation.from_dict(data, self) is not None]
-            # Wyświetlam komunikat potwierdzający wczytanie.
-            print(f"Wczytano {len(self.reservations)} rezerwacji z {filepath}")
-        except json.JSONDecodeError as e:
-            # W przypadku błędu dekodowania JSON, wyświetlam komunikat o błędach.
-            print(f"Błąd odczytu rezerwacji z {filepath}: Błąd formatu JSON - {e}")
-        except IOError as e:
-            # W przypadku błędu wejścia/wyjścia, wyświetlam komunikat o błędzie.
-            print(f"Błąd odczytu rezerwacji z {filepath}: {e}")
+                # Deserializuję każdy rekord migawki bezpośrednio z czytnika strumieniowego metodą from_dict() - migawka nie jest wczytywana w całości do pamięci.
+                # Pomijam rezerwacje anulowane w dzienniku oraz te, które dziennik zapisał ponownie (ich aktualne dane dodaję na końcu).
+                # Przekazuję bazę danych, aby metoda from_dict mogła odtworzyć powiązania z seansami.
+                # Zmiany miejsc podczas odtwarzania są łączone w jedno zdarzenie na seans.
+                reservations = []
+                with SeatEventBus().batch():
+                    for data in self.journal.read_snapshot():
+                        if data.get('id') in cancelled or data.get('id') in added:
+                            continue
+                        reservation = Reservation.from_dict(data, self)
+                        if reservation is not None:
+                            reservations.append(reservation)
+                    for data in added.values():
+                        reservation = Reservation.from_dict(data, self)
+                        if reservation is not None:
+                            reservations.append(reservation)
+                self.reservations = reservations
+                # Odtwarzam blokady, które jeszcze nie wygasły (wygasłe pomijam - ich miejsca pozostają wolne).
+                for hold in self.holds.values():
+                    hold.active = False # Blokady sprzed ponownego wczytania nie mogą już zwalniać miejsc.
+                self.holds = {}
+                for data in holds_data.values():
+                    hold = SeatHold.from_dict(data, self)
+                    if hold is not None:
+                        self.holds[hold.id] = hold
+                        self.hold_scheduler.schedule(hold)
+                # Wyświetlam komunikat potwierdzający wczytanie.
+                print(f"Wczytano {len(self.reservations)} rezerwacji z {filepath}")
+            except json.JSONDecodeError as e:
+                # W przypadku błędu dekodowania JSON, wyświetlam komunikat o błędach.
+                print(f"Błąd odczytu rezerwacji z {filepath}: Błąd formatu JSON - {e}")
+            except ValueError as e:
+                # W przypadku nieprawidłowego pliku binarnego (np. nieznana wersja formatu), wyświetlam komunikat o błędzie.
+                print(f"Błąd odczytu rezerwacji z {filepath}: {e}")
+            except IOError as e:
+                # W przypadku błędu wejścia/wyjścia, wyświetlam komunikat o błędzie.
+                print(f"Błąd odczytu rezerwacji z {filepath}: {e}")
+        if legacy_count:
+            # Migracja: kompaktacja zapisuje wszystkie blokady w bieżącej wersji formatu.
+            self.save_reservations(filepath)
+            print(f"Przeniesiono {legacy_count} rekordów do formatu w wersji {RECORD_FORMAT_VERSION}.")
+
+    def find_screening_conflicts(self, screening):
+        """
+        Zwraca listę seansów, z którymi podany seans kolidowałby w swojej sali (pustą, jeśli można go dodać).
+        """
+        if self.storage is not None:
+            return self.storage.find_screening_conflicts(screening)
+        with self._lock:
+            return self.hall_intervals.find_conflicts(screening)
 
     def find_screening(self, movie_title, hall_name, date_time):
         """
         Znajduje seans na podstawie tytułu filmu, nazwy sali i daty/czasu.
+        Wyszukiwanie odbywa się w indeksie seansów, więc nie wymaga przeglądania całej listy.
+        """
+        if self.storage is not None:
+            return self.storage.find_screening(movie_title, hall_name, date_time)
+        return self._screening_index.get(self._screening_key(movie_title, hall_name, date_time))
+
+    @staticmethod
+    def _screening_key(movie_title, hall_name, date_time):
+        """
+        Tworzy klucz indeksu seansów z tytułu filmu, nazwy sali i daty/czasu.
         """
-        for screening in self.screenings:
-            if (screening.movie.title == movie_title and
-                screening.cinema_hall.name == hall_name and
-                screening.date_time == date_time):
-                return screening
-        return None
+        return (movie_title, hall_name, date_time)
 
     def reset_all_seats(self):
-        for screening in self.screenings:
-            for seat in screening.seats:
-                seat.state = FreeSeatState()
\ No newline at end of file
+        """
+        Przywraca wszystkie miejsca we wszystkich seansach do stanu "wolne".
+        Każda mapa miejsc jest czyszczona jedną operacją, bez tworzenia obiektów miejsc i stanów.
+        Przy magazynie danych czyszczone są mapy miejsc seansów z magazynu (rezerwacje zapisane w magazynie pozostają bez zmian).
+        """
+        for screening in self.get_screenings():
+            screening.seat_map.reset()
\ No newline at end of file
@@ -0,0 +1,95 @@
+import heapq  # Import modułu heapq - kopiec (kolejka priorytetowa) uporządkowany według chwili wygaśnięcia blokad.
+import itertools  # Import modułu itertools do generowania numerów kolejnych wpisów (rozstrzyganie remisów w kopcu).
+import threading  # Import modułu threading do obsługi wątku zwalniającego blokady w tle.
+import time  # Import modułu time do odczytu bieżącego czasu.
+
+class HoldExpiryScheduler:
+    """
+    Harmonogram wygasania blokad miejsc oparty na kopcu.
+    Blokady są uporządkowane według chwili wygaśnięcia, więc zwolnienie wygasłych blokad wymaga zdjęcia z kopca tylko ich, bez przeglądania miejsc i pozostałych blokad.
+    """
+
+    def __init__(self, on_expire, clock=time.time):
+        """
+        Inicjalizacja harmonogramu.
+        Konstruktor przyjmuje funkcję wywoływaną dla każdej wygasłej blokady oraz (opcjonalnie) źródło bieżącego czasu.
+        """
+        self._on_expire = on_expire  # Funkcja zwalniająca wygasłą blokadę.
+        self._clock = clock  # Źródło bieżącego czasu (czas uniksowy).
+        self._heap = []  # Kopiec wpisów (chwila wygaśnięcia, numer kolejny, blokada).
+        self._counter = itertools.count()  # Numery kolejne zapewniają stabilną kolejność blokad o tej samej chwili wygaśnięcia.
+        self._lock = threading.Lock()  # Blokada chroniąca kopiec przed równoczesną modyfikacją.
+        self._wakeup = threading.Event()  # Zdarzenie budzące wątek tła (nowa, wcześniejsza blokada lub zatrzymanie).
+        self._thread = None  # Wątek tła zwalniający blokady.
+        self._running = False  # Flaga działania wątku tła.
+
+    def __len__(self):
+        """
+        Zwraca liczbę wpisów w harmonogramie (w tym wpisów blokad już potwierdzonych, które zostaną pominięte).
+        """
+        return len(self._heap)
+
+    def schedule(self, hold):
+        """
+        Dodaje blokadę do harmonogramu w czasie O(log n).
+        """
+        with self._lock:
+            heapq.heappush(self._heap, (hold.expires_at, next(self._counter), hold))
+            is_earliest = self._heap[0][2] is hold
+        if is_earliest:
+            self._wakeup.set()  # Nowa blokada wygasa najwcześniej - wątek tła musi przeliczyć czas oczekiwania.
+
+    def next_deadline(self):
+        """
+        Zwraca chwilę wygaśnięcia najwcześniejszej blokady lub None, jeśli harmonogram jest pusty.
+        """
+        with self._lock:
+            return self._heap[0][0] if self._heap else None
+
+    def release_expired(self, now=None):
+        """
+        Zwalnia wszystkie blokady, których czas ważności minął, i zwraca ich listę.
+        Blokady nieaktywne (potwierdzone lub zwolnione wcześniej) są jedynie usuwane z kopca.
+        """
+        now = now if now is not None else self._clock()
+        expired = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                hold = heapq.heappop(self._heap)[2]
+                if hold.active:
+                    expired.append(hold)
+        for hold in expired:
+            self._on_expire(hold)  # Zwolnienie miejsc odbywa się poza blokadą kopca.
+        return expired
+
+    def start(self, max_interval=1.0):
+        """
+        Uruchamia wątek tła, który zwalnia blokady niezwłocznie po ich wygaśnięciu.
+        Wątek śpi do chwili wygaśnięcia najwcześniejszej blokady (nie dłużej niż max_interval sekund).
+        """
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, args=(max_interval,), name="HoldExpiryScheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Zatrzymuje wątek tła i czeka na jego zakończenie.
+        """
+        self._running = False
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, max_interval):
+        """
+        Pętla wątku tła: zwolnienie wygasłych blokad i oczekiwanie do kolejnej chwili wygaśnięcia.
+        """
+        while self._running:
+            self._wakeup.clear()  # Czyszczenie przed obliczeniem czasu oczekiwania, aby nie przeoczyć nowej blokady.
+            self.release_expired()
+            deadline = self.next_deadline()
+            timeout = max_interval if deadline is None else min(max_interval, max(0.0, deadline - self._clock()))
+            self._wakeup.wait(timeout)
@@ -0,0 +1,40 @@
+class IdRegistry:
+    """
+    Rejestr obiektów modelu (filmów, sal, seansów) według stałych identyfikatorów liczbowych.
+    Obiekt bez identyfikatora otrzymuje przy rejestracji kolejny wolny numer, a obiekt z nadanym już identyfikatorem
+    (np. wczytany z bazy SQLite) zachowuje go; wyszukiwanie po identyfikatorze to jedno odwołanie do słownika.
+    """
+
+    def __init__(self, kind):
+        """
+        Inicjalizacja pustego rejestru.
+        Konstruktor przyjmuje nazwę rodzaju obiektów (np. "seans") używaną w komunikatach o błędach.
+        """
+        self.kind = kind  # Rodzaj obiektów w rejestrze.
+        self._objects = {}  # Słownik: identyfikator -> obiekt.
+        self._next_id = 1  # Najmniejszy identyfikator większy od wszystkich dotąd zarejestrowanych.
+
+    def register(self, obj):
+        """
+        Rejestruje obiekt, nadając mu identyfikator, jeśli go jeszcze nie ma, i zwraca ten identyfikator.
+        Zgłasza ValueError, jeśli identyfikator obiektu jest już zajęty przez inny obiekt.
+        """
+        if obj.id is None:
+            obj.id = self._next_id
+        elif self._objects.get(obj.id, obj) is not obj:
+            raise ValueError(f"Identyfikator {obj.id} jest już przypisany do innego obiektu ({self.kind}).")
+        self._objects[obj.id] = obj
+        self._next_id = max(self._next_id, obj.id + 1)
+        return obj.id
+
+    def get(self, obj_id):
+        """
+        Zwraca obiekt o podanym identyfikatorze lub None, jeśli nie jest zarejestrowany.
+        """
+        return self._objects.get(obj_id)
+
+    def __len__(self):
+        """
+        Zwraca liczbę zarejestrowanych obiektów.
+        """
+        return len(self._objects)
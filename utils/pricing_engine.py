@@ -0,0 +1,68 @@
+from array import array  # Import typu array - zwarte wektory liczb zmiennoprzecinkowych (ceny jednostkowe, liczby miejsc).
+from states.seat_state import RESERVED_CODE, SOLD_CODE  # Import kodów stanów miejsc, które są liczone jako zajęte (szacunkowa wartość miejsc).
+
+class BatchPricingEngine:
+    """
+    Silnik wsadowej wyceny biletów.
+    Oblicza ceny dla wielu miejsc, typów biletów i seansów jednym przejściem po wektorach cen jednostkowych (odczytanych z tabel cen seansów),
+    bez tworzenia obiektów Ticket - bilety powstają dopiero przy zatwierdzaniu rezerwacji.
+    """
+
+    def unit_prices(self, screenings, ticket_factories):
+        """
+        Zwraca macierz cen jednostkowych: jeden wiersz (array) na seans, jedna kolumna na fabrykę biletów (w kolejności podanej listy).
+        """
+        ticket_factories = list(ticket_factories)
+        return [array('d', (factory.unit_price(screening) for factory in ticket_factories)) for screening in screenings]
+
+    def quote(self, screening, seat_count, ticket_factory):
+        """
+        Zwraca łączną cenę seat_count biletów danego typu na podany seans.
+        """
+        return ticket_factory.unit_price(screening) * seat_count
+
+    def quote_options(self, screening, seat_count, ticket_options):
+        """
+        Wycenia seat_count miejsc dla wszystkich typów biletów naraz.
+        Przyjmuje słownik: nazwa typu biletu -> fabryka i zwraca słownik: nazwa typu biletu -> łączna cena.
+        """
+        names = list(ticket_options)
+        row = self.unit_prices((screening,), [ticket_options[name] for name in names])[0]
+        return {name: price * seat_count for name, price in zip(names, row)}
+
+    def revenue_by_screening(self, screenings, reservations):
+        """
+        Zwraca wektor (array) przychodu dla każdego z podanych seansów: sumę cen (total_price) rezerwacji na ten seans.
+        Przychód uwzględnia ceny faktycznie naliczone przy rezerwacji - różne typy biletów, progi obłożenia i reguły czasowe.
+        """
+        screenings = list(screenings)
+        positions = {id(screening): position for position, screening in enumerate(screenings)}  # Seans -> pozycja w wektorze wyniku.
+        totals = array('d', bytes(8 * len(screenings)))  # Wektor zer.
+        for reservation in reservations:
+            position = positions.get(id(reservation.screening))
+            if position is not None:
+                totals[position] += reservation.total_price
+        return totals
+
+    def revenue(self, screenings, reservations):
+        """
+        Zwraca łączny przychód z rezerwacji na podane seanse (np. wszystkie seanse jednego dnia).
+        """
+        return sum(self.revenue_by_screening(screenings, reservations))
+
+    def projected_value_by_screening(self, screenings, ticket_factory):
+        """
+        Zwraca wektor (array) szacunkowej wartości zajętych miejsc (zarezerwowanych i sprzedanych) dla każdego z podanych seansów:
+        bieżąca cena jednostkowa danego typu biletu razy liczba zajętych miejsc. To nie jest przychód - rezerwacje mogły zostać
+        dokonane po innych cenach lub na inne typy biletów. Liczby zajętych miejsc pochodzą z liczników map miejsc.
+        """
+        screenings = list(screenings)  # Seanse są przeglądane dwukrotnie (ceny i liczniki), więc generator zamieniam na listę.
+        prices = array('d', (ticket_factory.unit_price(screening) for screening in screenings))  # Wektor cen jednostkowych (odczyty z tabel cen).
+        occupied = array('d', (screening.seat_map.count(RESERVED_CODE) + screening.seat_map.count(SOLD_CODE) for screening in screenings))
+        return array('d', (price * count for price, count in zip(prices, occupied)))
+
+    def projected_value(self, screenings, ticket_factory):
+        """
+        Zwraca łączną szacunkową wartość zajętych miejsc podanych seansów według bieżącej ceny danego typu biletu.
+        """
+        return sum(self.projected_value_by_screening(screenings, ticket_factory))
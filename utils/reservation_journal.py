@@ -0,0 +1,182 @@
+import os  # Import modułu os do obsługi ścieżek plików i sprawdzania ich istnienia.
+from utils.atomic_file import encode_record, decode_record, write_record_lines, iter_record_lines  # Import kodowania rekordów z sumą kontrolną CRC32 oraz zapisu i odczytu plików z takimi rekordami.
+from utils import binary_reservations  # Import formatu binarnego - migawka może być zapisana w formacie JSON lub binarnym.
+
+class ReservationJournal:
+    """
+    Dziennik rezerwacji (append-only) połączony z plikiem migawki (snapshot).
+    Każda nowa rezerwacja lub anulowanie jest dopisywane na końcu dziennika jako jeden rekord, więc koszt zapisu nie zależy od liczby wszystkich rezerwacji.
+    Co pewną liczbę rekordów dziennik jest kompaktowany: pełna lista rezerwacji trafia do migawki, a dziennik jest czyszczony.
+    Rekordy dziennika mają sumy kontrolne, a migawka jest podmieniana atomowo, więc awaria w trakcie zapisu nie niszczy wcześniej zapisanych danych.
+    """
+
+    DEFAULT_COMPACT_EVERY = 500  # Domyślna liczba rekordów w dzienniku, po której wykonywana jest kompaktacja.
+
+    def __init__(self, snapshot_path, compact_every=DEFAULT_COMPACT_EVERY, writer=None, by_id=False):
+        """
+        Inicjalizacja dziennika.
+        Konstruktor przyjmuje ścieżkę pliku migawki (np. reservations.json); plik dziennika leży obok niego z rozszerzeniem .journal.
+        Opcjonalny obiekt zapisu w tle (WriteBehindWriter) przejmuje dopisywanie rekordów, które są wtedy zapisywane grupami.
+        Flaga by_id włącza zapis seansów przez identyfikatory - wolno jej użyć tylko wtedy, gdy identyfikatory są trwałe (magazyn SQLite).
+        """
+        self.snapshot_path = snapshot_path  # Ścieżka pliku migawki z pełną listą rezerwacji.
+        self.journal_path = os.path.splitext(snapshot_path)[0] + ".journal"  # Ścieżka pliku dziennika, np. reservations.journal.
+        self.compacting_path = self.journal_path + ".compacting"  # Dziennik odłożony na czas kompaktacji (jego rekordy trafiają do nowej migawki).
+        self.compact_every = compact_every  # Próg liczby rekordów, po którym należy wykonać kompaktację.
+        self.pending_records = 0  # Liczba rekordów dopisanych do dziennika od ostatniej kompaktacji.
+        self.writer = writer  # Zapis w tle (None - każdy rekord jest zapisywany od razu).
+        self.by_id = by_id  # Czy rekordy odwołują się do seansów przez identyfikatory (wersja 2), czy przez tytuł, salę i datę (wersja 1).
+
+    def append(self, record):
+        """
+        Dopisuje pojedynczy rekord na końcu dziennika.
+        Rekord jest zapisywany jako jedna linia JSON, bez przepisywania wcześniejszej zawartości pliku (przy zapisie w tle - w najbliższej grupie).
+        """
+        line = encode_record(record)  # Linia z sumą kontrolną rekordu.
+        if self.writer is not None:
+            self.writer.submit(self.journal_path, line)  # Rekord trafia do kolejki zapisu w tle.
+        else:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(line)  # Dopisanie rekordu na końcu pliku.
+        self.pending_records += 1  # Zwiększenie licznika rekordów od ostatniej kompaktacji.
+
+    def flush(self, timeout=None):
+        """
+        Czeka, aż wszystkie dopisane rekordy zostaną zapisane na dysk (bariera trwałości); bez zapisu w tle rekordy są już zapisane.
+        """
+        return self.writer.flush(timeout) if self.writer is not None else True
+
+    def append_reservation(self, reservation):
+        """
+        Dopisuje do dziennika rekord nowej rezerwacji.
+        """
+        self.append({"op": "add", "reservation": reservation.to_dict(self.by_id)})
+
+    def append_cancellation(self, reservation_id):
+        """
+        Dopisuje do dziennika rekord anulowania rezerwacji o podanym identyfikatorze.
+        """
+        self.append({"op": "cancel", "id": reservation_id})
+
+    def append_hold(self, hold):
+        """
+        Dopisuje do dziennika rekord czasowej blokady miejsc.
+        """
+        self.append({"op": "hold", "hold": hold.to_dict(self.by_id)})
+
+    def append_release(self, hold_id):
+        """
+        Dopisuje do dziennika rekord zakończenia blokady (zwolnienie, wygaśnięcie lub potwierdzenie rezerwacją).
+        """
+        self.append({"op": "release", "id": hold_id})
+
+    def needs_compaction(self):
+        """
+        Sprawdza, czy dziennik urósł na tyle, że należy wykonać kompaktację.
+        """
+        return self.pending_records >= self.compact_every
+
+    def exists(self):
+        """
+        Sprawdza, czy istnieje plik migawki lub plik dziennika (także dziennik odłożony przez przerwaną kompaktację).
+        """
+        return any(os.path.exists(path) for path in (self.snapshot_path, self.journal_path, self.compacting_path))
+
+    def read_snapshot(self):
+        """
+        Zwraca strumień (generator) słowników rezerwacji z pliku migawki - z linii JSON z sumami kontrolnymi lub z formatu binarnego.
+        Zwraca pustą listę, jeśli migawka jeszcze nie istnieje. Rekordy uszkodzonej migawki z niezgodną sumą kontrolną są pomijane z ostrzeżeniem;
+        migawka w dawnym formacie (lista JSON) jest wczytywana w całości i przy najbliższej kompaktacji zapisywana ponownie jako linie.
+        """
+        if not os.path.exists(self.snapshot_path):
+            return []
+        if binary_reservations.is_binary_file(self.snapshot_path):
+            return binary_reservations.iter_reservations(self.snapshot_path)  # Rekordy dekodowane strumieniowo, bez pełnej listy.
+        return iter_record_lines(self.snapshot_path)  # Rekordy dekodowane i sprawdzane strumieniowo, po jednym w linii.
+
+    def replay(self):
+        """
+        Generator zwracający kolejne rekordy zapisane w dzienniku od ostatniej kompaktacji - najpierw z dziennika odłożonego przez
+        niedokończoną kompaktację, potem z bieżącego. Rekordy z niezgodną sumą kontrolną lub urwane (bez końca linii) są pomijane z ostrzeżeniem;
+        uszkodzony koniec dziennika, pozostawiony przez awarię w trakcie zapisu, jest obcinany, aby kolejne rekordy nie zostały do niego doklejone.
+        """
+        self.flush()  # Odczyt obejmuje także rekordy oczekujące na zapis w tle.
+        self.pending_records = 0  # Licznik odzwierciedla liczbę rekordów faktycznie obecnych w dzienniku.
+        for path in (self.compacting_path, self.journal_path):
+            yield from self._replay_file(path)
+
+    def _replay_file(self, path):
+        """
+        Prywatny generator odczytujący rekordy jednego pliku dziennika (z pominięciem uszkodzonych i obcięciem uszkodzonego końca).
+        """
+        if not os.path.exists(path):
+            return
+        valid_end = 0  # Pozycja za ostatnim poprawnym rekordem - dalsza część pliku to uszkodzony koniec.
+        position = 0
+        with open(path, 'rb') as f:
+            for line_number, raw_line in enumerate(f, start=1):
+                position += len(raw_line)
+                line = raw_line.strip()
+                if not line:
+                    continue  # Pomijanie pustych linii.
+                try:
+                    if not raw_line.endswith(b"\n"):
+                        raise ValueError("rekord urwany")
+                    record = decode_record(line.decode('utf-8'))
+                except ValueError as e:  # Także UnicodeDecodeError i json.JSONDecodeError.
+                    print(f"Ostrzeżenie: Pominięto uszkodzony rekord {line_number} w {path}: {e}")
+                    continue
+                valid_end = position
+                self.pending_records += 1
+                yield record
+        if position > valid_end:
+            with open(path, 'r+b') as f:
+                f.truncate(valid_end)  # Obcięcie uszkodzonego końca dziennika.
+            print(f"Ostrzeżenie: Obcięto uszkodzony koniec dziennika {path} ({position - valid_end} B).")
+
+    def begin_compaction(self):
+        """
+        Rozpoczyna kompaktację: bieżący dziennik jest odkładany (zmiana nazwy), a kolejne rekordy trafiają do nowego, pustego dziennika.
+        Wywołujący musi na czas tej metody wstrzymać dopisywanie rekordów i w tej samej chwili skopiować listę rezerwacji,
+        którą następnie przekazuje do finish_compaction() - zapis migawki może się wtedy odbywać bez blokowania kolejnych zmian.
+        """
+        if os.path.exists(self.compacting_path):
+            # Poprzednia kompaktacja nie została dokończona - rekordy bieżącego dziennika dopisuję do odłożonego, zachowując kolejność.
+            self.flush()
+            if os.path.exists(self.journal_path):
+                with open(self.journal_path, 'rb') as source, open(self.compacting_path, 'ab') as target:
+                    target.write(source.read())
+                os.remove(self.journal_path)
+        elif os.path.exists(self.journal_path):
+            os.replace(self.journal_path, self.compacting_path)
+        self.pending_records = 0  # Nowy dziennik zaczyna się od zera.
+
+    def finish_compaction(self, reservations):
+        """
+        Kończy kompaktację: zapisuje migawkę (w formacie JSON lub binarnym - według sygnatury istniejącego pliku albo rozszerzenia .wsbr)
+        z rezerwacji skopiowanych przy begin_compaction() i usuwa odłożony dziennik, którego rekordy są już w migawce.
+        Rekordy dopisane po begin_compaction() pozostają w nowym dzienniku (ponowne odtworzenie rekordu obecnego już w migawce niczego nie zmienia).
+        """
+        if binary_reservations.is_binary_file(self.snapshot_path):
+            binary_reservations.write_reservations(self.snapshot_path, (r.to_dict(self.by_id) for r in reservations))  # Migawka binarna, zapisywana strumieniowo.
+        else:
+            self._compact_json(reservations)
+        if os.path.exists(self.compacting_path):
+            os.remove(self.compacting_path)
+
+    def compact(self, reservations):
+        """
+        Zapisuje pełną listę rezerwacji do migawki (w formacie JSON lub binarnym - według sygnatury istniejącego pliku albo rozszerzenia .wsbr) i czyści dziennik.
+        Po kompaktacji wczytanie danych wymaga odczytu samej migawki, a dziennik zaczyna się od zera.
+        Rekordy oczekujące na zapis w tle są najpierw zapisywane, aby nie trafiły do dziennika już po jego usunięciu.
+        """
+        self.flush()
+        self.begin_compaction()
+        self.finish_compaction(reservations)
+
+    def _compact_json(self, reservations):
+        """
+        Prywatna metoda zapisująca migawkę w formacie JSON - po jednym rekordzie rezerwacji w linii, z sumą kontrolną CRC32 (jak rekordy dziennika).
+        """
+        # Zapis strumieniowy przez plik tymczasowy - awaria nie uszkodzi poprzedniej migawki.
+        write_record_lines(self.snapshot_path, (r.to_dict(self.by_id) for r in reservations))
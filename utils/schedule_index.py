@@ -0,0 +1,171 @@
+from bisect import bisect_left, bisect_right  # Import funkcji wyszukiwania binarnego do zapytań zakresowych po posortowanych listach.
+from datetime import datetime, time, timedelta  # Import typów daty i czasu do normalizacji granic zakresów.
+
+DEFAULT_CLEANING_MINUTES = 15  # Domyślna przerwa techniczna (sprzątanie sali) po każdym seansie, w minutach - wspólna dla bazy w pamięci i magazynu SQLite.
+
+class _SortedScreenings:
+    """
+    Pomocnicza lista seansów posortowana według daty i czasu.
+    Przechowuje równoległe listy czasów i seansów, aby zapytania zakresowe można było wykonywać wyszukiwaniem binarnym.
+    """
+
+    def __init__(self):
+        """
+        Inicjalizacja pustej posortowanej listy seansów.
+        """
+        self.times = []  # Posortowana lista dat i czasów seansów.
+        self.items = []  # Seanse w tej samej kolejności co lista times.
+
+    def add(self, screening):
+        """
+        Wstawia seans w odpowiednie miejsce, zachowując porządek chronologiczny.
+        Seanse o tym samym czasie zachowują kolejność dodawania.
+        """
+        position = bisect_right(self.times, screening.date_time)  # Wyszukanie pozycji wstawienia za seansami o tym samym czasie.
+        self.times.insert(position, screening.date_time)
+        self.items.insert(position, screening)
+
+    def between(self, start, end):
+        """
+        Zwraca seanse, których data i czas mieszczą się w zakresie [start, end).
+        """
+        return self.items[bisect_left(self.times, start):bisect_left(self.times, end)]
+
+class ScheduleIndex:
+    """
+    Indeks repertuaru seansów.
+    Utrzymuje kubełki seansów dla poszczególnych dni oraz posortowane listy (globalną, per film i per sala) do zapytań zakresowych.
+    """
+
+    def __init__(self):
+        """
+        Inicjalizacja pustego indeksu repertuaru.
+        """
+        self._by_date = {}  # Słownik: data -> posortowana lista seansów w tym dniu.
+        self._all = _SortedScreenings()  # Wszystkie seanse w porządku chronologicznym.
+        self._by_movie = {}  # Słownik: tytuł filmu -> posortowana lista seansów tego filmu.
+        self._by_hall = {}  # Słownik: nazwa sali -> posortowana lista seansów w tej sali.
+
+    def add(self, screening):
+        """
+        Dodaje seans do wszystkich struktur indeksu.
+        """
+        self._by_date.setdefault(screening.date_time.date(), _SortedScreenings()).add(screening)
+        self._all.add(screening)
+        self._by_movie.setdefault(screening.movie.title, _SortedScreenings()).add(screening)
+        self._by_hall.setdefault(screening.cinema_hall.name, _SortedScreenings()).add(screening)
+
+    def for_date(self, day):
+        """
+        Zwraca listę seansów w podanym dniu, posortowaną według godziny rozpoczęcia.
+        Wyszukiwanie to pojedynczy odczyt ze słownika kubełków.
+        """
+        bucket = self._by_date.get(day)
+        return list(bucket.items) if bucket else []
+
+    def for_movie(self, movie_title):
+        """
+        Zwraca wszystkie seanse podanego filmu w porządku chronologicznym.
+        """
+        bucket = self._by_movie.get(movie_title)
+        return list(bucket.items) if bucket else []
+
+    def for_hall(self, hall_name):
+        """
+        Zwraca wszystkie seanse w podanej sali w porządku chronologicznym.
+        """
+        bucket = self._by_hall.get(hall_name)
+        return list(bucket.items) if bucket else []
+
+    def between(self, start, end, movie_title=None, hall_name=None):
+        """
+        Zwraca seanse z zakresu dat, opcjonalnie zawężone do filmu i/lub sali.
+        Granice typu datetime tworzą zakres [start, end); granice typu date obejmują całe dni (oba końce włącznie).
+        """
+        start, end = self._normalize_range(start, end)
+        if movie_title is not None:
+            bucket = self._by_movie.get(movie_title)  # Zawężenie do listy seansów filmu (zwykle krótszej niż lista sali).
+        elif hall_name is not None:
+            bucket = self._by_hall.get(hall_name)
+        else:
+            bucket = self._all
+        if bucket is None:
+            return []
+        screenings = bucket.between(start, end)
+        if movie_title is not None and hall_name is not None:
+            # Drugi filtr jest stosowany już tylko do wyniku zapytania zakresowego.
+            screenings = [s for s in screenings if s.cinema_hall.name == hall_name]
+        return screenings
+
+    @staticmethod
+    def _normalize_range(start, end):
+        """
+        Zamienia granice zakresu na obiekty datetime.
+        Data początkowa oznacza północ tego dnia, a data końcowa - północ dnia następnego.
+        """
+        if not isinstance(start, datetime):
+            start = datetime.combine(start, time.min)
+        if not isinstance(end, datetime):
+            end = datetime.combine(end + timedelta(days=1), time.min)
+        return start, end
+
+class HallIntervalIndex:
+    """
+    Indeks zajętości sal - przedziały czasu [początek, koniec + przerwa techniczna) wszystkich seansów, osobno dla każdej sali.
+    Przedziały w jednej sali nie nakładają się, więc posortowane początki wyznaczają też porządek końców
+    i sprawdzenie kolizji nowego seansu wymaga jednego wyszukiwania binarnego (O(log n)) zamiast porównania ze wszystkimi seansami sali.
+    """
+
+    def __init__(self, cleaning_minutes=0):
+        """
+        Inicjalizacja pustego indeksu.
+        Przyjmuje domyślną długość przerwy technicznej (sprzątanie sali) po każdym seansie, w minutach.
+        """
+        self.cleaning = timedelta(minutes=cleaning_minutes)  # Przerwa techniczna doliczana do końca każdego seansu.
+        self._halls = {}  # Słownik: nazwa sali -> (posortowane początki, końce wraz z przerwą, seanse).
+
+    def interval(self, screening):
+        """
+        Zwraca przedział czasu zajmowany przez seans w sali: od rozpoczęcia do końca filmu powiększonego o przerwę techniczną.
+        """
+        return screening.date_time, screening.end_time + self.cleaning
+
+    def find_conflicts(self, screening):
+        """
+        Zwraca listę seansów w tej samej sali, których przedziały nakładają się na przedział podanego seansu (pustą, jeśli kolizji nie ma).
+        """
+        entry = self._halls.get(screening.cinema_hall.name)
+        if entry is None:
+            return []
+        starts, ends, items = entry
+        start, end = self.interval(screening)
+        position = bisect_left(starts, end)  # Seanse na pozycjach >= position zaczynają się nie wcześniej niż koniec nowego seansu.
+        conflicts = []
+        index = position - 1
+        while index >= 0 and ends[index] > start:  # Dzięki rozłączności przedziałów zwykle sprawdzany jest tylko jeden poprzednik.
+            conflicts.append(items[index])
+            index -= 1
+        conflicts.reverse()
+        return conflicts
+
+    def add(self, screening):
+        """
+        Dodaje seans do indeksu sali.
+        Zgłasza ValueError (bez zmiany indeksu), jeśli seans koliduje z innym seansem w tej samej sali.
+        """
+        conflicts = self.find_conflicts(screening)
+        if conflicts:
+            raise ValueError(f"Seans {screening} koliduje z seansem {conflicts[0]} w sali {screening.cinema_hall.name}.")
+        starts, ends, items = self._halls.setdefault(screening.cinema_hall.name, ([], [], []))
+        start, end = self.interval(screening)
+        position = bisect_left(starts, start)
+        starts.insert(position, start)
+        ends.insert(position, end)
+        items.insert(position, screening)
+
+    def for_hall(self, hall_name):
+        """
+        Zwraca seanse w podanej sali w porządku chronologicznym.
+        """
+        entry = self._halls.get(hall_name)
+        return list(entry[2]) if entry else []
\ No newline at end of file
@@ -0,0 +1,404 @@
+import json  # Import modułu json do zapisu cech i układu sali w jednej kolumnie tekstowej.
+import sqlite3  # Import modułu sqlite3 - wbudowana baza danych SQLite.
+import threading  # Import modułu threading - osobne połączenie dla każdego wątku i blokada map tożsamości.
+from datetime import datetime, timedelta, time  # Import klas daty i czasu do zapytań o seanse danego dnia i przerwy technicznej.
+from models.movie import Movie  # Import modeli odtwarzanych z wierszy tabel.
+from models.cinema_hall import CinemaHall
+from models.hall_layout import HallLayout
+from models.screening import Screening
+from models.reservation import Reservation
+from models.ticket_batch import TicketBatch  # Import kolumnowej grupy biletów odtwarzanej dla wczytanych rezerwacji.
+from states.seat_state import RESERVE_ACTION  # Import akcji rezerwacji - odtworzenie stanu miejsc wczytanego seansu.
+from utils.schedule_index import DEFAULT_CLEANING_MINUTES  # Import domyślnej przerwy technicznej - ta sama wartość co w bazie danych w pamięci.
+
+DEFAULT_DATABASE_FILE = "wsbcinema.db"  # Domyślna ścieżka pliku bazy danych SQLite.
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS movies (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL UNIQUE,
+    duration_minutes INTEGER NOT NULL,
+    age_category INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cinema_halls (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    hall_type TEXT NOT NULL,
+    features TEXT NOT NULL,
+    layout TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS screenings (
+    id INTEGER PRIMARY KEY,
+    movie_id INTEGER NOT NULL REFERENCES movies(id),
+    hall_id INTEGER NOT NULL REFERENCES cinema_halls(id),
+    date_time TEXT NOT NULL,
+    busy_until TEXT NOT NULL,
+    base_price REAL NOT NULL,
+    UNIQUE (movie_id, hall_id, date_time)
+);
+CREATE INDEX IF NOT EXISTS idx_screenings_date_time ON screenings (date_time);
+CREATE INDEX IF NOT EXISTS idx_screenings_hall ON screenings (hall_id, date_time);
+CREATE INDEX IF NOT EXISTS idx_screenings_movie ON screenings (movie_id, date_time);
+CREATE TABLE IF NOT EXISTS reservations (
+    id TEXT PRIMARY KEY,
+    screening_id INTEGER NOT NULL REFERENCES screenings(id),
+    customer_name TEXT NOT NULL,
+    total_price REAL NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reservations_screening ON reservations (screening_id);
+CREATE TABLE IF NOT EXISTS reservation_seats (
+    screening_id INTEGER NOT NULL,
+    row INTEGER NOT NULL,
+    number INTEGER NOT NULL,
+    reservation_id TEXT NOT NULL REFERENCES reservations(id) ON DELETE CASCADE,
+    PRIMARY KEY (screening_id, row, number)
+);
+CREATE INDEX IF NOT EXISTS idx_reservation_seats_reservation ON reservation_seats (reservation_id);
+"""  # Schemat bazy: klucz główny miejsc seansu (screening_id, row, number) uniemożliwia podwójną rezerwację także między procesami.
+
+SCREENING_COLUMNS = "s.id, s.movie_id, s.hall_id, s.date_time, s.base_price"  # Kolumny seansu odczytywane przez wszystkie zapytania o seanse.
+
+class SQLiteStorage:
+    """
+    Magazyn danych w bazie SQLite o tym samym interfejsie co Database (add_*, get_*, find_screening, get_screenings_for_date).
+    Filmy, sale, seanse i rezerwacje są zapisywane w indeksowanych tabelach, a obiekty modeli są tworzone dopiero przy zapytaniu
+    i zapamiętywane w mapach tożsamości, więc ten sam wiersz zawsze odpowiada temu samemu obiektowi (np. z tą samą mapą miejsc).
+    Każdy wątek korzysta z własnego połączenia z puli; zapytania mają stałą treść z parametrami, więc są przygotowywane raz na połączenie.
+    """
+
+    def __init__(self, path=DEFAULT_DATABASE_FILE, cleaning_minutes=DEFAULT_CLEANING_MINUTES):
+        """
+        Inicjalizacja magazynu.
+        Przyjmuje ścieżkę pliku bazy danych oraz przerwę techniczną po seansie (w minutach) używaną przy wykrywaniu kolizji w salach.
+        """
+        self.path = path  # Ścieżka pliku bazy danych.
+        self.cleaning = timedelta(minutes=cleaning_minutes)  # Przerwa techniczna po każdym seansie.
+        self._local = threading.local()  # Połączenie bieżącego wątku.
+        self._connections = {}  # Pula otwartych połączeń: wątek -> połączenie; połączenia zakończonych wątków są zamykane przy otwieraniu kolejnych.
+        self._lock = threading.RLock()  # Blokada puli połączeń i map tożsamości.
+        self._movies = {}  # Mapa tożsamości: identyfikator wiersza -> obiekt Movie.
+        self._halls = {}  # Mapa tożsamości: identyfikator wiersza -> obiekt CinemaHall.
+        self._screenings = {}  # Mapa tożsamości: identyfikator wiersza -> obiekt Screening.
+        self._reservations = {}  # Mapa tożsamości: identyfikator rezerwacji -> obiekt Reservation.
+        self._row_ids = {}  # Odwrotna mapa tożsamości: obiekt modelu -> identyfikator wiersza.
+        with self.connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def connection(self):
+        """
+        Zwraca połączenie bieżącego wątku, otwierając je (i dodając do puli) przy pierwszym użyciu w danym wątku.
+        Przy otwieraniu nowego połączenia zamykane są połączenia wątków, które już się zakończyły, więc pula nie rośnie wraz z liczbą utworzonych wątków.
+        """
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, cached_statements=256)
+            conn.execute("PRAGMA journal_mode=WAL")  # Czytelnicy nie blokują zapisu - wątki robocze mogą czytać równolegle z rezerwacją.
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.connection = conn
+            with self._lock:
+                for thread in [thread for thread in self._connections if not thread.is_alive()]:
+                    self._connections.pop(thread).close()  # Wątek zakończył działanie - jego połączenie nie będzie już używane.
+                self._connections[threading.current_thread()] = conn
+        return conn
+
+    def close(self):
+        """
+        Zamyka wszystkie połączenia z puli (np. przy zamykaniu aplikacji).
+        """
+        with self._lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections = {}
+        self._local = threading.local()
+
+    def add_movie(self, movie):
+        """
+        Zapisuje film (lub aktualizuje film o tym samym tytule) i zwraca identyfikator jego wiersza.
+        """
+        with self.connection() as conn:
+            conn.execute("INSERT INTO movies (title, duration_minutes, age_category) VALUES (?, ?, ?) "
+                         "ON CONFLICT (title) DO UPDATE SET duration_minutes = excluded.duration_minutes, age_category = excluded.age_category",
+                         (movie.title, movie.duration_minutes, movie.age_category))
+            row_id = conn.execute("SELECT id FROM movies WHERE title = ?", (movie.title,)).fetchone()[0]
+        return self._register(self._movies, row_id, movie)
+
+    def add_cinema_hall(self, cinema_hall):
+        """
+        Zapisuje salę kinową (wraz z typem, wyposażeniem i układem miejsc) i zwraca identyfikator jej wiersza.
+        """
+        with self.connection() as conn:
+            conn.execute("INSERT INTO cinema_halls (name, hall_type, features, layout) VALUES (?, ?, ?, ?) "
+                         "ON CONFLICT (name) DO UPDATE SET hall_type = excluded.hall_type, features = excluded.features, layout = excluded.layout",
+                         (cinema_hall.name, cinema_hall.hall_type, json.dumps(sorted(cinema_hall.features)), json.dumps(cinema_hall.layout.to_dict())))
+            row_id = conn.execute("SELECT id FROM cinema_halls WHERE name = ?", (cinema_hall.name,)).fetchone()[0]
+        return self._register(self._halls, row_id, cinema_hall)
+
+    def add_screening(self, screening):
+        """
+        Zapisuje seans (oraz jego film i salę, jeśli nie były jeszcze zapisane).
+        Zgłasza ValueError, jeśli seans nakłada się (z uwzględnieniem przerwy technicznej) na inny seans w tej samej sali.
+        """
+        movie_id = self._row_ids.get(screening.movie) or self.add_movie(screening.movie)
+        hall_id = self._row_ids.get(screening.cinema_hall) or self.add_cinema_hall(screening.cinema_hall)
+        conn = self.connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")  # Blokada zapisu od sprawdzenia kolizji do dodania seansu - inny proces nie doda seansu pomiędzy nimi.
+            colliding = self.find_screening_conflicts(screening)
+            if colliding:
+                raise ValueError(f"Seans {screening} koliduje z seansem {colliding[0]}.")
+            cursor = conn.execute("INSERT INTO screenings (movie_id, hall_id, date_time, busy_until, base_price) VALUES (?, ?, ?, ?, ?)",
+                                  (movie_id, hall_id, screening.date_time.isoformat(), (screening.end_time + self.cleaning).isoformat(), screening.base_price))
+        return self._register(self._screenings, cursor.lastrowid, screening)
+
+    def find_screening_conflicts(self, screening):
+        """
+        Zwraca listę zapisanych seansów, z którymi podany seans kolidowałby w swojej sali (pustą, jeśli można go dodać).
+        """
+        hall_id = self._row_ids.get(screening.cinema_hall)
+        if hall_id is None:
+            return []  # Sala nie ma jeszcze żadnych zapisanych seansów.
+        rows = self.connection().execute(f"SELECT {SCREENING_COLUMNS} FROM screenings s WHERE s.hall_id = ? AND s.date_time < ? AND s.busy_until > ? ORDER BY s.date_time",
+                                         (hall_id, (screening.end_time + self.cleaning).isoformat(), screening.date_time.isoformat())).fetchall()
+        return [self._screening_from_row(row) for row in rows if self._screenings.get(row[0]) is not screening]
+
+    def add_reservation(self, reservation):
+        """
+        Zapisuje rezerwację i jej miejsca w jednej transakcji.
+        Zgłasza ValueError (bez żadnych zmian w bazie), jeśli którekolwiek miejsce jest już zajęte przez inną rezerwację.
+        """
+        screening_id = self._row_ids.get(reservation.screening)
+        if screening_id is None:
+            raise ValueError(f"Seans {reservation.screening} nie jest zapisany w bazie danych.")
+        conn = self.connection()
+        try:
+            with conn:  # Transakcja - rezerwacja i wszystkie jej miejsca albo nic.
+                conn.execute("INSERT INTO reservations (id, screening_id, customer_name, total_price, timestamp) VALUES (?, ?, ?, ?, ?)",
+                             (reservation.id, screening_id, reservation.customer_name, reservation.total_price, reservation.timestamp.isoformat()))
+                conn.executemany("INSERT INTO reservation_seats (screening_id, row, number, reservation_id) VALUES (?, ?, ?, ?)",
+                                 [(screening_id, seat.row, seat.number, reservation.id) for seat in reservation.seats])
+        except sqlite3.IntegrityError:
+            raise ValueError("Wybrane miejsca nie są już dostępne.")
+        with self._lock:
+            self._reservations[reservation.id] = reservation
+
+    def cancel_reservation(self, reservation):
+        """
+        Usuwa rezerwację i jej miejsca z bazy danych.
+        Zwraca True, jeśli rezerwacja została usunięta, lub False, jeśli jej nie było.
+        """
+        with self.connection() as conn:
+            deleted = conn.execute("DELETE FROM reservations WHERE id = ?", (reservation.id,)).rowcount
+        with self._lock:
+            self._reservations.pop(reservation.id, None)
+        return deleted > 0
+
+    def get_movies(self):
+        """
+        Zwraca listę wszystkich filmów.
+        """
+        rows = self.connection().execute("SELECT id, title, duration_minutes, age_category FROM movies ORDER BY id").fetchall()
+        return [self._movie_from_row(row) for row in rows]
+
+    def get_cinema_halls(self):
+        """
+        Zwraca listę wszystkich sal kinowych.
+        """
+        rows = self.connection().execute("SELECT id, name, hall_type, features, layout FROM cinema_halls ORDER BY id").fetchall()
+        return [self._hall_from_row(row) for row in rows]
+
+    def get_screenings(self):
+        """
+        Zwraca listę wszystkich seansów w porządku chronologicznym (wczytuje wszystkie seanse - do codziennej pracy służą zapytania zakresowe).
+        """
+        return self._query_screenings("", ())
+
+    def get_reservations(self):
+        """
+        Zwraca listę wszystkich rezerwacji w kolejności ich utworzenia.
+        """
+        rows = self.connection().execute("SELECT id, screening_id, customer_name, total_price, timestamp FROM reservations ORDER BY timestamp").fetchall()
+        return [self._reservation_from_row(row) for row in rows]
+
+    def get_reservations_for_screening(self, screening):
+        """
+        Zwraca listę rezerwacji na podany seans (zapytanie po indeksie seansu).
+        """
+        screening_id = self._row_ids.get(screening)
+        if screening_id is None:
+            return []
+        rows = self.connection().execute("SELECT id, screening_id, customer_name, total_price, timestamp FROM reservations WHERE screening_id = ? ORDER BY timestamp",
+                                         (screening_id,)).fetchall()
+        return [self._reservation_from_row(row) for row in rows]
+
+    def get_movie(self, movie_id):
+        """
+        Zwraca film o podanym identyfikatorze lub None, jeśli takiego filmu nie ma.
+        """
+        movie = self._movies.get(movie_id)
+        if movie is not None:
+            return movie
+        row = self.connection().execute("SELECT id, title, duration_minutes, age_category FROM movies WHERE id = ?", (movie_id,)).fetchone()
+        return self._movie_from_row(row) if row is not None else None
+
+    def get_cinema_hall(self, hall_id):
+        """
+        Zwraca salę kinową o podanym identyfikatorze lub None, jeśli takiej sali nie ma.
+        """
+        hall = self._halls.get(hall_id)
+        if hall is not None:
+            return hall
+        row = self.connection().execute("SELECT id, name, hall_type, features, layout FROM cinema_halls WHERE id = ?", (hall_id,)).fetchone()
+        return self._hall_from_row(row) if row is not None else None
+
+    def get_screening(self, screening_id):
+        """
+        Zwraca seans o podanym identyfikatorze lub None, jeśli takiego seansu nie ma (wczytany już seans pochodzi z mapy tożsamości, bez zapytania).
+        """
+        screening = self._screenings.get(screening_id)
+        if screening is not None:
+            return screening
+        row = self.connection().execute(f"SELECT {SCREENING_COLUMNS} FROM screenings s WHERE s.id = ?", (screening_id,)).fetchone()
+        return self._screening_from_row(row) if row is not None else None
+
+    def get_screenings_for_date(self, date):
+        """
+        Zwraca listę seansów zaplanowanych na podaną datę, posortowaną według godziny (zapytanie zakresowe po indeksie daty).
+        """
+        start = datetime.combine(date, time.min)
+        return self._query_screenings("WHERE s.date_time >= ? AND s.date_time < ?", (start.isoformat(), (start + timedelta(days=1)).isoformat()))
+
+    def get_screenings_between(self, start, end, movie_title=None, hall_name=None):
+        """
+        Zwraca listę seansów z podanego zakresu dat, opcjonalnie tylko dla wskazanego filmu i/lub sali.
+        Granice typu date obejmują całe dni, a granice typu datetime tworzą zakres [start, end).
+        """
+        if not isinstance(start, datetime):
+            start = datetime.combine(start, time.min)
+        if not isinstance(end, datetime):
+            end = datetime.combine(end, time.min) + timedelta(days=1)
+        conditions = ["s.date_time >= ?", "s.date_time < ?"]
+        parameters = [start.isoformat(), end.isoformat()]
+        if movie_title is not None:
+            conditions.append("s.movie_id = (SELECT id FROM movies WHERE title = ?)")
+            parameters.append(movie_title)
+        if hall_name is not None:
+            conditions.append("s.hall_id = (SELECT id FROM cinema_halls WHERE name = ?)")
+            parameters.append(hall_name)
+        return self._query_screenings("WHERE " + " AND ".join(conditions), tuple(parameters))
+
+    def get_screenings_for_movie(self, movie_title):
+        """
+        Zwraca listę wszystkich seansów podanego filmu w porządku chronologicznym.
+        """
+        return self._query_screenings("WHERE s.movie_id = (SELECT id FROM movies WHERE title = ?)", (movie_title,))
+
+    def get_screenings_for_hall(self, hall_name):
+        """
+        Zwraca listę wszystkich seansów w podanej sali w porządku chronologicznym.
+        """
+        return self._query_screenings("WHERE s.hall_id = (SELECT id FROM cinema_halls WHERE name = ?)", (hall_name,))
+
+    def find_screening(self, movie_title, hall_name, date_time):
+        """
+        Znajduje seans na podstawie tytułu filmu, nazwy sali i daty/czasu (odczyt po unikalnym indeksie).
+        """
+        row = self.connection().execute(
+            f"SELECT {SCREENING_COLUMNS} FROM screenings s JOIN movies m ON m.id = s.movie_id JOIN cinema_halls h ON h.id = s.hall_id "
+            "WHERE m.title = ? AND h.name = ? AND s.date_time = ?", (movie_title, hall_name, date_time.isoformat())).fetchone()
+        return self._screening_from_row(row) if row is not None else None
+
+    def _query_screenings(self, where, parameters):
+        """
+        Prywatna metoda wykonująca zapytanie o seanse z podanym warunkiem i zwracająca obiekty Screening w porządku chronologicznym.
+        """
+        rows = self.connection().execute(f"SELECT {SCREENING_COLUMNS} FROM screenings s {where} ORDER BY s.date_time, s.id", parameters).fetchall()
+        return [self._screening_from_row(row) for row in rows]
+
+    def _register(self, identity_map, row_id, obj):
+        """
+        Prywatna metoda dodająca obiekt do mapy tożsamości pod identyfikatorem wiersza.
+        Identyfikator wiersza staje się stałym identyfikatorem obiektu (atrybut id), używanym m.in. w zapisie rezerwacji i blokad.
+        """
+        with self._lock:
+            identity_map.setdefault(row_id, obj)
+            self._row_ids[obj] = row_id
+            obj.id = row_id
+        return row_id
+
+    def _movie_from_row(self, row):
+        """
+        Prywatna metoda zwracająca obiekt Movie dla wiersza tabeli movies (z mapy tożsamości lub nowo utworzony).
+        """
+        movie = self._movies.get(row[0])
+        if movie is None:
+            movie = Movie(row[1], row[2], row[3])
+            self._register(self._movies, row[0], movie)
+            movie = self._movies[row[0]]
+        return movie
+
+    def _movie(self, movie_id):
+        """
+        Prywatna metoda zwracająca film o podanym identyfikatorze wiersza.
+        """
+        movie = self._movies.get(movie_id)
+        if movie is None:
+            movie = self._movie_from_row(self.connection().execute("SELECT id, title, duration_minutes, age_category FROM movies WHERE id = ?", (movie_id,)).fetchone())
+        return movie
+
+    def _hall_from_row(self, row):
+        """
+        Prywatna metoda zwracająca obiekt CinemaHall dla wiersza tabeli cinema_halls (z mapy tożsamości lub nowo utworzony).
+        """
+        hall = self._halls.get(row[0])
+        if hall is None:
+            layout = HallLayout.from_dict(json.loads(row[4]))
+            hall = CinemaHall(row[1], layout.rows, layout.seats_per_row, row[2], json.loads(row[3]), layout)
+            self._register(self._halls, row[0], hall)
+            hall = self._halls[row[0]]
+        return hall
+
+    def _hall(self, hall_id):
+        """
+        Prywatna metoda zwracająca salę o podanym identyfikatorze wiersza.
+        """
+        hall = self._halls.get(hall_id)
+        if hall is None:
+            hall = self._hall_from_row(self.connection().execute("SELECT id, name, hall_type, features, layout FROM cinema_halls WHERE id = ?", (hall_id,)).fetchone())
+        return hall
+
+    def _screening_from_row(self, row):
+        """
+        Prywatna metoda zwracająca obiekt Screening dla wiersza tabeli screenings.
+        Nowo wczytany seans otrzymuje stan miejsc odtworzony z zapisanych rezerwacji.
+        """
+        screening = self._screenings.get(row[0])
+        if screening is not None:
+            return screening
+        screening = Screening(self._movie(row[1]), self._hall(row[2]), datetime.fromisoformat(row[3]), row[4])
+        seat_map = screening.seat_map
+        indices = [seat_map.index(seat_row, number) for seat_row, number in
+                   self.connection().execute("SELECT row, number FROM reservation_seats WHERE screening_id = ?", (row[0],))]
+        seat_map.apply_batch([index for index in indices if index is not None], RESERVE_ACTION)  # Odtworzenie stanu bez powiadamiania obserwatorów.
+        self._register(self._screenings, row[0], screening)
+        return self._screenings[row[0]]
+
+    def _reservation_from_row(self, row):
+        """
+        Prywatna metoda zwracająca obiekt Reservation dla wiersza tabeli reservations (z mapy tożsamości lub nowo utworzony).
+        """
+        reservation = self._reservations.get(row[0])
+        if reservation is not None:
+            return reservation
+        screening = self._screening_from_row(self.connection().execute(f"SELECT {SCREENING_COLUMNS} FROM screenings s WHERE s.id = ?", (row[1],)).fetchone())
+        seats = [screening.get_seat(seat_row, number) for seat_row, number in
+                 self.connection().execute("SELECT row, number FROM reservation_seats WHERE reservation_id = ? ORDER BY row, number", (row[0],))]
+        seats = [seat for seat in seats if seat is not None]
+        tickets = TicketBatch.for_seats(screening, seats, row[3] / len(seats) if seats else 0)
+        reservation = Reservation(row[2], screening, seats, tickets)
+        reservation.id = row[0]  # Przywrócenie oryginalnego identyfikatora.
+        reservation.timestamp = datetime.fromisoformat(row[4])  # Przywrócenie oryginalnego znacznika czasu.
+        reservation.total_price = row[3]  # Przywrócenie oryginalnej ceny.
+        with self._lock:
+            return self._reservations.setdefault(row[0], reservation)
@@ -0,0 +1,178 @@
+import os  # Import modułu os - wymuszenie zapisu na dysk (fsync).
+import threading  # Import modułu threading do obsługi wątku zapisującego w tle.
+import time  # Import modułu time do odmierzania czasu oczekiwania na kolejne rekordy grupy.
+from collections import deque  # Import kolejki dwustronnej - rekordy oczekujące na zapis.
+
+class WriteBehindWriter:
+    """
+    Zapis w tle (write-behind) z zatwierdzaniem grupowym.
+    Rekordy (linie dopisywane do plików) trafiają do kolejki i są zapisywane przez wątek tła grupami: jedna operacja zapisu i jeden fsync na plik w grupie.
+    Grupa jest zapisywana po zebraniu max_batch rekordów lub po max_delay sekundach od pierwszego rekordu, więc wywołujący nie czeka na dysk,
+    a awaria może zabrać najwyżej rekordy z ostatnich max_delay sekund (i nie więcej niż max_pending rekordów); metoda flush() jest barierą trwałości.
+    """
+
+    DEFAULT_MAX_BATCH = 256  # Domyślna liczba rekordów, po której grupa jest zapisywana bez czekania.
+    DEFAULT_MAX_DELAY = 0.05  # Domyślny maksymalny czas (w sekundach) od zgłoszenia rekordu do jego zapisu na dysk.
+    DEFAULT_MAX_PENDING = 10000  # Domyślna maksymalna liczba rekordów oczekujących na zapis (po jej osiągnięciu zgłaszający czeka).
+
+    def __init__(self, max_batch=DEFAULT_MAX_BATCH, max_delay=DEFAULT_MAX_DELAY, max_pending=DEFAULT_MAX_PENDING):
+        """
+        Inicjalizacja zapisu w tle.
+        Konstruktor przyjmuje rozmiar grupy, maksymalne opóźnienie zapisu oraz limit rekordów oczekujących w kolejce.
+        """
+        if max_batch < 1 or max_pending < 1:
+            raise ValueError("Rozmiar grupy i limit oczekujących rekordów muszą być dodatnie.")
+        self.max_batch = max_batch  # Liczba rekordów w pełnej grupie.
+        self.max_delay = max_delay  # Maksymalne opóźnienie zapisu rekordu.
+        self.max_pending = max_pending  # Limit rekordów oczekujących w kolejce.
+        self._queue = deque()  # Kolejka trójek (numer kolejny rekordu, ścieżka pliku, linia).
+        self._condition = threading.Condition()  # Warunek chroniący kolejkę i liczniki oraz budzący wątek tła i oczekujących.
+        self._write_lock = threading.Lock()  # Blokada zapisu - grupy (także zapisywane od razu przez zgłaszających) trafiają na dysk po kolei, w kolejności numerów.
+        self._thread = None  # Wątek tła zapisujący grupy rekordów.
+        self._running = False  # Flaga działania wątku tła (False także podczas opróżniania kolejki po wywołaniu stop()).
+        self._worker_active = False  # Czy wątek tła jeszcze obsługuje kolejkę - do jego zakończenia rekordy nie są zapisywane z pominięciem kolejki.
+        self._submitted = 0  # Liczba rekordów przyjętych do zapisu (także numer kolejny ostatniego rekordu).
+        self._completed = 0  # Liczba rekordów, których zapis się zakończył (udany lub nie) - rekordy kończą się w kolejności zgłoszenia.
+        self._written = 0  # Liczba rekordów zapisanych na dysk.
+        self._errors = 0  # Liczba rekordów, których zapis zakończył się błędem wejścia/wyjścia.
+        self._unreported_failures = []  # Numery kolejne nieudanych rekordów, jeszcze niezgłoszonych przez flush().
+        self._batches = 0  # Liczba zapisanych grup.
+        self._flush_waiters = 0  # Liczba wątków czekających w flush() - wątek tła zapisuje wtedy grupę bez dopełniania.
+
+    def submit(self, path, line):
+        """
+        Zgłasza linię do dopisania na końcu pliku o podanej ścieżce.
+        Jeśli wątek tła nie działa, linia jest zapisywana od razu (grupa jednego rekordu) pod blokadą zapisu, więc równoczesni zgłaszający
+        kończą zapis w kolejności numerów; podczas opróżniania kolejki po stop() trafia jeszcze do kolejki, aby nie wyprzedzić rekordów zgłoszonych wcześniej.
+        """
+        with self._condition:
+            if self._worker_active:
+                if self._running:
+                    self._condition.wait_for(lambda: len(self._queue) < self.max_pending or not self._running)
+                self._enqueue(path, line)
+                return
+        with self._write_lock:  # Numer nadawany i zapisywany pod jedną blokadą - późniejszy rekord nie zakończy się przed wcześniejszym.
+            with self._condition:
+                if self._worker_active:
+                    self._enqueue(path, line)  # Wątek tła został w międzyczasie uruchomiony - zapisze rekord po bieżącym zapisie.
+                    return
+                self._submitted += 1
+                record = (self._submitted, path, line)
+            self._write_batch([record])
+
+    def _enqueue(self, path, line):
+        """
+        Prywatna metoda dodająca rekord do kolejki wątku tła (wywoływana pod blokadą warunku).
+        """
+        self._submitted += 1
+        self._queue.append((self._submitted, path, line))
+        if len(self._queue) == 1 or len(self._queue) >= self.max_batch:
+            self._condition.notify_all()  # Obudzenie wątku tła - pierwszy rekord nowej grupy lub pełna grupa.
+
+    def flush(self, timeout=None):
+        """
+        Bariera trwałości: czeka, aż wszystkie zgłoszone dotąd rekordy zostaną zapisane na dysk (zapis i fsync).
+        Zwraca True, jeśli zdążyły zostać zapisane przed upływem czasu oczekiwania, a False - po upływie czasu oczekiwania
+        lub jeśli zapis któregokolwiek z nich (niezgłoszony przez wcześniejsze wywołanie flush()) zakończył się błędem.
+        """
+        with self._condition:
+            target = self._submitted
+            self._flush_waiters += 1
+            self._condition.notify_all()  # Wątek tła nie czeka na dopełnienie grupy, gdy ktoś oczekuje na zapis.
+            try:
+                if not self._condition.wait_for(lambda: self._completed >= target, timeout):
+                    return False
+            finally:
+                self._flush_waiters -= 1
+            failed = [number for number in self._unreported_failures if number <= target]
+            if failed:
+                self._unreported_failures = [number for number in self._unreported_failures if number > target]
+                return False
+            return True
+
+    def start(self):
+        """
+        Uruchamia wątek tła zapisujący grupy rekordów.
+        """
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._worker_active = True
+        self._thread = threading.Thread(target=self._run, name="WriteBehindWriter", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Zatrzymuje wątek tła po zapisaniu wszystkich oczekujących rekordów; kolejne rekordy są zapisywane od razu.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def metrics(self):
+        """
+        Zwraca słownik ze statystykami zapisu: liczby rekordów przyjętych, zapisanych i błędnych, liczbę grup,
+        średni rozmiar grupy oraz liczbę rekordów oczekujących na zapis.
+        """
+        with self._condition:
+            return {
+                "submitted": self._submitted,
+                "written": self._written,
+                "errors": self._errors,
+                "batches": self._batches,
+                "avg_batch_size": self._completed / self._batches if self._batches else 0.0,
+                "pending": self._submitted - self._completed,
+            }
+
+    def _run(self):
+        """
+        Pętla wątku tła: zbieranie grupy rekordów (do max_batch lub max_delay) i zapisywanie jej poza blokadą.
+        """
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or not self._running)
+                if not self._queue:
+                    self._worker_active = False  # Kolejka opróżniona - kolejne rekordy są zapisywane od razu przez zgłaszających.
+                    return  # Wątek zatrzymany, a wszystkie rekordy zostały zapisane.
+                deadline = time.monotonic() + self.max_delay
+                # Dopełnianie grupy - do pełnego rozmiaru, upływu opóźnienia, zatrzymania lub żądania flush().
+                while self._running and len(self._queue) < self.max_batch and not self._flush_waiters:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._condition.wait(remaining):
+                        break
+                batch = [self._queue.popleft() for _ in range(min(self.max_batch, len(self._queue)))]
+                self._condition.notify_all()  # Zwolniło się miejsce w kolejce - obudzenie zgłaszających czekających na limit.
+            with self._write_lock:
+                self._write_batch(batch)
+
+    def _write_batch(self, batch):
+        """
+        Prywatna metoda zapisująca grupę rekordów: jedna operacja zapisu i jeden fsync na każdy plik w grupie (wywoływana pod blokadą zapisu).
+        Błąd zapisu jest zgłaszany ostrzeżeniem i liczony w statystykach; nie zatrzymuje zapisu kolejnych grup.
+        """
+        records_by_path = {}  # Słownik: ścieżka pliku -> (numery kolejne, linie) w kolejności zgłoszenia.
+        for number, path, line in batch:
+            numbers, lines = records_by_path.setdefault(path, ([], []))
+            numbers.append(number)
+            lines.append(line)
+        failed = []  # Numery kolejne rekordów, których zapis się nie powiódł.
+        for path, (numbers, lines) in records_by_path.items():
+            try:
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write("".join(lines))  # Jedna operacja zapisu dla wszystkich linii grupy.
+                    f.flush()
+                    os.fsync(f.fileno())  # Jeden fsync na grupę - rekordy są trwałe po powrocie.
+            except OSError as e:
+                print(f"Błąd zapisu dziennika {path}: {e}")
+                failed.extend(numbers)
+        with self._condition:
+            self._completed += len(batch)
+            self._written += len(batch) - len(failed)
+            self._errors += len(failed)
+            self._unreported_failures.extend(failed)
+            self._batches += 1
+            self._condition.notify_all()  # Obudzenie wątków czekających w flush().
@@ -4,6 +4,7 @@ from utils.database import Database  # Klasa Database jako repozytorium danych (
 from facades.reservation_facade import ReservationFacade  # Fasada do operacji rezerwacji.
 from factories.ticket_factory import RegularTicketFactory, DiscountedTicketFactory, VIPTicketFactory  # Fabryki biletów (Normalny, Ulgowy, VIP).
 from models.seat import Seat  # Klasa Seat reprezentuje pojedyncze miejsce w sali kinowej.
+from states.seat_state import FREE_CODE, RESERVED_CODE, SOLD_CODE, HELD_CODE  # Kody stanów miejsc do kolorowania planu sali.
 
 class ReservationView(QWidget):  # Główny widok rezerwacji biletów.
     """
@@ -48,6 +49,12 @@ class ReservationView(QWidget):  # Główny widok rezerwacji biletów.
         self.ticket_type_combo.currentIndexChanged.connect(self.update_price)
         self.left_layout.addWidget(self.ticket_type_combo)
 
+        self.best_seats_button = QPushButton("Najlepsze miejsca")  # Przycisk automatycznego wyboru najlepszych sąsiadujących miejsc.
+        self.best_seats_button.setMaximumWidth(150)
+        self.best_seats_button.setEnabled(False)
+        self.best_seats_button.clicked.connect(self.select_best_seats)
+        self.left_layout.addWidget(self.best_seats_button)
+
         self.reserve_button = QPushButton("Zarezerwuj")  # Przycisk rezerwacji.
         self.reserve_button.setMaximumWidth(150)
         self.reserve_button.setEnabled(False)
@@ -85,6 +92,7 @@ class ReservationView(QWidget):  # Główny widok rezerwacji biletów.
 
             self.display_seat_layout()
             self.update_price()
+            self.best_seats_button.setEnabled(True)
             self.reserve_button.setEnabled(len(self.selected_seats) > 0 and bool(self.available_ticket_factories))
         else:
             self.screening_info_label.setText("Proszę wybrać seans z zakładki 'Seanse'.")
@@ -94,6 +102,7 @@ class ReservationView(QWidget):  # Główny widok rezerwacji biletów.
             self.ticket_type_combo.setEnabled(False)
             self.available_ticket_factories = {}
             self.update_price()
+            self.best_seats_button.setEnabled(False)
             self.reserve_button.setEnabled(False)
  
     def display_seat_layout(self):
@@ -147,6 +156,17 @@ class ReservationView(QWidget):  # Główny widok rezerwacji biletów.
         row3.addWidget(sold_label)
         legend_vbox.addLayout(row3)
 
+        # Wstrzymane miejsce (czasowa blokada)
+        held_box = QFrame()
+        held_box.setFixedSize(20, 20)
+        held_box.setStyleSheet("background-color: yellow; border: 1px solid #888;")
+        held_label = QLabel("Wstrzymane")
+        held_label.setStyleSheet("color: white;")
+        row4 = QHBoxLayout()
+        row4.addWidget(held_box)
+        row4.addWidget(held_label)
+        legend_vbox.addLayout(row4)
+
         legend_widget.setLayout(legend_vbox)
         self.legend_layout.insertWidget(0, legend_widget)
         self.legend_widget = legend_widget
@@ -155,21 +175,34 @@ class ReservationView(QWidget):  # Główny widok rezerwacji biletów.
             return
 
         # Tworzenie przycisków dla każdego miejsca
+        layout = self.current_screening.cinema_hall.layout  # Szablon układu sali (przerwy, przejścia, miejsca dla wózków).
+        # Przyciski są tworzone tylko dla istniejących miejsc - pozycje przerw w rzędach pozostają pustymi komórkami siatki
         for seat in self.current_screening.seats:
+            seat_index = layout.index(seat.row, seat.number)
             seat_button = QPushButton(str(seat))
             seat_button.setFixedSize(40, 40)
             seat_button.setProperty("seat_obj", seat)
+            seat_button.setToolTip(f"Rząd {seat.row}, miejsce {seat.number} ({layout.category(seat_index)})")
+            if layout.is_wheelchair(seat_index):
+                # Oznaczenie miejsca dla osoby na wózku
+                seat_button.setText(f"\u267f {seat_button.text()}")
+                seat_button.setToolTip(f"{seat_button.toolTip()} - miejsce dla osoby na wózku")
             
-            # Stylowanie przycisku w zależności od stanu miejsca
-            if seat.state.__class__.__name__ == "FreeSeatState":
-                seat_button.setStyleSheet("background-color: lightgreen;")
+            # Stylowanie przycisku w zależności od kodu stanu miejsca
+            state_code = seat.state.code
+            if state_code == FREE_CODE:
+                # Miejsca już wybrane (np. automatycznie) są wyróżnione kolorem zaznaczenia
+                seat_button.setStyleSheet("background-color: blue;" if seat in self.selected_seats else "background-color: lightgreen;")
                 seat_button.clicked.connect(self.toggle_seat_selection)
-            elif seat.state.__class__.__name__ == "ReservedSeatState":
+            elif state_code == RESERVED_CODE:
                 seat_button.setStyleSheet("background-color: orange;")
                 seat_button.setEnabled(False)
-            elif seat.state.__class__.__name__ == "SoldSeatState":
+            elif state_code == SOLD_CODE:
                 seat_button.setStyleSheet("background-color: red;")
                 seat_button.setEnabled(False)
+            elif state_code == HELD_CODE:
+                seat_button.setStyleSheet("background-color: yellow;")
+                seat_button.setEnabled(False)
             else:
                 seat_button.setStyleSheet("background-color: gray;")
                 seat_button.setEnabled(False)
@@ -185,9 +218,9 @@ class ReservationView(QWidget):  # Główny widok rezerwacji biletów.
             row_label.setContentsMargins(10, 0, 0, 0)
             self.seat_layout.addWidget(row_label, row, self.current_screening.cinema_hall.seats_per_row)
 
-        # Szerokość przerwy na środku
-        middle = (self.current_screening.cinema_hall.seats_per_row // 2)-1
-        self.seat_layout.setColumnMinimumWidth(middle, 60)
+        # Szerokość przejść pomiędzy kolumnami miejsc (według szablonu układu sali); sala bez przejść zachowuje odstęp na środku rzędu tylko dla czytelności planu
+        for aisle_after in layout.aisles_after or (self.current_screening.cinema_hall.seats_per_row // 2,):
+            self.seat_layout.setColumnMinimumWidth(aisle_after - 1, 60)
 
         # Etykiety miejsc
         max_seat_num = self.current_screening.cinema_hall.seats_per_row
@@ -229,6 +262,28 @@ class ReservationView(QWidget):  # Główny widok rezerwacji biletów.
         self.update_price()
         self.reserve_button.setEnabled(len(self.selected_seats) > 0)
 
+    def select_best_seats(self):
+        """
+        Automatyczny wybór najlepszych sąsiadujących miejsc.
+        Pyta o liczbę miejsc, wyszukuje najlepszy wolny blok w jednym rzędzie i zaznacza go na planie sali zamiast bieżącego wyboru.
+        """
+        if not self.current_screening:
+            return
+
+        count, ok = QInputDialog.getInt(self, "Najlepsze miejsca", "Liczba miejsc:", max(1, len(self.selected_seats)), 1, self.current_screening.cinema_hall.seats_per_row)
+        if not ok:
+            return
+
+        seats = self.reservation_facade.find_best_seats(self.current_screening, count)
+        if not seats:
+            QMessageBox.warning(self, "Brak miejsc", f"Brak {count} wolnych miejsc obok siebie w jednym rzędzie.")
+            return
+
+        self.selected_seats = seats
+        self.display_seat_layout()
+        self.update_price()
+        self.reserve_button.setEnabled(bool(self.available_ticket_factories))
+
     def update_price(self):
         """
         Oblicza i aktualizuje wyświetlaną łączną cenę rezerwacji na podstawie wybranych miejsc i typu biletu.
@@ -250,7 +305,7 @@ class ReservationView(QWidget):  # Główny widok rezerwacji biletów.
             QMessageBox.warning(self, "Błąd", "Nie można znaleźć fabryki dla wybranego typu biletu.")
             return
 
-        total_price, _ = self.reservation_facade.calculate_price(self.current_screening, self.selected_seats, ticket_factory)
+        total_price = self.reservation_facade.quote_price(self.current_screening, self.selected_seats, ticket_factory)
         self.price_label.setText(f"Łączna cena: {total_price:.2f} zł")
 
     def make_reservation(self):
@@ -274,7 +329,7 @@ class ReservationView(QWidget):  # Główny widok rezerwacji biletów.
             QMessageBox.warning(self, "Błąd", f"Nieprawidłowy typ biletu: {selected_ticket_name}. Proszę wybrać poprawny typ biletu.")
             return
         
-        total_price, tickets = self.reservation_facade.calculate_price(self.current_screening, self.selected_seats, ticket_factory)
+        total_price = self.reservation_facade.quote_price(self.current_screening, self.selected_seats, ticket_factory)
 
         # Dialog do wprowadzenia imienia i nazwiska klienta
         dialog = QInputDialog(self)
@@ -324,6 +379,8 @@ class ReservationView(QWidget):  # Główny widok rezerwacji biletów.
             
             if summary_dialog.exec_() == QDialog.Accepted:
                 try:
+                    # Bilety są tworzone dopiero po zatwierdzeniu rezerwacji przez użytkownika.
+                    tickets = self.reservation_facade.create_tickets(self.current_screening, self.selected_seats, ticket_factory)
                     reservation = self.reservation_facade.make_reservation(customer_name, self.current_screening, self.selected_seats, tickets)
                     
                     msg_box = QMessageBox(self)
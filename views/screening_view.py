@@ -22,6 +22,7 @@ class ScreeningView(QWidget):
         
         self.database = Database() # Pobiera instancję bazy danych (Singleton).
         self.selected_screening = None # Atrybut do przechowywania wybranego seansu.
+        self.current_screenings = [] # Seanse wyświetlane aktualnie na liście (w tej samej kolejności co elementy listy).
         self.layout = QVBoxLayout(self) # Tworzy główny pionowy układ dla tego widoku.
         
         self.setup_date_selection() # Sekcja do wyboru daty.
@@ -94,6 +95,7 @@ class ScreeningView(QWidget):
         self.screening_list_widget.clear() # Czyszczenie istniejącej listy seansów w GUI.
         # Pobieranie seansów dla podanej daty z bazy danych.
         screenings = self.database.get_screenings_for_date(date) 
+        self.current_screenings = screenings # Zapamiętanie wyświetlanych seansów, aby wybór z listy nie wymagał ponownego zapytania.
         
         if not screenings: # Sprawdzanie, czy lista seansów jest pusta.
             self.screening_list_widget.addItem("Brak seansów w wybranym dniu.") # Dodawanie informacji o braku seansów.
@@ -103,7 +105,8 @@ class ScreeningView(QWidget):
 
         # Dodawanie seansów do listy w GUI.
         for screening in screenings: # Iterowanie przez każdy seans na liście.
-            self.screening_list_widget.addItem(str(screening)) # Dodawanie tekstowej reprezentacji seansu do QListWidget.
+            # Dodawanie tekstowej reprezentacji seansu wraz z liczbą wolnych miejsc (odczyt licznika, bez przeglądania miejsc).
+            self.screening_list_widget.addItem(f"{screening} | Wolne miejsca: {screening.available_count()}")
         
         # Domyślnie żaden seans nie jest wybrany po załadowaniu nowej daty
         self.selected_screening = None 
@@ -115,10 +118,9 @@ class ScreeningView(QWidget):
         Zapamiętuje wybrany seans.
         """
         if current: # Sprawdzanie, czy jakiś element został wybrany (current nie jest None).
-            # Wyszukiwanie wybranego seansu w bazie danych na podstawie jego tekstowej reprezentacji.
-            selected_text = current.text()
-            # Znajdowanie obiektu seansu, którego tekstowa reprezentacja pasuje do wybranego elementu listy.
-            self.selected_screening = next((s for s in self.database.get_screenings_for_date(self.calendar_widget.selectedDate().toPyDate()) if str(s) == selected_text), None)
+            # Pobieranie wybranego seansu z zapamiętanej listy na podstawie numeru wiersza (bez ponownego zapytania do bazy danych).
+            row = self.screening_list_widget.row(current)
+            self.selected_screening = self.current_screenings[row] if 0 <= row < len(self.current_screenings) else None
             self.select_screening_button.setEnabled(self.selected_screening is not None) # Włączanie przycisku, jeśli seans został znaleziony.
         else: # Jeśli żaden element nie jest wybrany (lista pusta lub zaznaczenie usunięte).
             self.selected_screening = None # Resetowanie wybranego seansu.